@@ -0,0 +1,379 @@
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import scipy
+
+from benchmarks.synthetic_tree_generator import SyntheticTreeGenerator
+from helpers.dataframe_beautifier import DataframeBeautifier
+from helpers.memoization_handler import MemoizationHandler
+from helpers.progress_handler import ProgressHandler
+from providers.data_acquisition_provider import DataAcquisitionProvider
+from providers.data_manifest_provider import DataManifestProvider
+from providers.non_parametric_tests_provider import NonParametricTestsProvider
+
+
+class BenchmarkRunner:
+    """
+    Static methods which time the ingest, the cache, every nonparametric test and the beautifier on a synthetic tree.
+
+    The tree is written to a temporary workspace, which is also the working directory while timing, hence the cached
+    instances are written next to it rather than within the project's assets. Every benchmark is preceded by an
+    untimed setup, which discards what it should not reuse (the loaded data, the cache or the memoized results),
+    hence each repetition is timed from the same state.
+
+    Attributes
+    ----------
+        BENCHMARKS                  The benchmarks which can be run, named after the method they time
+        __cache_directory           The directory of the cached instances, relative to the workspace
+
+    Methods
+    -------
+        __discard_cache():
+            Removes the cached instances and discards the loaded data.
+        __ensure_cache():
+            Caches the comparisons if they are not cached yet.
+        __load_comparisons(fast_fetch=True):
+            Loads every slice of the comparisons.
+        __time(setup, function, repeat):
+            Times a function, running its setup before each repetition.
+        __get_benchmarks(dimensions, parameter, alpha, workers, replicates):
+            Lists every benchmark along with its setup and the function it times.
+        get_environment():
+            Describes the interpreter, the libraries and the revision the benchmarks are run with.
+        run(algorithms=17, problems=30, dimensions=None, runs=51, seed=0, directory=None, benchmarks=None, repeat=3,
+            workers=1, alpha=0.05, replicates=1000):
+            Runs the provided benchmarks on a synthetic tree, or on an existing one.
+        main(argv=None):
+            Parses the arguments, runs the benchmarks and writes their results as JSON.
+    """
+
+    BENCHMARKS = ['DataAcquisitionProvider.get_algorithms_raw',
+                  'DataAcquisitionProvider.get_algorithms_cube',
+                  'DataAcquisitionProvider.cache_algorithms_comparisons',
+                  'DataAcquisitionProvider.cache_algorithms_comparisons(up_to_date)',
+                  'DataAcquisitionProvider.get_algorithms_comparisons',
+                  'DataAcquisitionProvider.get_algorithms_comparisons(fast_fetch=False)',
+                  'NonParametricTestsProvider.estimate_best_algorithm',
+                  'NonParametricTestsProvider.get_best_algorithm',
+                  'NonParametricTestsProvider.wilcoxon_test',
+                  'NonParametricTestsProvider.get_wilcoxon_matrix',
+                  'NonParametricTestsProvider.friedman_test',
+                  'NonParametricTestsProvider.get_friedman_rankings',
+                  'NonParametricTestsProvider.get_friedman_resampling',
+                  'NonParametricTestsProvider.friedman_test_resampled',
+                  'NonParametricTestsProvider.get_algorithms_comparisons_wtl',
+                  'NonParametricTestsProvider.get_algorithms_comparisons_wtl_mannwhitneyu',
+                  'NonParametricTestsProvider.get_tournament_slice',
+                  'NonParametricTestsProvider.get_mann_whitney_tournament',
+                  'NonParametricTestsProvider.get_nemenyi_friedman_matrix',
+                  'NonParametricTestsProvider.get_post_hoc_tests',
+                  'DataframeBeautifier.print_console_stream',
+                  'DataframeBeautifier.print_markup_text',
+                  'DataframeBeautifier.write_csv']
+
+    __cache_directory = 'assets/cached_instances'
+
+    @staticmethod
+    def __discard_cache():
+        """
+        Removes the cached instances and discards the loaded data.
+        """
+
+        shutil.rmtree(BenchmarkRunner.__cache_directory, ignore_errors=True)
+        DataAcquisitionProvider.reset()
+
+    @staticmethod
+    def __ensure_cache():
+        """
+        Caches the comparisons if they are not cached yet.
+        """
+
+        DataAcquisitionProvider.cache_algorithms_comparisons()
+
+    @staticmethod
+    def __load_comparisons(fast_fetch=True):
+        """
+        Loads every slice of the comparisons.
+
+        :param bool fast_fetch: Specify whether to read the comparisons from the cache, rather than the raw txt files
+        """
+
+        comparisons = DataAcquisitionProvider.get_algorithms_comparisons(fast_fetch=fast_fetch)
+
+        for dimension in comparisons:
+            for parameter in comparisons[dimension]:
+                comparisons.get_slice(dimension, parameter)
+
+    @staticmethod
+    def __time(setup, function, repeat):
+        """
+        Times a function, running its setup before each repetition.
+
+        Anything printed by the setup or the function is discarded, and the progress of their loops is not printed.
+
+        :param setup: Specify the function run before each repetition, it is not timed
+        :param function: Specify the timed function
+        :param int repeat: Specify the number of repetitions
+        :return: A dictionary of the seconds of each repetition, along with their minimum, median and mean
+        """
+
+        seconds = []
+        quiet = ProgressHandler.is_quiet()
+
+        ProgressHandler.set_quiet()
+
+        try:
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                for _ in range(repeat):
+                    setup()
+
+                    start = time.perf_counter()
+                    function()
+                    seconds.append(time.perf_counter() - start)
+        finally:
+            ProgressHandler.set_quiet(quiet)
+
+        return {'seconds': seconds, 'min': min(seconds), 'median': statistics.median(seconds),
+                'mean': statistics.fmean(seconds)}
+
+    @staticmethod
+    def __get_benchmarks(dimensions, parameter, alpha, workers, replicates):
+        """
+        Lists every benchmark along with its setup and the function it times.
+
+        The tests are timed on the slice of the first dimension (except those over every slice), each from an empty
+        memoization cache, with the comparisons and the runs already loaded.
+
+        :param list dimensions: Specify the dimensions of the tree
+        :param int parameter: Specify the parameter of the timed slice
+        :param float alpha: Specify the level of significance
+        :param int workers: Specify the number of processes of the methods which accept one
+        :param int replicates: Specify the number of resampling replicates
+        :return: A dictionary of benchmark names and their (setup, function) tuples
+        """
+
+        dimension = dimensions[0]
+
+        def load():
+            BenchmarkRunner.__ensure_cache()
+            BenchmarkRunner.__load_comparisons()
+            DataAcquisitionProvider.get_algorithms_cube()
+            MemoizationHandler.clear()
+
+        def get_table():
+            return DataAcquisitionProvider.get_algorithms_comparison(dimension=dimension, parameter=parameter)
+
+        def get_runs():
+            return np.asarray(DataAcquisitionProvider.get_algorithms_cube().get_slice(dimension, parameter))
+
+        slice_arguments = {'dimension': dimension, 'parameter': parameter}
+
+        return {
+            'DataAcquisitionProvider.get_algorithms_raw':
+                (BenchmarkRunner.__discard_cache, DataAcquisitionProvider.get_algorithms_raw),
+            'DataAcquisitionProvider.get_algorithms_cube':
+                (BenchmarkRunner.__discard_cache, DataAcquisitionProvider.get_algorithms_cube),
+            'DataAcquisitionProvider.cache_algorithms_comparisons':
+                (BenchmarkRunner.__discard_cache, DataAcquisitionProvider.cache_algorithms_comparisons),
+            'DataAcquisitionProvider.cache_algorithms_comparisons(up_to_date)':
+                (BenchmarkRunner.__ensure_cache, DataAcquisitionProvider.cache_algorithms_comparisons),
+            'DataAcquisitionProvider.get_algorithms_comparisons':
+                (lambda: (BenchmarkRunner.__ensure_cache(), DataAcquisitionProvider.reset()),
+                 BenchmarkRunner.__load_comparisons),
+            'DataAcquisitionProvider.get_algorithms_comparisons(fast_fetch=False)':
+                (DataAcquisitionProvider.reset, lambda: BenchmarkRunner.__load_comparisons(fast_fetch=False)),
+            'NonParametricTestsProvider.estimate_best_algorithm':
+                (load, lambda: NonParametricTestsProvider.estimate_best_algorithm(**slice_arguments)),
+            'NonParametricTestsProvider.get_best_algorithm':
+                (load, lambda: NonParametricTestsProvider.get_best_algorithm(**slice_arguments)),
+            'NonParametricTestsProvider.wilcoxon_test':
+                (load, lambda: NonParametricTestsProvider.wilcoxon_test(**slice_arguments, alpha=alpha)),
+            'NonParametricTestsProvider.get_wilcoxon_matrix':
+                (load, lambda: NonParametricTestsProvider.get_wilcoxon_matrix(**slice_arguments)),
+            'NonParametricTestsProvider.friedman_test':
+                (load, lambda: NonParametricTestsProvider.friedman_test(**slice_arguments, alpha=alpha)),
+            'NonParametricTestsProvider.get_friedman_rankings':
+                (load, lambda: NonParametricTestsProvider.get_friedman_rankings(dimensions=dimensions)),
+            'NonParametricTestsProvider.get_friedman_resampling':
+                (load, lambda: NonParametricTestsProvider.get_friedman_resampling(**slice_arguments,
+                                                                                  replicates=replicates,
+                                                                                  workers=workers)),
+            'NonParametricTestsProvider.friedman_test_resampled':
+                (load, lambda: NonParametricTestsProvider.friedman_test_resampled(**slice_arguments, alpha=alpha,
+                                                                                  replicates=replicates,
+                                                                                  workers=workers)),
+            'NonParametricTestsProvider.get_algorithms_comparisons_wtl':
+                (load, lambda: NonParametricTestsProvider.get_algorithms_comparisons_wtl(**slice_arguments)),
+            'NonParametricTestsProvider.get_algorithms_comparisons_wtl_mannwhitneyu':
+                (load, lambda: NonParametricTestsProvider.get_algorithms_comparisons_wtl_mannwhitneyu(
+                    **slice_arguments, alpha=alpha)),
+            'NonParametricTestsProvider.get_tournament_slice':
+                (load, lambda: NonParametricTestsProvider.get_tournament_slice(get_runs(), alpha=alpha)),
+            'NonParametricTestsProvider.get_mann_whitney_tournament':
+                (load, lambda: NonParametricTestsProvider.get_mann_whitney_tournament(
+                    dimensions=dimensions, alpha=alpha, workers=workers)),
+            'NonParametricTestsProvider.get_nemenyi_friedman_matrix':
+                (load, lambda: NonParametricTestsProvider.get_nemenyi_friedman_matrix(
+                    dimensions=dimensions, alpha=alpha)),
+            'NonParametricTestsProvider.get_post_hoc_tests':
+                (load, lambda: NonParametricTestsProvider.get_post_hoc_tests(**slice_arguments, alpha=alpha)),
+            'DataframeBeautifier.print_console_stream':
+                (load, lambda: DataframeBeautifier.print_console_stream(get_table())),
+            'DataframeBeautifier.print_markup_text':
+                (load, lambda: DataframeBeautifier.print_markup_text(get_table())),
+            'DataframeBeautifier.write_csv':
+                (load, lambda: DataframeBeautifier.write_csv(get_table(), path=os.devnull)),
+        }
+
+    @staticmethod
+    def get_environment():
+        """
+        Describes the interpreter, the libraries and the revision the benchmarks are run with.
+
+        :return: A dictionary of the versions, the platform, the number of cores and the git revision (None if the
+                 project is not a git checkout)
+        """
+
+        try:
+            revision = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True,
+                                      cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            revision = None
+
+        return {'python': platform.python_version(), 'numpy': np.__version__, 'pandas': pd.__version__,
+                'scipy': scipy.__version__, 'platform': platform.platform(), 'cpu_count': os.cpu_count(),
+                'revision': revision}
+
+    @staticmethod
+    def run(algorithms=17, problems=30, dimensions=None, runs=51, seed=0, directory=None, benchmarks=None, repeat=3,
+            workers=1, alpha=0.05, replicates=1000):
+        """
+        Runs the provided benchmarks on a synthetic tree, or on an existing one.
+
+        The default sizes match the CEC-2014 assets. The loaded data and the working directory are restored once
+        the benchmarks are over, and the workspace is removed.
+
+        :param int algorithms: Specify the number of synthetic algorithms
+        :param int problems: Specify the number of synthetic problems
+        :param list dimensions: Specify the synthetic dimensions, default is 'DataManifestProvider.DIMENSIONS'
+        :param int runs: Specify the number of synthetic runs
+        :param int seed: Specify the seed of the synthetic tree
+        :param str directory: Specify an existing tree of raw txt files to benchmark instead of a synthetic one
+        :param list benchmarks: Specify the desired benchmarks (must be within 'BENCHMARKS'), default is every one
+        :param int repeat: Specify the number of repetitions of each benchmark
+        :param int workers: Specify the number of processes used to read the assets and run the tests
+        :param float alpha: Specify the level of significance
+        :param int replicates: Specify the number of resampling replicates
+        :return: A JSON serializable dictionary of the environment, the dataset and the results of each benchmark
+        """
+
+        dimensions = list(DataManifestProvider.DIMENSIONS if dimensions is None else dimensions)
+        benchmarks = list(BenchmarkRunner.BENCHMARKS if benchmarks is None else benchmarks)
+
+        for benchmark in benchmarks:
+            if benchmark not in BenchmarkRunner.BENCHMARKS:
+                raise ValueError('Invalid benchmark value')
+        if not isinstance(repeat, int) or repeat < 1:
+            raise ValueError('repeat must be a positive integer')
+
+        report = {'environment': BenchmarkRunner.get_environment()}
+
+        current_directory = os.getcwd()
+        raw_directory = DataAcquisitionProvider.get_algorithms_raw_directory()
+
+        # Cached instances are stored relatively to the working directory, hence the workspace becomes the latter
+        with tempfile.TemporaryDirectory(prefix='benchmarks-') as workspace:
+            try:
+                if directory is None:
+                    directory = os.path.join(workspace, 'assets', 'algorithms')
+                    dataset = SyntheticTreeGenerator.generate(directory, algorithms=algorithms, problems=problems,
+                                                              dimensions=dimensions, runs=runs, seed=seed)
+                    dataset.update({'synthetic': True, 'algorithms': algorithms, 'problems': problems,
+                                    'dimensions': dimensions, 'runs': runs, 'seed': seed})
+                else:
+                    directory = os.path.abspath(directory)
+                    paths = [os.path.join(root, name) for root, _, names in os.walk(directory) for name in names]
+                    dataset = {'files': len(paths), 'bytes': sum(os.path.getsize(path) for path in paths),
+                               'synthetic': False, 'directory': directory}
+
+                os.chdir(workspace)
+
+                DataAcquisitionProvider.set_algorithms_raw_directory(directory)
+                DataAcquisitionProvider.set_workers(workers)
+                DataAcquisitionProvider.reset()
+
+                report['dataset'] = dataset
+                report['repeat'] = repeat
+                report['benchmarks'] = {}
+
+                available = BenchmarkRunner.__get_benchmarks(dimensions, DataManifestProvider.PARAMETERS[0], alpha,
+                                                             workers, replicates)
+
+                for benchmark in benchmarks:
+                    print(f'Timing {benchmark}...', file=sys.stderr)
+                    report['benchmarks'][benchmark] = BenchmarkRunner.__time(*available[benchmark], repeat)
+            finally:
+                os.chdir(current_directory)
+
+                DataAcquisitionProvider.set_algorithms_raw_directory(raw_directory)
+                DataAcquisitionProvider.reset()
+
+        return report
+
+    @staticmethod
+    def main(argv=None):
+        """
+        Parses the arguments, runs the benchmarks and writes their results as JSON.
+
+        :param list argv: Specify the arguments, default is the arguments of the process
+        """
+
+        parser = argparse.ArgumentParser(prog='python -m benchmarks.benchmark_runner',
+                                         description='Times the ingest, the cache, every nonparametric test and the '
+                                                     'beautifier on a synthetic tree of raw txt files.')
+        parser.add_argument('--algorithms', type=int, default=17, help='The number of synthetic algorithms')
+        parser.add_argument('--problems', type=int, default=30, help='The number of synthetic problems')
+        parser.add_argument('--dimensions', type=int, nargs='+', default=None, help='The synthetic dimensions')
+        parser.add_argument('--runs', type=int, default=51, help='The number of synthetic runs')
+        parser.add_argument('--seed', type=int, default=0, help='The seed of the synthetic tree')
+        parser.add_argument('--directory', default=None,
+                            help='An existing tree of raw txt files to benchmark instead of a synthetic one')
+        parser.add_argument('--benchmarks', nargs='+', default=None, choices=BenchmarkRunner.BENCHMARKS,
+                            metavar='BENCHMARK', help='The benchmarks to run, default is every one')
+        parser.add_argument('--repeat', type=int, default=3, help='The number of repetitions of each benchmark')
+        parser.add_argument('--workers', type=int, default=1, help='The number of processes')
+        parser.add_argument('--alpha', type=float, default=0.05, help='The level of significance')
+        parser.add_argument('--replicates', type=int, default=1000, help='The number of resampling replicates')
+        parser.add_argument('--output', default=None, help='The JSON file to write, default is the standard output')
+
+        arguments = parser.parse_args(argv)
+
+        try:
+            report = BenchmarkRunner.run(algorithms=arguments.algorithms, problems=arguments.problems,
+                                         dimensions=arguments.dimensions, runs=arguments.runs, seed=arguments.seed,
+                                         directory=arguments.directory, benchmarks=arguments.benchmarks,
+                                         repeat=arguments.repeat, workers=arguments.workers, alpha=arguments.alpha,
+                                         replicates=arguments.replicates)
+        except ValueError as error:
+            parser.error(str(error))
+
+        if arguments.output is None:
+            print(json.dumps(report, indent=4))
+        else:
+            with open(arguments.output, 'w') as f:
+                json.dump(report, f, indent=4)
+
+
+if __name__ == '__main__':
+    BenchmarkRunner.main()
@@ -0,0 +1,105 @@
+import os
+
+import numpy as np
+
+from providers.data_manifest_provider import DataManifestProvider
+
+
+class SyntheticTreeGenerator:
+    """
+    Static methods which write synthetic raw txt trees, laid out as the CEC-2014 assets, at any size.
+
+    Each algorithm gets a skill, each problem a difficulty and each dimension a scale, hence the generated algorithms
+    rank consistently across problems, just as the real ones do, and the errors decrease along the parameters, which
+    stand for the checkpoints of a run.
+
+    Methods
+    -------
+        get_algorithm_names(algorithms):
+            Names the synthetic algorithms.
+        get_runs(rng, skill, difficulty, dimension, runs):
+            Draws the runs of a single algorithm, problem and dimension.
+        generate(directory, algorithms=17, problems=30, dimensions=None, runs=51, seed=0):
+            Writes a synthetic tree of raw txt files, one 'ALGORITHM_PROBLEM_DIMENSION.txt' file per triplet.
+    """
+
+    @staticmethod
+    def get_algorithm_names(algorithms):
+        """
+        Names the synthetic algorithms.
+
+        :param int algorithms: Specify the number of algorithms
+        :return: A list of names, sorted as the algorithm directories are listed
+        """
+
+        return [f'SYN-{index:03d}' for index in range(1, algorithms + 1)]
+
+    @staticmethod
+    def get_runs(rng, skill, difficulty, dimension, runs):
+        """
+        Draws the runs of a single algorithm, problem and dimension.
+
+        :param np.random.Generator rng: Specify the random generator
+        :param float skill: Specify the skill of the algorithm, the higher the smaller its errors
+        :param float difficulty: Specify the difficulty of the problem, as the logarithm of its typical error
+        :param int dimension: Specify the dimension, higher dimensions yield larger errors
+        :param int runs: Specify the number of runs
+        :return: A float array of shape (parameters, runs) of positive errors, decreasing along the parameters
+        """
+
+        parameters = len(DataManifestProvider.PARAMETERS)
+
+        level = difficulty - skill + np.log(dimension / 10.)
+        progress = np.linspace(0., 1., parameters)[:, None]
+
+        return np.exp(level + 0.5 * rng.standard_normal((1, runs)) - 4. * progress
+                      + 0.1 * rng.standard_normal((parameters, runs)))
+
+    @staticmethod
+    def generate(directory, algorithms=17, problems=30, dimensions=None, runs=51, seed=0):
+        """
+        Writes a synthetic tree of raw txt files, one 'ALGORITHM_PROBLEM_DIMENSION.txt' file per triplet.
+
+        Each file holds one row per parameter and one tab-separated column per run, with six significant digits
+        as the real assets. The number of parameters is fixed by 'DataManifestProvider.PARAMETERS'.
+
+        :param str directory: Specify the directory where the algorithm directories are written
+        :param int algorithms: Specify the number of algorithms
+        :param int problems: Specify the number of problems
+        :param list dimensions: Specify the dimensions, default is 'DataManifestProvider.DIMENSIONS'
+        :param int runs: Specify the number of runs per parameter
+        :param int seed: Specify the seed, the same seed always writes the same tree
+        :return: A dictionary of the number of written files and their total size in bytes
+        """
+
+        dimensions = list(DataManifestProvider.DIMENSIONS if dimensions is None else dimensions)
+
+        for name, value in [('algorithms', algorithms), ('problems', problems), ('runs', runs)]:
+            if not isinstance(value, int) or value < 1:
+                raise ValueError(f'{name} must be a positive integer')
+        for dimension in dimensions:
+            if dimension not in DataManifestProvider.DIMENSIONS:
+                raise ValueError('Invalid dimension value')
+
+        rng = np.random.default_rng(seed)
+
+        skills = rng.normal(0., 1., algorithms)
+        difficulties = rng.uniform(0., 10., problems)
+
+        files = 0
+        size = 0
+
+        for algorithm, skill in zip(SyntheticTreeGenerator.get_algorithm_names(algorithms), skills):
+            os.makedirs(f'{directory}/{algorithm}', exist_ok=True)
+
+            for problem, difficulty in enumerate(difficulties, start=1):
+                for dimension in dimensions:
+                    path = f'{directory}/{algorithm}/{algorithm}_{problem}_{dimension}.txt'
+
+                    values = SyntheticTreeGenerator.get_runs(rng, skill, difficulty, dimension, runs)
+                    np.savetxt(path, values, fmt='%g', delimiter='\t')
+
+                    files += 1
+                    size += os.path.getsize(path)
+
+        return {'files': files, 'bytes': size}
@@ -0,0 +1,719 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+
+class CommandLineInterface:
+    """
+    Static methods which expose the analyses as command line subcommands.
+
+    Providers are only imported once a subcommand is run, hence parsing the arguments stays fast, and each subcommand
+    only imports what it needs: the tables never import matplotlib, statsmodels or scikit_posthocs at startup.
+
+    Attributes
+    ----------
+        HEAVY_MODULES               The modules which the table subcommands must not import at startup
+        PLOTS                       The plots which can be drawn by the plot subcommand
+        __startup_script            The script timing the startup of the table subcommands in a fresh interpreter
+
+    Methods
+    -------
+        rank(arguments):
+            Conducts the Friedman test of a single slice, along with the mean rank of each algorithm.
+        wilcoxon(arguments):
+            Conducts the Wilcoxon signed-rank test of each algorithm against a reference one on a single slice.
+        posthoc(arguments):
+            Conducts the post hoc tests of each algorithm against a reference one on a single slice.
+        wtl(arguments):
+            Compares the raw runs of every algorithm with the Mann-Whitney U test, with the w/t/l in the footer.
+        plot(arguments):
+            Shows a single plot, or saves it to a file.
+        cache(arguments):
+            Caches the comparisons, only recomputing the slices whose raw files changed.
+        memory(arguments):
+            Loads the requested stores, then prints the memory each one holds as JSON.
+        serve(arguments):
+            Loads the dataset once, then answers test queries over HTTP until interrupted.
+        startup(arguments):
+            Times the startup of the table subcommands in a fresh interpreter, failing if it exceeds the budget.
+        sweep(arguments):
+            Runs the whole analysis over every requested dimension and parameter.
+        register(arguments):
+            Splices a newly added algorithm into the cached comparisons, then ranks it on every slice.
+        render(arguments):
+            Saves every plot of every requested dimension and parameter to files, skipping the unchanged ones.
+        get_parser():
+            Builds the parser of every subcommand.
+        __dimension(value):
+            Parses a dimension argument.
+        __parameter(value):
+            Parses a parameter argument.
+        __alpha(value):
+            Parses a level of significance argument.
+        __positive_integer(value):
+            Parses an argument which must be a positive integer.
+        __check_algorithm(arguments):
+            Exits if the reference algorithm holds no value within the requested slice.
+        __print_table(output_format, dataframe, **options):
+            Prints a table in the requested format.
+        __get_slice_parser():
+            Builds the parser of the options shared by the subcommands analyzing a single slice.
+        main(argv=None):
+            Parses the arguments and runs the requested subcommand, recording its timing spans if requested.
+
+    The arguments are validated while they are parsed, hence any exception raised once a subcommand runs is a failure
+    of the analysis itself, and propagates along with its traceback.
+    """
+
+    HEAVY_MODULES = ['matplotlib', 'statsmodels', 'scikit_posthocs', 'seaborn']
+
+    PLOTS = ['normality_histogram', 'normality_qq', 'comparison_bar', 'comparison_box', 'performance_fluctuation',
+             'best_algorithms', 'critical_difference']
+
+    __startup_script = '''
+import json
+import sys
+import time
+
+start = time.perf_counter()
+
+from cli import CommandLineInterface
+CommandLineInterface.get_parser()
+
+parsed = time.perf_counter()
+
+import providers.non_parametric_tests_provider
+from helpers.dataframe_beautifier import DataframeBeautifier
+
+imported = time.perf_counter()
+
+print(json.dumps({'parser': parsed - start,
+                  'tables': imported - parsed,
+                  'heavy_modules': [module for module in CommandLineInterface.HEAVY_MODULES if module in sys.modules]}))
+'''
+
+    @staticmethod
+    def __print_table(output_format, dataframe, **options):
+        """
+        Prints a table in the requested format.
+
+        :param str output_format: Specify the format, either 'console', 'markdown' or 'csv'
+        :param pd.DataFrame dataframe: Specify the table
+        :param options: Specify the formatting options of DataframeBeautifier
+        """
+
+        from helpers.dataframe_beautifier import DataframeBeautifier
+
+        if output_format == 'markdown':
+            DataframeBeautifier.print_markup_text(dataframe, **options)
+        elif output_format == 'csv':
+            DataframeBeautifier.write_csv(dataframe, **options)
+        else:
+            DataframeBeautifier.print_console_stream(dataframe, **options)
+
+    @staticmethod
+    def rank(arguments):
+        """
+        Conducts the Friedman test of a single slice, along with the mean rank of each algorithm.
+
+        :param argparse.Namespace arguments: The parsed arguments
+        """
+
+        from providers.data_acquisition_provider import DataAcquisitionProvider
+        from providers.non_parametric_tests_provider import NonParametricTestsProvider
+
+        if arguments.directory is not None:
+            DataAcquisitionProvider.set_algorithms_raw_directory(arguments.directory)
+
+        df = NonParametricTestsProvider.friedman_test(dimension=arguments.dimension,
+                                                      parameter=arguments.parameter,
+                                                      alpha=arguments.alpha).to_frame()
+
+        CommandLineInterface.__print_table(arguments.format, df.T,
+                                           apply_scientific_notation_to_all_columns=False,
+                                           floating_scientific_notation_columns=['P-Value', 'Statistic'],
+                                           transpose=True)
+
+    @staticmethod
+    def wilcoxon(arguments):
+        """
+        Conducts the Wilcoxon signed-rank test of each algorithm against a reference one on a single slice.
+
+        :param argparse.Namespace arguments: The parsed arguments
+        """
+
+        from providers.data_acquisition_provider import DataAcquisitionProvider
+        from providers.non_parametric_tests_provider import NonParametricTestsProvider
+
+        if arguments.directory is not None:
+            DataAcquisitionProvider.set_algorithms_raw_directory(arguments.directory)
+
+        CommandLineInterface.__check_algorithm(arguments)
+
+        df = NonParametricTestsProvider.wilcoxon_test(dimension=arguments.dimension,
+                                                      parameter=arguments.parameter,
+                                                      algorithm_to_compare=arguments.algorithm,
+                                                      alpha=arguments.alpha)
+
+        CommandLineInterface.__print_table(arguments.format, df,
+                                           apply_scientific_notation_to_all_columns=False,
+                                           floating_scientific_notation_columns=['P-Value'])
+
+    @staticmethod
+    def posthoc(arguments):
+        """
+        Conducts the post hoc tests of each algorithm against a reference one on a single slice.
+
+        :param argparse.Namespace arguments: The parsed arguments
+        """
+
+        from providers.data_acquisition_provider import DataAcquisitionProvider
+        from providers.non_parametric_tests_provider import NonParametricTestsProvider
+
+        if arguments.directory is not None:
+            DataAcquisitionProvider.set_algorithms_raw_directory(arguments.directory)
+
+        CommandLineInterface.__check_algorithm(arguments)
+
+        df = NonParametricTestsProvider.get_post_hoc_tests(dimension=arguments.dimension,
+                                                           parameter=arguments.parameter,
+                                                           algorithm_to_compare=arguments.algorithm,
+                                                           alpha=arguments.alpha)
+
+        CommandLineInterface.__print_table(arguments.format, df)
+
+    @staticmethod
+    def wtl(arguments):
+        """
+        Compares the raw runs of every algorithm with the Mann-Whitney U test, with the w/t/l in the footer.
+
+        :param argparse.Namespace arguments: The parsed arguments
+        """
+
+        from providers.data_acquisition_provider import DataAcquisitionProvider
+        from providers.non_parametric_tests_provider import NonParametricTestsProvider
+
+        if arguments.directory is not None:
+            DataAcquisitionProvider.set_algorithms_raw_directory(arguments.directory)
+
+        df = NonParametricTestsProvider.get_algorithms_comparisons_wtl_mannwhitneyu(dimension=arguments.dimension,
+                                                                                    parameter=arguments.parameter,
+                                                                                    alpha=arguments.alpha)
+
+        CommandLineInterface.__print_table(arguments.format, df)
+
+    @staticmethod
+    def plot(arguments):
+        """
+        Shows a single plot, or saves it to a file.
+
+        :param argparse.Namespace arguments: The parsed arguments
+        """
+
+        if arguments.output is not None:
+            import matplotlib
+            matplotlib.use('Agg')
+
+        from providers.data_acquisition_provider import DataAcquisitionProvider
+        from providers.plots_provider import PlotsProvider
+
+        if arguments.directory is not None:
+            DataAcquisitionProvider.set_algorithms_raw_directory(arguments.directory)
+
+        if arguments.plot in ['normality_histogram', 'normality_qq']:
+            CommandLineInterface.__check_algorithm(arguments)
+
+        PlotsProvider.set_output_directory(arguments.output)
+
+        if arguments.plot == 'normality_histogram':
+            PlotsProvider.plot_algorithm_normality_histogram(dimension=arguments.dimension,
+                                                             parameter=arguments.parameter,
+                                                             algorithm=arguments.algorithm,
+                                                             alpha=arguments.alpha)
+        elif arguments.plot == 'normality_qq':
+            PlotsProvider.plot_algorithm_normality_qq(dimension=arguments.dimension,
+                                                      parameter=arguments.parameter,
+                                                      algorithm=arguments.algorithm,
+                                                      alpha=arguments.alpha)
+        elif arguments.plot == 'comparison_bar':
+            PlotsProvider.plot_algorithm_comparison_bar(dimension=arguments.dimension, parameter=arguments.parameter)
+        elif arguments.plot == 'comparison_box':
+            PlotsProvider.plot_algorithm_comparison_box(dimension=arguments.dimension, parameter=arguments.parameter)
+        elif arguments.plot == 'performance_fluctuation':
+            PlotsProvider.plot_algorithm_performance_fluctuation(parameter=arguments.parameter,
+                                                                 normalize=not arguments.raw)
+        elif arguments.plot == 'best_algorithms':
+            PlotsProvider.plot_best_algorithms(estimate=arguments.estimate)
+        elif arguments.plot == 'critical_difference':
+            PlotsProvider.plot_critical_difference(dimension=arguments.dimension,
+                                                   parameter=arguments.parameter,
+                                                   alpha=arguments.alpha)
+
+        for path in PlotsProvider.pop_saved_files():
+            print(f'Saved {path}')
+
+    @staticmethod
+    def cache(arguments):
+        """
+        Caches the comparisons, only recomputing the slices whose raw files changed.
+
+        :param argparse.Namespace arguments: The parsed arguments
+        """
+
+        from providers.cache_manifest_provider import CacheManifestProvider
+        from providers.data_acquisition_provider import DataAcquisitionProvider
+
+        if arguments.directory is not None:
+            DataAcquisitionProvider.set_algorithms_raw_directory(arguments.directory)
+
+        DataAcquisitionProvider.set_workers(arguments.workers)
+        DataAcquisitionProvider.set_streaming(arguments.streaming)
+        DataAcquisitionProvider.set_compact(arguments.compact or arguments.lossy, lossless=not arguments.lossy)
+        CacheManifestProvider.set_use_content_hash(arguments.content_hash)
+
+        DataAcquisitionProvider.cache_algorithms_comparisons()
+
+    @staticmethod
+    def memory(arguments):
+        """
+        Loads the requested stores, then prints the memory each one holds as JSON.
+
+        :param argparse.Namespace arguments: The parsed arguments
+        """
+
+        from providers.data_acquisition_provider import DataAcquisitionProvider
+
+        if arguments.directory is not None:
+            DataAcquisitionProvider.set_algorithms_raw_directory(arguments.directory)
+
+        DataAcquisitionProvider.set_workers(arguments.workers)
+        DataAcquisitionProvider.set_compact(arguments.compact or arguments.lossy, lossless=not arguments.lossy)
+
+        if 'raw' in arguments.stores:
+            DataAcquisitionProvider.get_algorithms_raw()
+        if 'cube' in arguments.stores:
+            DataAcquisitionProvider.get_algorithms_cube()
+        if 'comparisons' in arguments.stores:
+            comparisons = DataAcquisitionProvider.get_algorithms_comparisons()
+            for dimension in comparisons:
+                for parameter in comparisons[dimension]:
+                    comparisons.get_slice(dimension, parameter)
+
+        print(json.dumps(DataAcquisitionProvider.get_memory_report(), indent=4))
+
+    @staticmethod
+    def serve(arguments):
+        """
+        Loads the dataset once, then answers test queries over HTTP until interrupted.
+
+        :param argparse.Namespace arguments: The parsed arguments
+        """
+
+        from providers.data_acquisition_provider import DataAcquisitionProvider
+        from providers.query_provider import QueryProvider
+
+        if arguments.directory is not None:
+            DataAcquisitionProvider.set_algorithms_raw_directory(arguments.directory)
+
+        QueryProvider.serve(host=arguments.host,
+                            port=arguments.port,
+                            socket_path=arguments.socket,
+                            warm_runs=arguments.warm_runs,
+                            verbose=arguments.verbose)
+
+    @staticmethod
+    def startup(arguments):
+        """
+        Times the startup of the table subcommands in a fresh interpreter, failing if it exceeds the budget.
+
+        Startup is the time taken to build the parser, then to import the providers and helpers the table
+        subcommands (rank, wilcoxon, posthoc and wtl) need, before any data is read. The best of several attempts is
+        kept, since the first one also pays for cold file system caches.
+
+        :param argparse.Namespace arguments: The parsed arguments
+        """
+
+        timings = []
+
+        for _ in range(arguments.repeat):
+            output = subprocess.run([sys.executable, '-c', CommandLineInterface.__startup_script],
+                                    cwd=os.path.dirname(os.path.abspath(__file__)),
+                                    capture_output=True, text=True, check=True).stdout
+
+            timings.append(json.loads(output.strip().splitlines()[-1]))
+
+        best = min(timings, key=lambda timing: timing['parser'] + timing['tables'])
+        total = best['parser'] + best['tables']
+
+        print(f'Building the parser: {best["parser"]:.3f} second(s)')
+        print(f'Importing the tables: {best["tables"]:.3f} second(s)')
+        print(f'Startup: {total:.3f} second(s), budget: {arguments.budget:.3f} second(s)')
+
+        if best['heavy_modules']:
+            sys.exit(f'The table subcommands import {", ".join(best["heavy_modules"])} at startup')
+        if total > arguments.budget:
+            sys.exit('Startup exceeds its budget')
+
+    @staticmethod
+    def sweep(arguments):
+        """
+        Runs the whole analysis over every requested dimension and parameter.
+
+        :param argparse.Namespace arguments: The parsed arguments
+        """
+
+        from providers.data_acquisition_provider import DataAcquisitionProvider
+        from providers.sweep_provider import SweepProvider
+
+        if arguments.directory is not None:
+            DataAcquisitionProvider.set_algorithms_raw_directory(arguments.directory)
+
+        results = SweepProvider.sweep(dimensions=arguments.dimensions,
+                                      parameters=arguments.parameters,
+                                      analyses=arguments.analyses,
+                                      alpha=arguments.alpha,
+                                      workers=arguments.workers,
+                                      chunk_size=arguments.chunk_size)
+
+        results.save(arguments.output)
+
+        print(f'Saved {", ".join(results.analyses)} to {arguments.output}')
+
+    @staticmethod
+    def register(arguments):
+        """
+        Splices a newly added algorithm into the cached comparisons, then ranks it on every slice.
+
+        :param argparse.Namespace arguments: The parsed arguments
+        """
+
+        from providers.data_acquisition_provider import DataAcquisitionProvider
+        from providers.non_parametric_tests_provider import NonParametricTestsProvider
+
+        if arguments.directory is not None:
+            DataAcquisitionProvider.set_algorithms_raw_directory(arguments.directory)
+
+        directory = DataAcquisitionProvider.get_algorithms_raw_directory()
+
+        if not os.path.isdir(f'{directory}/{arguments.algorithm}'):
+            sys.exit(f'No algorithm directory {arguments.algorithm!r} within {directory}')
+
+        DataAcquisitionProvider.set_workers(arguments.workers)
+        DataAcquisitionProvider.set_streaming(arguments.streaming)
+
+        DataAcquisitionProvider.register_algorithm(arguments.algorithm)
+
+        mean_ranks = NonParametricTestsProvider.get_friedman_rankings().to_frame()
+
+        if arguments.algorithm in mean_ranks:
+            print(f'Friedman mean rank of {arguments.algorithm}:')
+            print(mean_ranks[arguments.algorithm].unstack(level=0))
+
+    @staticmethod
+    def render(arguments):
+        """
+        Saves every plot of every requested dimension and parameter to files, skipping the unchanged ones.
+
+        :param argparse.Namespace arguments: The parsed arguments
+        """
+
+        from providers.data_acquisition_provider import DataAcquisitionProvider
+        from providers.render_provider import RenderProvider
+
+        if arguments.directory is not None:
+            DataAcquisitionProvider.set_algorithms_raw_directory(arguments.directory)
+
+        saved_files = RenderProvider.render(output_directory=arguments.output,
+                                            dimensions=arguments.dimensions,
+                                            parameters=arguments.parameters,
+                                            plots=arguments.plots,
+                                            alpha=arguments.alpha,
+                                            workers=arguments.workers,
+                                            chunk_size=arguments.chunk_size,
+                                            force=arguments.force)
+
+        print(f'Saved {len(saved_files)} figures to {arguments.output}')
+
+    @staticmethod
+    def get_parser():
+        """
+        Builds the parser of every subcommand.
+
+        :return: An argparse.ArgumentParser
+        """
+
+        parser = argparse.ArgumentParser(description='Compares algorithms with nonparametric tests.')
+        parser.add_argument('--quiet', action='store_true', help='Do not print the progress of long loops.')
+        parser.add_argument('--trace', default=None,
+                            help='File where the timing spans of the providers are written, default records none.')
+        parser.add_argument('--trace-format', choices=['json', 'folded'], default='json',
+                            help='Format of the spans, JSON or folded stacks for flame graph tools.')
+        parser.add_argument('--trace-memory', action='store_true',
+                            help='Record the traced memory of each span as well, which slows down allocations.')
+        subparsers = parser.add_subparsers(dest='command', required=True)
+        slice_parser = CommandLineInterface.__get_slice_parser()
+
+        rank = subparsers.add_parser('rank', parents=[slice_parser],
+                                     help='Conduct the Friedman test, along with the mean rank of each algorithm.')
+        rank.set_defaults(handler=CommandLineInterface.rank)
+
+        wilcoxon = subparsers.add_parser('wilcoxon', parents=[slice_parser],
+                                         help='Conduct the Wilcoxon signed-rank test against a reference algorithm.')
+        wilcoxon.add_argument('--algorithm', default='', help='Reference algorithm, default is the best algorithm.')
+        wilcoxon.set_defaults(handler=CommandLineInterface.wilcoxon)
+
+        posthoc = subparsers.add_parser('posthoc', parents=[slice_parser],
+                                        help='Conduct the post hoc tests against a reference algorithm.')
+        posthoc.add_argument('--algorithm', default='', help='Reference algorithm, default is the best algorithm.')
+        posthoc.set_defaults(handler=CommandLineInterface.posthoc)
+
+        wtl = subparsers.add_parser('wtl', parents=[slice_parser],
+                                    help='Compare the raw runs with the Mann-Whitney U test, with the w/t/l.')
+        wtl.set_defaults(handler=CommandLineInterface.wtl)
+
+        plot = subparsers.add_parser('plot', parents=[slice_parser], help='Show a single plot, or save it to a file.')
+        plot.add_argument('plot', choices=CommandLineInterface.PLOTS, help='Plot to draw.')
+        plot.add_argument('--algorithm', default='',
+                          help='Algorithm of the normality plots, default is the best algorithm.')
+        plot.add_argument('--raw', action='store_true', help='Do not normalize the performance fluctuation.')
+        plot.add_argument('--estimate', action='store_true',
+                          help='Identify the best algorithms by their raw mean rather than by ranking.')
+        plot.add_argument('--output', default=None,
+                          help='Directory where the figure is saved, default shows it instead.')
+        plot.set_defaults(handler=CommandLineInterface.plot)
+
+        cache = subparsers.add_parser('cache', help='Cache the comparisons, only recomputing the changed slices.')
+        cache.add_argument('--directory', default=None, help='Directory from where to read the raw assets.')
+        cache.add_argument('--workers', type=CommandLineInterface.__positive_integer, default=1,
+                           help='Number of processes reading the raw files, 1 reads serially.')
+        cache.add_argument('--streaming', action='store_true',
+                           help='Keep only the running mean and standard deviation of each raw file.')
+        cache.add_argument('--content-hash', action='store_true',
+                           help='Fingerprint the raw files by their content instead of their size and mtime.')
+        cache.add_argument('--compact', action='store_true',
+                           help='Store the runs of the snapshot as float32 if no significant digit is lost.')
+        cache.add_argument('--lossy', action='store_true',
+                           help='Store the runs of the snapshot as float32, rounding them.')
+        cache.set_defaults(handler=CommandLineInterface.cache)
+
+        memory = subparsers.add_parser('memory', help='Load the requested stores and report the memory they hold.')
+        memory.add_argument('--stores', nargs='+', choices=['raw', 'cube', 'comparisons'], default=['cube'],
+                            help='Stores to load, default is the run cube.')
+        memory.add_argument('--compact', action='store_true',
+                            help='Store the runs as float32 where no significant digit is lost.')
+        memory.add_argument('--lossy', action='store_true',
+                            help='Store every run within the float32 range as float32, rounding it.')
+        memory.add_argument('--directory', default=None, help='Directory from where to read the raw assets.')
+        memory.add_argument('--workers', type=CommandLineInterface.__positive_integer, default=1,
+                            help='Number of processes reading the raw files, 1 reads serially.')
+        memory.set_defaults(handler=CommandLineInterface.memory)
+
+        serve = subparsers.add_parser('serve', help='Keep the dataset loaded and answer test queries over HTTP.')
+        serve.add_argument('--host', default='127.0.0.1', help='Address to listen on.')
+        serve.add_argument('--port', type=int, default=8000, help='TCP port to listen on.')
+        serve.add_argument('--socket', default=None, help='Path of a Unix socket to listen on instead of a TCP port.')
+        serve.add_argument('--warm-runs', action='store_true',
+                           help='Load the raw runs before the first query, which the wtl query needs.')
+        serve.add_argument('--verbose', action='store_true', help='Log each request.')
+        serve.add_argument('--directory', default=None, help='Directory from where to read the raw assets.')
+        serve.set_defaults(handler=CommandLineInterface.serve)
+
+        startup = subparsers.add_parser('startup', help='Time the startup of the table subcommands against a budget.')
+        startup.add_argument('--budget', type=float, default=1.5, help='Startup budget, in seconds.')
+        startup.add_argument('--repeat', type=CommandLineInterface.__positive_integer, default=3,
+                             help='Number of attempts, the best one is kept.')
+        startup.set_defaults(handler=CommandLineInterface.startup)
+
+        sweep = subparsers.add_parser('sweep', help='Run the whole analysis over every dimension and parameter.')
+        sweep.add_argument('--dimensions', type=CommandLineInterface.__dimension, nargs='+',
+                           help='Dimensions to sweep, default is all of them.')
+        sweep.add_argument('--parameters', type=CommandLineInterface.__parameter, nargs='+',
+                           help='Parameters to sweep, default is all of them.')
+        sweep.add_argument('--analyses', nargs='+',
+                           choices=['best', 'friedman', 'wilcoxon', 'post_hoc', 'wtl_mannwhitneyu'],
+                           help='Analyses to run on each slice, default is all of them.')
+        sweep.add_argument('--alpha', type=CommandLineInterface.__alpha, default=0.05, help='Level of significance.')
+        sweep.add_argument('--workers', type=CommandLineInterface.__positive_integer, default=None,
+                           help='Number of processes, default uses every available core, 1 runs serially.')
+        sweep.add_argument('--chunk-size', type=CommandLineInterface.__positive_integer, default=1,
+                           help='Number of slices handed to a worker at once.')
+        sweep.add_argument('--directory', default=None, help='Directory from where to read the raw assets.')
+        sweep.add_argument('--output', default='sweep', help='Directory where each analysis is saved as a CSV file.')
+        sweep.set_defaults(handler=CommandLineInterface.sweep)
+
+        register = subparsers.add_parser('register', help='Splice a newly added algorithm into the cached comparisons.')
+        register.add_argument('algorithm', help='Name of the algorithm directory within the raw assets.')
+        register.add_argument('--directory', default=None, help='Directory from where to read the raw assets.')
+        register.add_argument('--workers', type=CommandLineInterface.__positive_integer, default=1,
+                              help='Number of processes reading the raw files, 1 reads serially.')
+        register.add_argument('--streaming', action='store_true',
+                              help='Keep only the running mean and standard deviation of each raw file.')
+        register.set_defaults(handler=CommandLineInterface.register)
+
+        render = subparsers.add_parser('render', help='Save every plot of every dimension and parameter to files.')
+        render.add_argument('--dimensions', type=CommandLineInterface.__dimension, nargs='+',
+                            help='Dimensions to render, default is all of them.')
+        render.add_argument('--parameters', type=CommandLineInterface.__parameter, nargs='+',
+                            help='Parameters to render, default is all of them.')
+        render.add_argument('--plots', nargs='+',
+                            choices=CommandLineInterface.PLOTS,
+                            help='Plots to render, default is all of them.')
+        render.add_argument('--alpha', type=CommandLineInterface.__alpha, default=0.05, help='Level of significance.')
+        render.add_argument('--workers', type=CommandLineInterface.__positive_integer, default=None,
+                            help='Number of processes, default uses every available core, 1 runs serially.')
+        render.add_argument('--chunk-size', type=CommandLineInterface.__positive_integer, default=1,
+                            help='Number of plots handed to a worker at once.')
+        render.add_argument('--force', action='store_true', help='Redraw every plot, even if its data did not change.')
+        render.add_argument('--directory', default=None, help='Directory from where to read the raw assets.')
+        render.add_argument('--output', default='plots', help='Directory where the figures are saved.')
+        render.set_defaults(handler=CommandLineInterface.render)
+
+        return parser
+
+    @staticmethod
+    def __dimension(value):
+        """
+        Parses a dimension argument.
+
+        :param str value: The argument
+        :return: The dimension, within 'DataManifestProvider.DIMENSIONS'
+        """
+
+        from providers.data_manifest_provider import DataManifestProvider
+
+        dimension = CommandLineInterface.__positive_integer(value)
+
+        if dimension not in DataManifestProvider.DIMENSIONS:
+            raise argparse.ArgumentTypeError(f'invalid dimension {value!r}, choose from '
+                                             f'{", ".join(map(str, DataManifestProvider.DIMENSIONS))}')
+
+        return dimension
+
+    @staticmethod
+    def __parameter(value):
+        """
+        Parses a parameter argument.
+
+        :param str value: The argument
+        :return: The parameter, within 'DataManifestProvider.PARAMETERS'
+        """
+
+        from providers.data_manifest_provider import DataManifestProvider
+
+        try:
+            parameter = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f'invalid parameter {value!r}, must be an integer')
+
+        if parameter not in DataManifestProvider.PARAMETERS:
+            raise argparse.ArgumentTypeError(f'invalid parameter {value!r}, choose from '
+                                             f'{min(DataManifestProvider.PARAMETERS)} to '
+                                             f'{max(DataManifestProvider.PARAMETERS)}')
+
+        return parameter
+
+    @staticmethod
+    def __alpha(value):
+        """
+        Parses a level of significance argument.
+
+        :param str value: The argument
+        :return: The level of significance, strictly between 0 and 1
+        """
+
+        try:
+            alpha = float(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f'invalid level of significance {value!r}, must be a number')
+
+        if not 0 < alpha < 1:
+            raise argparse.ArgumentTypeError(f'invalid level of significance {value!r}, must be between 0 and 1')
+
+        return alpha
+
+    @staticmethod
+    def __positive_integer(value):
+        """
+        Parses an argument which must be a positive integer.
+
+        :param str value: The argument
+        :return: The integer
+        """
+
+        try:
+            integer = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f'invalid value {value!r}, must be a positive integer')
+
+        if integer < 1:
+            raise argparse.ArgumentTypeError(f'invalid value {value!r}, must be a positive integer')
+
+        return integer
+
+    @staticmethod
+    def __check_algorithm(arguments):
+        """
+        Exits if the reference algorithm holds no value within the requested slice.
+
+        :param argparse.Namespace arguments: The parsed arguments, the default (empty) algorithm is always valid
+        """
+
+        from providers.data_acquisition_provider import DataAcquisitionProvider
+
+        if arguments.algorithm and arguments.algorithm not in \
+                DataAcquisitionProvider.get_algorithms_means(dimension=arguments.dimension,
+                                                             parameter=arguments.parameter):
+            sys.exit(f'Unknown algorithm {arguments.algorithm!r} for dimension {arguments.dimension} '
+                     f'and parameter {arguments.parameter}')
+
+    @staticmethod
+    def __get_slice_parser():
+        """
+        Builds the parser of the options shared by the subcommands analyzing a single slice.
+
+        :return: An argparse.ArgumentParser, to be passed as a parent parser
+        """
+
+        parser = argparse.ArgumentParser(add_help=False)
+        parser.add_argument('--dimension', type=CommandLineInterface.__dimension, default=10,
+                            help='Dimension of the slice.')
+        parser.add_argument('--parameter', type=CommandLineInterface.__parameter, default=0,
+                            help='Parameter of the slice.')
+        parser.add_argument('--alpha', type=CommandLineInterface.__alpha, default=0.05, help='Level of significance.')
+        parser.add_argument('--directory', default=None, help='Directory from where to read the raw assets.')
+        parser.add_argument('--format', choices=['console', 'markdown', 'csv'], default='console',
+                            help='Format of the printed table.')
+
+        return parser
+
+    @staticmethod
+    def main(argv=None):
+        """
+        Parses the arguments and runs the requested subcommand, recording its timing spans if requested.
+
+        :param list argv: Specify the arguments, default is the command line arguments
+        """
+
+        parser = CommandLineInterface.get_parser()
+        arguments = parser.parse_args(argv)
+
+        if arguments.quiet:
+            from helpers.progress_handler import ProgressHandler
+            ProgressHandler.set_quiet()
+
+        if arguments.trace is not None:
+            from helpers.instrumentation_handler import InstrumentationHandler
+            InstrumentationHandler.enable(trace_memory=arguments.trace_memory)
+
+        try:
+            arguments.handler(arguments)
+        finally:
+            if arguments.trace is not None:
+                InstrumentationHandler.disable()
+                InstrumentationHandler.dump(arguments.trace, output_format=arguments.trace_format)
+
+
+if __name__ == '__main__':
+    CommandLineInterface.main(sys.argv[1:])
@@ -1,3 +1,8 @@
+import csv
+import sys
+
+import numpy as np
+import pandas as pd
 from tabulate import tabulate
 
 
@@ -5,16 +10,23 @@ class DataframeBeautifier:
     """
     Static methods for beautifying the output of the dataframe.
 
+    Each column is formatted at once: the omitted symbols are split off with column-wide string operations, and the
+    numbers left are parsed and formatted in bulk. The formatted columns are streamed to the output row by row, rather
+    than gathered in a second dataframe.
+
     Attributes
     ----------
         __omitted_symbols           Specify the symbols which are postpended to floating point numbers
+        __numeric_types             The inferred types of object columns which only hold numbers
 
     Methods
     -------
-        __is_number(s):
-            Checks if the provided string is a number.
-        __convert_to_float(s, is_scientific=True, max_digits=4):
-            Converts the string to a formatted value.
+        __split_numbers(values):
+            Splits the omitted symbols off the cells of a column, and parses the numbers left.
+        __format_numbers(numbers, is_scientific=True, max_digits=4):
+            Formats an array of numbers.
+        __format_column(values, scientific, max_digits=4):
+            Formats the numeric cells of a column, keeping their omitted symbol, and leaves the others as they are.
         __apply_base_operations(dataframe, apply_scientific_notation_to_all_columns=True,
                                     floating_scientific_notation_columns=None,
                                     floating_scientific_notation_rows=None,
@@ -25,62 +37,141 @@ class DataframeBeautifier:
             Beautifying the output of the dataframe for the console stream.
         print_markup_text(dataframe):
             Beautifying the output of the dataframe for markup languages (specifically GitHub readme file).
+        write_csv(dataframe, path=None):
+            Beautifying the output of the dataframe into a CSV file, one chunk of rows at a time.
     """
 
     __omitted_symbols = ['(X)', '(✓)', '(w)', '(t)', '(l)']
+    __numeric_types = ['floating', 'integer', 'mixed-integer-float', 'boolean']
 
     @staticmethod
-    def __is_number(s):
+    def __split_numbers(values):
         """
-        Checks if the provided string is a number.
+        Splits the omitted symbols off the cells of a column, and parses the numbers left.
 
-        :param str s: The string value to be checked
-        :return: Whether the string is numeric or not
+        A cell is a number if it is a float or an integer, or a string which is a number once every omitted symbol is
+        removed from it, in which case the first omitted symbol it holds is kept as its suffix.
+
+        :param pd.Series values: Specify the column
+        :return: A tuple of a float64 array of the numbers (NaN for the other cells), a boolean array marking the
+                 numbers, and an object array of their suffixes
         """
 
-        if isinstance(s, float) or isinstance(s, int):
-            return True
+        suffixes = np.full(len(values), '', dtype=object)
 
-        try:
-            for symbol in DataframeBeautifier.__omitted_symbols:
-                s = s.replace(symbol, '')
+        if pd.api.types.is_numeric_dtype(values.dtype):
+            return values.to_numpy(dtype=np.float64, na_value=np.nan), np.ones(len(values), dtype=bool), suffixes
+
+        cells = values.to_numpy(dtype=object)
+        numbers = np.full(len(cells), np.nan)
+        inferred_type = pd.api.types.infer_dtype(cells, skipna=False)
+
+        if inferred_type in DataframeBeautifier.__numeric_types:
+            return cells.astype(np.float64), np.ones(len(cells), dtype=bool), suffixes
+
+        if inferred_type == 'string':
+            is_real = np.zeros(len(cells), dtype=bool)
+            is_string = np.ones(len(cells), dtype=bool)
+        else:
+            is_real = np.array([isinstance(cell, (float, int)) for cell in cells], dtype=bool)
+            is_string = np.array([isinstance(cell, str) for cell in cells], dtype=bool)
+
+        is_number = is_real.copy()
+        numbers[is_real] = cells[is_real].astype(np.float64)
+
+        if not is_string.any():
+            return numbers, is_number, suffixes
+
+        strings = cells[is_string].tolist()
+
+        # The strings are joined by a character none of them holds, hence each symbol is searched and removed from
+        # the whole column with a single call
+        text = ''.join(strings)
+        separator = next(character for character in map(chr, range(1, 32)) if character not in text)
+
+        joined = separator.join(strings)
+        stripped = joined
+        lengths = np.fromiter(map(len, strings), dtype=np.int64, count=len(strings))
+        string_suffixes = np.full(len(strings), '', dtype=object)
+
+        for symbol in DataframeBeautifier.__omitted_symbols:
+            if symbol not in joined:
+                continue
+
+            # A string holds the symbol if removing it shortens the string
+            found = np.fromiter(map(len, joined.replace(symbol, '').split(separator)),
+                                dtype=np.int64, count=len(strings)) < lengths
+            string_suffixes[found & (string_suffixes == '')] = ' ' + symbol
+            stripped = stripped.replace(symbol, '')
+
+        stripped = np.array(stripped.split(separator), dtype=object)
 
-            float(s)
-            return True
+        # Blank strings are never numbers, such as a hypothesis column only holding symbols
+        candidates = np.flatnonzero(np.fromiter(map(len, map(str.strip, stripped)), dtype=np.int64,
+                                                count=len(stripped)) > 0)
+        stripped = stripped[candidates]
+
+        try:
+            parsed = stripped.astype(np.float64)
+            is_parsed = np.ones(len(candidates), dtype=bool)
         except ValueError:
-            return False
+            # Some strings are not numbers, hence they are told apart one at a time
+            parsed = np.full(len(candidates), np.nan)
+            is_parsed = np.zeros(len(candidates), dtype=bool)
+
+            for position, string in enumerate(stripped):
+                try:
+                    parsed[position] = float(string)
+                    is_parsed[position] = True
+                except ValueError:
+                    pass
+
+        positions = np.flatnonzero(is_string)[candidates[is_parsed]]
+        numbers[positions] = parsed[is_parsed]
+        is_number[positions] = True
+        suffixes[positions] = string_suffixes[candidates[is_parsed]]
+
+        return numbers, is_number, suffixes
 
     @staticmethod
-    def __convert_to_float(s, is_scientific=True, max_digits=4):
+    def __format_numbers(numbers, is_scientific=True, max_digits=4):
         """
-        Converts the string to a formatted value.
+        Formats an array of numbers.
 
-        :param str s: The string value to be checked
-        :param bool is_scientific: Formats the number to scientific notation or not
+        :param np.ndarray numbers: Specify the numbers
+        :param bool is_scientific: Formats the numbers to scientific notation or not
         :param int max_digits: Specify the maximum floating number digits
-        :return: formatted string
+        :return: An object array of the formatted strings
         """
 
-        append = ''
+        # printf-style formatting yields the same strings as str.format, for every finite and non-finite value
+        precision = '%.' + str(max_digits) + ('e' if is_scientific else 'g')
+
+        return np.array([precision % number for number in numbers.tolist()], dtype=object)
+
+    @staticmethod
+    def __format_column(values, scientific, max_digits=4):
+        """
+        Formats the numeric cells of a column, keeping their omitted symbol, and leaves the others as they are.
 
-        if isinstance(s, str):
-            for symbol in DataframeBeautifier.__omitted_symbols:
-                if symbol in s:
-                    append = ' ' + symbol
-                    break
+        :param pd.Series values: Specify the column
+        :param np.ndarray scientific: Specify which cells should be in scientific format, as a boolean array
+        :param int max_digits: Specify the maximum floating number digits
+        :return: An object array of the formatted cells
+        """
 
-            for symbol in DataframeBeautifier.__omitted_symbols:
-                s = s.replace(symbol, '')
+        numbers, is_number, suffixes = DataframeBeautifier.__split_numbers(values)
 
-        scientific_precision = '{:.' + str(max_digits) + 'e}'
-        floating_precision = '{:.' + str(max_digits) + 'g}'
+        formatted = values.to_numpy(dtype=object).copy()
 
-        if is_scientific:
-            result = scientific_precision.format(float(s))
-        else:
-            result = floating_precision.format(float(s))
+        for is_scientific in [True, False]:
+            selected = is_number & (scientific == is_scientific)
+            if selected.any():
+                formatted[selected] = DataframeBeautifier.__format_numbers(numbers[selected],
+                                                                          is_scientific=is_scientific,
+                                                                          max_digits=max_digits) + suffixes[selected]
 
-        return result + append
+        return formatted
 
     @staticmethod
     def __apply_base_operations(dataframe, apply_scientific_notation_to_all_columns=True,
@@ -100,59 +191,35 @@ class DataframeBeautifier:
                         floating_scientific_notation_columns is filled
         :param int max_digits: Specify the maximum floating number digits
         :param bool transpose: Specify weather to transpose the dataframe or not
-        :return: A dataframe
+        :return: A tuple of the headers, a list of the row labels and a list of the formatted columns
         """
 
+        rows, columns = dataframe.shape
+
         if apply_scientific_notation_to_all_columns:
-            dataframe = dataframe.applymap(
-                lambda x: DataframeBeautifier.__convert_to_float(x, max_digits=max_digits)
-                if DataframeBeautifier.__is_number(x)
-                else x
-            )
+            scientific = np.ones((rows, columns), dtype=bool)
         elif floating_scientific_notation_columns is not None:
-            dataframe[floating_scientific_notation_columns] = \
-                dataframe[floating_scientific_notation_columns].applymap(
-                    lambda x: DataframeBeautifier.__convert_to_float(x, max_digits=max_digits)
-                    if DataframeBeautifier.__is_number(x)
-                    else x
-                )
-
-            floating_scientific_notation_columns_complement = \
-                dataframe.columns.difference(floating_scientific_notation_columns)
-
-            dataframe[floating_scientific_notation_columns_complement] = \
-                dataframe[floating_scientific_notation_columns_complement].applymap(
-                    lambda x: DataframeBeautifier.__convert_to_float(x, is_scientific=False, max_digits=max_digits)
-                    if DataframeBeautifier.__is_number(x)
-                    else x
-                )
+            scientific = np.broadcast_to(dataframe.columns.isin(floating_scientific_notation_columns), (rows, columns))
         elif floating_scientific_notation_rows is not None:
-            dataframe.loc[floating_scientific_notation_rows] = \
-                dataframe.loc[floating_scientific_notation_rows].applymap(
-                    lambda x: DataframeBeautifier.__convert_to_float(x, max_digits=max_digits)
-                    if DataframeBeautifier.__is_number(x)
-                    else x)
-
-            floating_scientific_notation_rows_complement = \
-                dataframe.index.difference(floating_scientific_notation_rows)
-
-            dataframe.loc[floating_scientific_notation_rows_complement] = \
-                dataframe.loc[floating_scientific_notation_rows_complement].applymap(
-                    lambda x: DataframeBeautifier.__convert_to_float(x, is_scientific=False, max_digits=max_digits)
-                    if DataframeBeautifier.__is_number(x)
-                    else x
-                )
+            scientific = np.broadcast_to(dataframe.index.isin(floating_scientific_notation_rows)[:, None],
+                                         (rows, columns))
         else:
-            dataframe = dataframe.applymap(
-                lambda x: DataframeBeautifier.__convert_to_float(x, is_scientific=False, max_digits=max_digits)
-                if DataframeBeautifier.__is_number(x)
-                else x
-            )
+            scientific = np.zeros((rows, columns), dtype=bool)
+
+        formatted = [DataframeBeautifier.__format_column(dataframe.iloc[:, position], scientific[:, position],
+                                                         max_digits=max_digits)
+                     for position in range(columns)]
+
+        labels, keys, name = list(dataframe.index), list(dataframe.columns), dataframe.index.name
 
         if transpose:
-            dataframe = dataframe.T
+            formatted = [list(row) for row in zip(*formatted)] if rows > 0 and columns > 0 else []
+            labels, keys, name = keys, labels, dataframe.columns.name
+
+        # The headers follow tabulate's, which names the index column after the index, if it is named
+        headers = list(map(str, ([name] if name is not None else []) + keys))
 
-        return dataframe
+        return headers, labels, formatted
 
     @staticmethod
     def print_console_stream(dataframe, apply_scientific_notation_to_all_columns=True,
@@ -173,7 +240,7 @@ class DataframeBeautifier:
         :param bool transpose: Specify weather to transpose the dataframe or not
         """
 
-        dataframe = DataframeBeautifier.__apply_base_operations(
+        headers, labels, formatted = DataframeBeautifier.__apply_base_operations(
             dataframe=dataframe,
             apply_scientific_notation_to_all_columns=apply_scientific_notation_to_all_columns,
             floating_scientific_notation_columns=floating_scientific_notation_columns,
@@ -182,7 +249,8 @@ class DataframeBeautifier:
             transpose=transpose
         )
 
-        print(tabulate(dataframe, headers='keys', tablefmt='fancy_grid', numalign='left', disable_numparse=True))
+        print(tabulate(zip(labels, *formatted), headers=headers, tablefmt='fancy_grid', numalign='left',
+                       disable_numparse=True))
 
     @staticmethod
     def print_markup_text(dataframe, apply_scientific_notation_to_all_columns=True,
@@ -203,7 +271,7 @@ class DataframeBeautifier:
         :param bool transpose: Specify weather to transpose the dataframe or not
         """
 
-        dataframe = DataframeBeautifier.__apply_base_operations(
+        headers, labels, formatted = DataframeBeautifier.__apply_base_operations(
             dataframe=dataframe,
             apply_scientific_notation_to_all_columns=apply_scientific_notation_to_all_columns,
             floating_scientific_notation_columns=floating_scientific_notation_columns,
@@ -212,4 +280,67 @@ class DataframeBeautifier:
             transpose=transpose
         )
 
-        print(tabulate(dataframe, headers='keys', tablefmt='github', numalign='left', disable_numparse=True))
+        print(tabulate(zip(labels, *formatted), headers=headers, tablefmt='github', numalign='left',
+                       disable_numparse=True))
+
+    @staticmethod
+    def write_csv(dataframe, path=None, apply_scientific_notation_to_all_columns=True,
+                  floating_scientific_notation_columns=None,
+                  floating_scientific_notation_rows=None,
+                  max_digits=4,
+                  transpose=False,
+                  chunk_size=4096):
+        """
+        Beautifying the output of the dataframe into a CSV file, one chunk of rows at a time.
+
+        Unlike the console and markup outputs, columns are not aligned, hence each chunk is written as soon as it is
+        formatted, and only a single chunk of formatted rows is held in memory at once.
+
+        :param pd.DataFrame() dataframe: Specify the desired dataframe
+        :param str path: Specify the path of the CSV file, default writes to the standard output stream
+        :param bool apply_scientific_notation_to_all_columns: Specify if all columns should be in scientific format
+        :param list() floating_scientific_notation_columns: Specify the columns that should be in scientific format,
+                        ignored when apply_scientific_notation_to_all_columns is set to true
+        :param list() floating_scientific_notation_rows: Specify the columns that should be in scientific format,
+                        ignored when apply_scientific_notation_to_all_columns is set to true
+        :param int max_digits: Specify the maximum floating number digits
+        :param bool transpose: Specify weather to transpose the dataframe or not
+        :param int chunk_size: Specify the number of rows formatted at once
+        """
+
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError('chunk_size must be a positive integer')
+
+        if transpose:
+            dataframe = dataframe.T
+
+            # The selectors name the rows and the columns of the provided dataframe, hence they are swapped along
+            # with its axes, keeping the columns selector first, so cells are formatted as the other outputs do
+            if floating_scientific_notation_columns is not None:
+                floating_scientific_notation_columns, floating_scientific_notation_rows = \
+                    None, floating_scientific_notation_columns
+            elif floating_scientific_notation_rows is not None:
+                floating_scientific_notation_columns, floating_scientific_notation_rows = \
+                    floating_scientific_notation_rows, None
+
+        f = sys.stdout if path is None else open(path, 'w', newline='', encoding='utf-8')
+
+        try:
+            writer = csv.writer(f)
+
+            for start in range(0, max(len(dataframe), 1), chunk_size):
+                headers, labels, formatted = DataframeBeautifier.__apply_base_operations(
+                    dataframe=dataframe.iloc[start:start + chunk_size],
+                    apply_scientific_notation_to_all_columns=apply_scientific_notation_to_all_columns,
+                    floating_scientific_notation_columns=floating_scientific_notation_columns,
+                    floating_scientific_notation_rows=floating_scientific_notation_rows,
+                    max_digits=max_digits
+                )
+
+                if start == 0:
+                    writer.writerow(headers if dataframe.index.name is not None else [''] + headers)
+
+                writer.writerows(zip(labels, *formatted))
+        finally:
+            if path is not None:
+                f.close()
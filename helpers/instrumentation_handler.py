@@ -0,0 +1,322 @@
+import contextlib
+import functools
+import json
+import sys
+import threading
+import time
+import tracemalloc
+
+
+class InstrumentationHandler:
+    """
+    Static methods which record nested timing spans, and optionally memory, of the providers' methods.
+
+    Instrumentation is disabled by default, in which case an instrumented method only pays for a single flag check.
+    Once enabled, each instrumented call records a span holding its duration and its children spans, kept per thread,
+    and, if memory is traced, the change of the traced memory and its peak above the memory at the start of the span.
+    Memory is traced by tracemalloc, which slows down every allocation, and spans of concurrent threads share the
+    process-wide counters, hence memory is best traced from a single thread.
+
+    Attributes
+    ----------
+        __enabled           Specify whether spans are recorded
+        __trace_memory      Specify whether the traced memory is recorded along with each span
+        __started_tracing   Specify whether tracemalloc was started by enable, hence must be stopped by disable
+        __spans             Stores the completed top-level spans, ordered as they completed
+        __local             Holds the stack of open spans of each thread
+        __lock              Guards the completed spans, since spans may be recorded from several threads
+
+    Methods
+    -------
+        enable(trace_memory=False):
+            Starts recording spans, optionally along with the traced memory.
+        disable():
+            Stops recording spans, the recorded ones are kept.
+        is_enabled():
+            Retrieves whether spans are recorded.
+        clear():
+            Discards every recorded span.
+        __open_span(name):
+            Opens a span within the current thread.
+        __close_span(span):
+            Closes the innermost span of the current thread.
+        span(name):
+            Records the enclosed block as a span.
+        instrument(name=None):
+            Decorates a function so each of its calls is recorded as a span.
+        get_spans():
+            Retrieves the recorded top-level spans.
+        __walk(spans, stack=()):
+            Yields every recorded span along with the names of its ancestors.
+        get_summary():
+            Aggregates the recorded spans by name.
+        get_folded_stacks():
+            Aggregates the recorded spans by stack, in the folded format of flame graph tools.
+        dump(path=None, output_format='json'):
+            Writes the recorded spans, as JSON or as folded stacks.
+    """
+
+    __enabled = False
+    __trace_memory = False
+    __started_tracing = False
+    __spans = []
+    __local = threading.local()
+    __lock = threading.Lock()
+
+    @staticmethod
+    def enable(trace_memory=False):
+        """
+        Starts recording spans, optionally along with the traced memory.
+
+        :param bool trace_memory: Specify whether to trace the memory with tracemalloc, started if not already
+        """
+
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            InstrumentationHandler.__started_tracing = True
+
+        InstrumentationHandler.__trace_memory = bool(trace_memory)
+        InstrumentationHandler.__enabled = True
+
+    @staticmethod
+    def disable():
+        """
+        Stops recording spans, the recorded ones are kept.
+        """
+
+        InstrumentationHandler.__enabled = False
+        InstrumentationHandler.__trace_memory = False
+
+        if InstrumentationHandler.__started_tracing:
+            tracemalloc.stop()
+            InstrumentationHandler.__started_tracing = False
+
+    @staticmethod
+    def is_enabled():
+        """
+        Retrieves whether spans are recorded.
+
+        :return: True if spans are recorded
+        """
+
+        return InstrumentationHandler.__enabled
+
+    @staticmethod
+    def clear():
+        """
+        Discards every recorded span.
+        """
+
+        with InstrumentationHandler.__lock:
+            InstrumentationHandler.__spans = []
+
+    @staticmethod
+    def __open_span(name):
+        """
+        Opens a span within the current thread.
+
+        :param str name: Specify the name of the span
+        :return: The opened span
+        """
+
+        stack = getattr(InstrumentationHandler.__local, 'stack', None)
+        if stack is None:
+            stack = InstrumentationHandler.__local.stack = []
+
+        span = {'name': name, 'seconds': 0., 'children': []}
+
+        if InstrumentationHandler.__trace_memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+
+            # The peak is reset for this span, hence the enclosing span keeps the peak reached so far
+            if stack:
+                stack[-1]['_peak'] = max(stack[-1]['_peak'], peak)
+            tracemalloc.reset_peak()
+
+            span['_start_memory'] = current
+            span['_peak'] = current
+
+        stack.append(span)
+        span['_start'] = time.perf_counter()
+
+        return span
+
+    @staticmethod
+    def __close_span(span):
+        """
+        Closes the innermost span of the current thread.
+
+        :param dict span: Specify the span returned when it was opened
+        """
+
+        span['seconds'] = time.perf_counter() - span.pop('_start')
+
+        stack = InstrumentationHandler.__local.stack
+        stack.pop()
+
+        if '_start_memory' in span:
+            start = span.pop('_start_memory')
+            peak = span.pop('_peak')
+
+            if tracemalloc.is_tracing():
+                current, traced_peak = tracemalloc.get_traced_memory()
+                peak = max(peak, traced_peak)
+            else:
+                current = start
+
+            span['memory_delta'] = current - start
+            span['memory_peak'] = peak - start
+
+            if stack and '_peak' in stack[-1]:
+                stack[-1]['_peak'] = max(stack[-1]['_peak'], peak)
+
+        if stack:
+            stack[-1]['children'].append(span)
+        else:
+            span['thread'] = threading.current_thread().name
+            with InstrumentationHandler.__lock:
+                InstrumentationHandler.__spans.append(span)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def span(name):
+        """
+        Records the enclosed block as a span, nothing is recorded if instrumentation is disabled.
+
+        :param str name: Specify the name of the span, e.g. 'DataAcquisitionProvider.load_slice'
+        """
+
+        if not InstrumentationHandler.__enabled:
+            yield
+            return
+
+        span = InstrumentationHandler.__open_span(name)
+        try:
+            yield
+        finally:
+            InstrumentationHandler.__close_span(span)
+
+    @staticmethod
+    def instrument(name=None):
+        """
+        Decorates a function so each of its calls is recorded as a span.
+
+        Placed above MemoizationHandler.memoize, memoized calls are recorded as well, hence repeated calls show up
+        as short spans rather than disappearing.
+
+        :param str name: Specify the name of the spans, default is the qualified name of the function
+        :return: A decorator
+        """
+
+        def decorator(function):
+            span_name = function.__qualname__ if name is None else name
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not InstrumentationHandler.__enabled:
+                    return function(*args, **kwargs)
+
+                span = InstrumentationHandler.__open_span(span_name)
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    InstrumentationHandler.__close_span(span)
+
+            return wrapper
+
+        return decorator
+
+    @staticmethod
+    def get_spans():
+        """
+        Retrieves the recorded top-level spans.
+
+        :return: A list of spans, each one a dictionary of its 'name', 'seconds', 'children' spans, 'thread'
+                 (top-level spans only), and 'memory_delta' and 'memory_peak' in bytes if memory was traced
+        """
+
+        with InstrumentationHandler.__lock:
+            return list(InstrumentationHandler.__spans)
+
+    @staticmethod
+    def __walk(spans, stack=()):
+        """
+        Yields every recorded span along with the names of its ancestors.
+
+        :param list spans: Specify the spans to walk through
+        :param tuple stack: Specify the names of the ancestors of the spans
+        :return: A generator of (span, stack) tuples, the stack including the span's own name
+        """
+
+        for span in spans:
+            path = stack + (span['name'],)
+            yield span, path
+            yield from InstrumentationHandler.__walk(span['children'], path)
+
+    @staticmethod
+    def get_summary():
+        """
+        Aggregates the recorded spans by name.
+
+        The self time of a span excludes the time of its children. Recursive calls count their total time once.
+
+        :return: A dictionary of span names and their 'calls', 'seconds', 'self_seconds' and, if memory was traced,
+                 their largest 'memory_peak', sorted by decreasing total time
+        """
+
+        summary = {}
+
+        for span, stack in InstrumentationHandler.__walk(InstrumentationHandler.get_spans()):
+            entry = summary.setdefault(span['name'], {'calls': 0, 'seconds': 0., 'self_seconds': 0.})
+
+            entry['calls'] += 1
+            entry['self_seconds'] += span['seconds'] - sum(child['seconds'] for child in span['children'])
+            if span['name'] not in stack[:-1]:
+                entry['seconds'] += span['seconds']
+            if 'memory_peak' in span:
+                entry['memory_peak'] = max(entry.get('memory_peak', 0), span['memory_peak'])
+
+        return dict(sorted(summary.items(), key=lambda item: item[1]['seconds'], reverse=True))
+
+    @staticmethod
+    def get_folded_stacks():
+        """
+        Aggregates the recorded spans by stack, in the folded format of flame graph tools.
+
+        :return: A list of 'outer;inner microseconds' lines, each holding the self time of a stack
+        """
+
+        stacks = {}
+
+        for span, stack in InstrumentationHandler.__walk(InstrumentationHandler.get_spans()):
+            self_seconds = span['seconds'] - sum(child['seconds'] for child in span['children'])
+            key = ';'.join(stack)
+            stacks[key] = stacks.get(key, 0.) + self_seconds
+
+        return [f'{stack} {max(round(seconds * 1e6), 0)}' for stack, seconds in stacks.items()]
+
+    @staticmethod
+    def dump(path=None, output_format='json'):
+        """
+        Writes the recorded spans, as JSON or as folded stacks.
+
+        The JSON holds the 'summary' by name along with every recorded 'spans' tree, while the folded stacks can be
+        fed to flamegraph.pl or speedscope.
+
+        :param str path: Specify the path of the file, default writes to the standard error stream
+        :param str output_format: Specify the format, either 'json' or 'folded'
+        """
+
+        if output_format == 'json':
+            content = json.dumps({'summary': InstrumentationHandler.get_summary(),
+                                  'spans': InstrumentationHandler.get_spans()}, indent=4)
+        elif output_format == 'folded':
+            content = '\n'.join(InstrumentationHandler.get_folded_stacks())
+        else:
+            raise ValueError('Invalid output_format value')
+
+        if path is None:
+            sys.stderr.write(content + '\n')
+        else:
+            with open(path, 'w') as f:
+                f.write(content + '\n')
@@ -0,0 +1,123 @@
+import functools
+import inspect
+import threading
+from collections import OrderedDict
+
+
+class MemoizationHandler:
+    """
+    Static methods which memoize the results of the providers in a bounded LRU cache.
+
+    Attributes
+    ----------
+        __results           Stores the memoized results, ordered from the least to the most recently used
+        __max_size          Specify the maximum number of memoized results
+        __hits              Counts the calls answered from the cache
+        __misses            Counts the calls which had to be computed
+        __lock              Guards the cache, since results may be requested from several threads
+
+    Methods
+    -------
+        set_max_size(max_size=256):
+            Specify the maximum number of memoized results, evicting the least recently used ones if needed.
+        clear():
+            Discards every memoized result.
+        get_statistics():
+            Retrieves the size of the cache and its hit/miss counters.
+        memoize(fingerprint):
+            Decorates a function so its results are memoized by its arguments and the current data fingerprint.
+    """
+
+    __results = OrderedDict()
+    __max_size = 256
+    __hits = 0
+    __misses = 0
+    __lock = threading.RLock()
+
+    @staticmethod
+    def set_max_size(max_size=256):
+        """
+        Specify the maximum number of memoized results, evicting the least recently used ones if needed.
+
+        :param int max_size: Specify the maximum number of memoized results, 0 disables memoization
+        """
+
+        if not isinstance(max_size, int) or max_size < 0:
+            raise ValueError('max_size must be a non-negative integer')
+
+        with MemoizationHandler.__lock:
+            MemoizationHandler.__max_size = max_size
+            while len(MemoizationHandler.__results) > max_size:
+                MemoizationHandler.__results.popitem(last=False)
+
+    @staticmethod
+    def clear():
+        """
+        Discards every memoized result.
+        """
+
+        with MemoizationHandler.__lock:
+            MemoizationHandler.__results.clear()
+            MemoizationHandler.__hits = 0
+            MemoizationHandler.__misses = 0
+
+    @staticmethod
+    def get_statistics():
+        """
+        Retrieves the size of the cache and its hit/miss counters.
+
+        :return: A dictionary of 'size', 'max_size', 'hits' and 'misses'
+        """
+
+        with MemoizationHandler.__lock:
+            return {'size': len(MemoizationHandler.__results),
+                    'max_size': MemoizationHandler.__max_size,
+                    'hits': MemoizationHandler.__hits,
+                    'misses': MemoizationHandler.__misses}
+
+    @staticmethod
+    def memoize(fingerprint):
+        """
+        Decorates a function so its results are memoized by its arguments and the current data fingerprint.
+
+        Results exposing a 'copy' method (e.g. dataframes) are copied when retrieved,
+        hence callers can freely alter them.
+
+        :param callable fingerprint: Retrieves an identifier of the data the results are computed from
+        :return: A decorator
+        """
+
+        def decorator(function):
+            signature = inspect.signature(function)
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if MemoizationHandler.__max_size == 0:
+                    return function(*args, **kwargs)
+
+                arguments = signature.bind(*args, **kwargs)
+                arguments.apply_defaults()
+
+                key = (function.__qualname__, fingerprint(), tuple(arguments.arguments.items()))
+
+                with MemoizationHandler.__lock:
+                    if key in MemoizationHandler.__results:
+                        MemoizationHandler.__results.move_to_end(key)
+                        MemoizationHandler.__hits += 1
+                        result = MemoizationHandler.__results[key]
+                        return result.copy() if hasattr(result, 'copy') else result
+
+                    MemoizationHandler.__misses += 1
+
+                result = function(*args, **kwargs)
+
+                with MemoizationHandler.__lock:
+                    MemoizationHandler.__results[key] = result
+                    while len(MemoizationHandler.__results) > MemoizationHandler.__max_size:
+                        MemoizationHandler.__results.popitem(last=False)
+
+                return result.copy() if hasattr(result, 'copy') else result
+
+            return wrapper
+
+        return decorator
@@ -1,45 +1,138 @@
-import datetime
+import threading
+
+import deprecation
+
+from models.progress_tracker import ProgressTracker
 
 
 class ProgressHandler:
     """
-    Set of static methods that aid some progress manipulations.
+    Set of static methods which create the progress trackers of the providers' loops, sharing their reporting settings.
+
+    Each loop gets its own ProgressTracker, hence loops running at the same time (e.g. from several threads) do not
+    share any state. The settings only decide how the trackers report: whether they print, and which callbacks
+    receive their snapshots.
 
     Attributes
     ----------
-        __last_accessed     Last time show_progress method has been called.
-        __remaining_time    Stores remaining time in a formatted string
+        __quiet             Specify whether the trackers print nothing
+        __interval          The minimum number of seconds between two printed lines of a tracker
+        __callbacks         Receive the snapshot of each update of every tracker
+        __legacy_tracker    The tracker updated by the deprecated show_progress method
+        __lock              Guards the settings, since trackers may be created from several threads
 
     Methods
     -------
+        set_quiet(quiet=True):
+            Specify whether the trackers print nothing, the callbacks are still called.
+        is_quiet():
+            Retrieves whether the trackers print nothing.
+        set_interval(interval=0.5):
+            Specify the minimum number of seconds between two printed lines of a tracker.
+        add_callback(callback):
+            Registers a callback receiving the snapshot of each update of every tracker.
+        remove_callback(callback):
+            Unregisters a callback.
+        track(total, description=''):
+            Creates the tracker of a loop.
         show_progress(elapsed=0, total=100):
-            Shows scraping progress in a formatted manner.
+            Shows progress in a formatted manner (deprecated).
         reset_progress():
-            Nullifies the attributes in order to receive new progress.
+            Nullifies the attributes in order to receive new progress (deprecated).
     """
 
-    __last_accessed = None
-    __remaining_time = None
+    __quiet = False
+    __interval = 0.5
+    __callbacks = []
+    __legacy_tracker = None
+    __lock = threading.Lock()
+
+    @staticmethod
+    def set_quiet(quiet=True):
+        """
+        Specify whether the trackers print nothing, the callbacks are still called.
+
+        :param bool quiet: Specify whether the trackers print nothing
+        """
+
+        ProgressHandler.__quiet = bool(quiet)
+
+    @staticmethod
+    def is_quiet():
+        """
+        Retrieves whether the trackers print nothing.
+
+        :return: True if the trackers print nothing
+        """
+
+        return ProgressHandler.__quiet
+
+    @staticmethod
+    def set_interval(interval=0.5):
+        """
+        Specify the minimum number of seconds between two printed lines of a tracker.
+
+        :param float interval: Specify the number of seconds, 0 prints every update
+        """
+
+        if interval < 0:
+            raise ValueError('interval must be a non-negative number')
+
+        ProgressHandler.__interval = interval
 
     @staticmethod
+    def add_callback(callback):
+        """
+        Registers a callback receiving the snapshot of each update of every tracker.
+
+        Callbacks are called from the thread updating the tracker, while it holds its lock, hence they should not
+        update the tracker themselves.
+
+        :param callable callback: Receives a snapshot, as returned by ProgressTracker.get_snapshot
+        """
+
+        with ProgressHandler.__lock:
+            ProgressHandler.__callbacks = ProgressHandler.__callbacks + [callback]
+
+    @staticmethod
+    def remove_callback(callback):
+        """
+        Unregisters a callback.
+
+        :param callable callback: Specify a registered callback
+        """
+
+        with ProgressHandler.__lock:
+            ProgressHandler.__callbacks = [registered for registered in ProgressHandler.__callbacks
+                                           if registered is not callback]
+
+    @staticmethod
+    def track(total, description=''):
+        """
+        Creates the tracker of a loop.
+
+        :param int total: Specify the number of items to process
+        :param str description: Describes the processed items, e.g. 'Reading raw files'
+        :return: A ProgressTracker, to be closed once the loop is over (or used as a context manager)
+        """
+
+        with ProgressHandler.__lock:
+            callbacks = ProgressHandler.__callbacks
+
+        return ProgressTracker(total, description=description, callbacks=callbacks, quiet=ProgressHandler.__quiet,
+                               interval=ProgressHandler.__interval)
+
+    @staticmethod
+    @deprecation.deprecated(details="Use the track function instead")
     def show_progress(elapsed=0, total=100):
         """
-        Shows scraping progress in a formatted manner.
+        Shows progress in a formatted manner.
 
-        :param int elapsed: Specify the elapsed retrieved pages
-        :param int total: Specify the total number of pages
+        :param int elapsed: Specify the number of processed items
+        :param int total: Specify the total number of items
         :return: A string denoting the progress
         """
 
-        if ProgressHandler.__last_accessed is None:
-            ProgressHandler.__last_accessed = (datetime.datetime.now() - datetime.datetime(1970, 1, 1)).total_seconds()
-            ProgressHandler.__remaining_time = total * 0.5  # Assumes 500 milliseconds for each process
-        else:
-            elapsed_time = (datetime.datetime.now() - datetime.datetime(1970, 1, 1)).total_seconds() \
-                           - ProgressHandler.__last_accessed
-            all_time_for_downloading = (elapsed_time * total / (elapsed+1))
-            ProgressHandler.__remaining_time = all_time_for_downloading - elapsed_time
-
         if not isinstance(elapsed, int):
             raise ValueError('elapsed must be an integer')
 
@@ -49,15 +142,25 @@ class ProgressHandler:
         if elapsed > total:
             raise ValueError('elapsed cannot be greater than total')
 
-        return f'{elapsed}/{total}\t\t' \
-               f'{"{:.2f}".format(round(elapsed / total * 100, 2))}%\t\t' \
-               f'ETA: {"{:.2f}".format(round(ProgressHandler.__remaining_time, 2))} second(s)'
+        with ProgressHandler.__lock:
+            if ProgressHandler.__legacy_tracker is None or ProgressHandler.__legacy_tracker.total != total:
+                ProgressHandler.__legacy_tracker = ProgressTracker(total, quiet=True)
+
+            tracker = ProgressHandler.__legacy_tracker
+
+        processed = tracker.get_snapshot()['processed']
+
+        if elapsed > processed:
+            tracker.update(elapsed - processed)
+
+        return ProgressTracker.format(tracker.get_snapshot())
 
     @staticmethod
+    @deprecation.deprecated(details="Use the track function instead")
     def reset_progress():
         """
         Nullifies the attributes in order to receive new progress.
         """
 
-        ProgressHandler.__last_accessed = None
-        ProgressHandler.__remaining_time = None
+        with ProgressHandler.__lock:
+            ProgressHandler.__legacy_tracker = None
@@ -0,0 +1,85 @@
+import json
+import sys
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qsl, urlsplit
+
+
+class UnknownQueryError(Exception):
+    """
+    Raised by the 'run_query' function of a query server when the path names no query, answered with a 404 status.
+    """
+
+
+class QueryRequestHandler(BaseHTTPRequestHandler):
+    """
+    Answers the GET requests of a query server with JSON responses.
+
+    The path names the query and the query string holds its arguments, e.g. '/friedman?dimension=10&parameter=0'.
+    Queries are run by the 'run_query(query, arguments)' function of the server, one at a time, under its 'query_lock',
+    since the providers share their loaded data and memoized results. An UnknownQueryError is answered with a 404
+    status, a ValueError (an invalid argument) with a 400 status and any other exception with a 500 status.
+
+    Attributes
+    ----------
+        verbose             Specify whether each request is logged to the standard error stream
+
+    Methods
+    -------
+        do_GET():
+            Runs the query named by the path and sends its result.
+        __send_json(status, body):
+            Sends a JSON response.
+        log_message(format, *args):
+            Logs a request if 'verbose' is set, the client address is omitted since Unix sockets have none.
+    """
+
+    verbose = False
+
+    def do_GET(self):
+        """
+        Runs the query named by the path and sends its result.
+        """
+
+        url = urlsplit(self.path)
+        query = url.path.strip('/')
+        arguments = dict(parse_qsl(url.query))
+
+        try:
+            with self.server.query_lock:
+                result = self.server.run_query(query, arguments)
+        except UnknownQueryError as error:
+            self.__send_json(404, {'error': f'Unknown query {error}'})
+        except ValueError as error:
+            self.__send_json(400, {'error': str(error)})
+        except Exception as error:
+            self.__send_json(500, {'error': f'{type(error).__name__}: {error}'})
+        else:
+            self.__send_json(200, result)
+
+    def __send_json(self, status, body):
+        """
+        Sends a JSON response.
+
+        :param int status: Specify the HTTP status code
+        :param dict body: Specify the body, must be JSON serializable
+        """
+
+        # Results may still hold numpy scalars, which are converted to their plain Python value
+        content = json.dumps(body, default=lambda value: value.item()).encode('utf-8')
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        """
+        Logs a request if 'verbose' is set, the client address is omitted since Unix sockets have none.
+
+        :param str format: Specify the format of the message
+        :param args: Specify the values of the format
+        """
+
+        if QueryRequestHandler.verbose:
+            sys.stderr.write(f'[{self.log_date_time_string()}] {format % args}\n')
@@ -0,0 +1,392 @@
+import numpy as np
+from scipy.stats import chi2, mannwhitneyu, norm, rankdata
+
+from helpers.instrumentation_handler import InstrumentationHandler
+
+
+class StatisticsHandler:
+    """
+    Static methods which implements the statistical tests as array operations over many samples at once.
+
+    Each kernel follows the formulas of its scipy counterpart, hence a batch yields the same results
+    as calling scipy once per sample.
+
+    Methods
+    -------
+        rank(values):
+            Ranks the values along the last axis, assigning the average rank to ties.
+        get_tie_term(values):
+            Sums t³ - t over every group of t tied values along the last axis.
+        compact(values):
+            Moves the NaN values to the end of the last axis, keeping the order of the other values.
+        __get_friedman_statistics(rank_sums, n, k, ties):
+            Calculates the Friedman chi-square statistic from the rank sums of each algorithm.
+        friedman(values):
+            Conducts the Friedman test on a batch of (problems × algorithms) blocks.
+        friedman_replicates(ranks, replicates, seed=None):
+            Draws bootstrap replicates of the mean ranks and permutation replicates of the Friedman statistic.
+        nemenyi_friedman(mean_ranks, n):
+            Conducts the Nemenyi post hoc test of every pair of algorithms on a batch of Friedman rankings.
+        get_critical_difference(k, n, alpha=0.05):
+            Calculates the smallest difference of mean ranks the Nemenyi test deems significant.
+        get_signed_rank_distribution(n):
+            Calculates the exact distribution of the sum of positive ranks of n untied, non-zero differences.
+        get_signed_rank_exact_p_values(n):
+            Calculates the exact two-sided p-value of every possible sum of positive ranks of n differences.
+        wilcoxon(x, y):
+            Conducts the two-sided Wilcoxon signed-rank test on a batch of paired samples.
+        mannwhitneyu(x, y):
+            Conducts the two-sided Mann–Whitney U test on a batch of independent samples.
+        __mannwhitneyu_ragged(x, y):
+            Conducts the Mann–Whitney U test on samples of unequal sizes, padded with NaN.
+    """
+
+    @staticmethod
+    def rank(values):
+        """
+        Ranks the values along the last axis, assigning the average rank to ties.
+
+        :param np.ndarray values: An array of any shape, NaN values are left out of the ranking
+        :return: A float array of the same shape, NaN where the value is NaN
+        """
+
+        return rankdata(values, axis=-1, nan_policy='omit')
+
+    @staticmethod
+    def get_tie_term(values):
+        """
+        Sums t³ - t over every group of t tied values along the last axis.
+
+        The groups are found by sorting, hence the memory stays linear in the sample size.
+
+        :param np.ndarray values: An array of any shape, NaN values never tie
+        :return: A float array shaped as the values without their last axis
+        """
+
+        n = values.shape[-1]
+        rows = np.sort(values, axis=-1).reshape(-1, n)
+
+        # Every row starts a new group, hence the groups never span two rows
+        starts = np.ones(rows.shape, dtype=bool)
+        starts[:, 1:] = rows[:, 1:] != rows[:, :-1]
+
+        sizes = np.bincount(np.cumsum(starts.ravel()) - 1)
+        groups_row = np.repeat(np.arange(len(rows)), starts.sum(axis=-1))
+
+        tie_term = np.bincount(groups_row, weights=sizes ** 3 - sizes, minlength=len(rows))
+
+        return tie_term.reshape(values.shape[:-1])
+
+    @staticmethod
+    def compact(values):
+        """
+        Moves the NaN values to the end of the last axis, keeping the order of the other values.
+
+        :param np.ndarray values: An array of any shape
+        :return: An array of the same shape
+        """
+
+        order = np.argsort(np.isnan(values), axis=-1, kind='stable')
+
+        return np.take_along_axis(values, order, axis=-1)
+
+    @staticmethod
+    def __get_friedman_statistics(rank_sums, n, k, ties):
+        """
+        Calculates the Friedman chi-square statistic from the rank sums of each algorithm.
+
+        :param np.ndarray rank_sums: An array of shape (..., algorithms)
+        :param int n: Specify the number of problems
+        :param int k: Specify the number of algorithms
+        :param ties: The sum of the tie term of every problem, shaped as the rank sums without their last axis
+        :return: A float array shaped as the rank sums without their last axis
+        """
+
+        c = 1 - ties / (k * (k * k - 1) * n)
+        ssbn = np.sum(rank_sums ** 2, axis=-1)
+
+        return (12.0 / (k * n * (k + 1)) * ssbn - 3 * n * (k + 1)) / c
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def friedman(values):
+        """
+        Conducts the Friedman test on a batch of (problems × algorithms) blocks.
+
+        :param np.ndarray values: An array of shape (..., problems, algorithms)
+        :return: A tuple of the ranks, shaped as the values, the mean rank of each algorithm, shaped (..., algorithms),
+                 and the chi-square statistic and the p-value of each block, shaped (...)
+        """
+
+        n, k = values.shape[-2:]
+
+        ranks = StatisticsHandler.rank(values)
+        mean_ranks = np.nansum(ranks, axis=-2) / (~np.isnan(ranks)).sum(axis=-2)
+
+        ties = StatisticsHandler.get_tie_term(ranks).sum(axis=-1)
+
+        statistics = StatisticsHandler.__get_friedman_statistics(ranks.sum(axis=-2), n, k, ties)
+
+        return ranks, mean_ranks, statistics, chi2.sf(statistics, k - 1)
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def friedman_replicates(ranks, replicates, seed=None):
+        """
+        Draws bootstrap replicates of the mean ranks and permutation replicates of the Friedman statistic.
+
+        Bootstrap replicates resample the problems with replacement, hence they only average other rows of the ranks.
+        Permutation replicates shuffle the ranks within each problem, which is the null hypothesis of the test,
+        the tie correction is left as is since shuffling does not change the ties of a problem.
+
+        :param np.ndarray ranks: An array of shape (problems, algorithms), as ranked by 'friedman', without NaN
+        :param int replicates: Specify the number of replicates of each kind
+        :param seed: Specify the seed (an int or a np.random.SeedSequence), None draws a fresh one
+        :return: A tuple of the bootstrap mean ranks, shaped (replicates, algorithms),
+                 and the permutation statistics, shaped (replicates,)
+        """
+
+        n, k = ranks.shape
+        rng = np.random.default_rng(seed)
+
+        problems = rng.integers(0, n, size=(replicates, n))
+        bootstrap_mean_ranks = ranks[problems].mean(axis=-2)
+
+        order = rng.random((replicates, n, k)).argsort(axis=-1)
+        rank_sums = np.take_along_axis(np.broadcast_to(ranks, (replicates, n, k)), order, axis=-1).sum(axis=-2)
+
+        ties = StatisticsHandler.get_tie_term(ranks).sum()
+
+        return bootstrap_mean_ranks, StatisticsHandler.__get_friedman_statistics(rank_sums, n, k, ties)
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def nemenyi_friedman(mean_ranks, n):
+        """
+        Conducts the Nemenyi post hoc test of every pair of algorithms on a batch of Friedman rankings.
+
+        Follows scikit_posthocs' posthoc_nemenyi_friedman, where the difference of mean ranks is scaled by
+        √(k × (k + 1) / (6 × n)) and compared against the studentized range distribution of the k ranked algorithms.
+
+        :param np.ndarray mean_ranks: An array of shape (..., algorithms), NaN for algorithms which were not ranked
+        :param np.ndarray n: Specify the number of ranked problems of each ranking, shaped (...)
+        :return: A float array of shape (..., algorithms, algorithms), with ones on the diagonal of ranked algorithms,
+                 and NaN for the pairs involving an algorithm which was not ranked
+        """
+
+        k = (~np.isnan(mean_ranks)).sum(axis=-1)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            scale = np.sqrt(k * (k + 1.) / (6. * np.asarray(n)))
+            q = np.abs(mean_ranks[..., :, None] - mean_ranks[..., None, :]) / scale[..., None, None] * np.sqrt(2.)
+
+        p_values = np.full(q.shape, np.nan)
+
+        # The test is symmetric, hence only the upper triangle is tested and mirrored
+        upper = np.triu(np.ones(q.shape[-2:], dtype=bool), k=1)
+        tested = ~np.isnan(q) & (k >= 2)[..., None, None] & upper
+
+        if tested.any():
+            # statsmodels is slow to import, hence it is only imported once the distribution is needed
+            from statsmodels.stats.libqsturng import psturng
+
+            r = np.broadcast_to(k[..., None, None], q.shape)[tested]
+
+            # Evaluating the distribution is costly, whereas mean ranks are multiples of 1 / (2 × n), hence many
+            # pairs share the same scaled difference and only the distinct ones are evaluated
+            pairs, inverse = np.unique(np.stack([q[tested], r]), axis=1, return_inverse=True)
+            p_values[tested] = np.atleast_1d(psturng(pairs[0], pairs[1], np.inf))[inverse.reshape(-1)]
+
+        p_values = np.where(upper, p_values, np.swapaxes(p_values, -1, -2))
+
+        diagonal = np.arange(mean_ranks.shape[-1])
+        p_values[..., diagonal, diagonal] = np.where(np.isnan(mean_ranks), np.nan, 1.)
+
+        return p_values
+
+    @staticmethod
+    def get_critical_difference(k, n, alpha=0.05):
+        """
+        Calculates the smallest difference of mean ranks the Nemenyi test deems significant.
+
+        :param np.ndarray k: Specify the number of ranked algorithms of each ranking
+        :param np.ndarray n: Specify the number of ranked problems of each ranking, shaped as k
+        :param float alpha: Specify the level of significance
+        :return: A float array shaped as k, NaN where fewer than two algorithms were ranked
+        """
+
+        k = np.asarray(k, dtype=np.float64)
+        critical_differences = np.full(k.shape, np.nan)
+        ranked = k >= 2
+
+        if ranked.any():
+            from statsmodels.stats.libqsturng import qsturng
+
+            q_alpha = np.atleast_1d(qsturng(1 - alpha, k[ranked], np.inf)) / np.sqrt(2.)
+            critical_differences[ranked] = q_alpha * np.sqrt(k[ranked] * (k[ranked] + 1.) /
+                                                             (6. * np.broadcast_to(n, k.shape)[ranked]))
+
+        return critical_differences
+
+    @staticmethod
+    def get_signed_rank_distribution(n):
+        """
+        Calculates the exact distribution of the sum of positive ranks of n untied, non-zero differences.
+
+        :param int n: Specify the number of differences
+        :return: A float array holding the probability of every sum, from 0 to n × (n + 1) / 2
+        """
+
+        distribution = np.ones(1, dtype=np.double)
+
+        for k in range(1, n + 1):
+            previous = distribution
+            distribution = np.zeros(k * (k + 1) // 2 + 1, dtype=np.double)
+            distribution[:len(previous)] = previous * 0.5
+            distribution[-len(previous):] += previous * 0.5
+
+        return distribution
+
+    @staticmethod
+    def get_signed_rank_exact_p_values(n):
+        """
+        Calculates the exact two-sided p-value of every possible sum of positive ranks of n differences.
+
+        :param int n: Specify the number of differences
+        :return: A float array holding the p-value of every sum, from 0 to n × (n + 1) / 2
+        """
+
+        distribution = StatisticsHandler.get_signed_rank_distribution(n)
+        centre = (len(distribution) - 1) // 2
+
+        p_values = np.ones(len(distribution))
+
+        # Each tail is summed separately, exactly as scipy does, rather than through a cumulative sum
+        for r_plus in range(len(distribution)):
+            if r_plus != centre:
+                p_values[r_plus] = 2 * min(np.sum(distribution[r_plus:]), np.sum(distribution[:r_plus + 1]))
+
+        return np.clip(p_values, 0, 1)
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def wilcoxon(x, y):
+        """
+        Conducts the two-sided Wilcoxon signed-rank test on a batch of paired samples.
+
+        Zero differences are dropped ('wilcox' method), the exact distribution is used for up to 50 differences
+        without any zero, otherwise the normal approximation with the tie correction is used
+        (scipy applies no continuity correction by default).
+
+        :param np.ndarray x: An array of shape (..., n)
+        :param np.ndarray y: An array of shape (..., n)
+        :return: A tuple of the statistic (the smaller of both rank sums), the sum of positive ranks,
+                 the sum of negative ranks and the p-value, each shaped (...), NaN where the test is undefined
+        """
+
+        d = np.asarray(x, dtype=np.float64) - np.asarray(y, dtype=np.float64)
+        n = d.shape[-1]
+
+        zeros = (d == 0).sum(axis=-1)
+        count = n - zeros
+
+        ranks = StatisticsHandler.rank(np.where(d == 0, np.nan, np.abs(d)))
+        r_plus = np.where(d > 0, ranks, 0).sum(axis=-1)
+        r_minus = np.where(d < 0, ranks, 0).sum(axis=-1)
+        statistics = np.minimum(r_plus, r_minus)
+
+        exact = (n <= 50) & (zeros == 0)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mn = count * (count + 1.) * 0.25
+            se = count * (count + 1.) * (2. * count + 1.)
+
+            se -= 0.5 * StatisticsHandler.get_tie_term(ranks)
+            se = np.sqrt(se / 24)
+
+            z = (statistics - mn) / se
+            p_values = 2. * norm.sf(np.abs(z))
+
+        if n <= 50 and exact.any():
+            exact_p_values = StatisticsHandler.get_signed_rank_exact_p_values(n)
+            p_values = np.where(exact, exact_p_values[np.where(exact, r_plus, 0).astype(int)], p_values)
+
+        undefined = np.isnan(d).any(axis=-1) | (count == 0)
+
+        return (np.where(undefined, np.nan, statistics), np.where(undefined, np.nan, r_plus),
+                np.where(undefined, np.nan, r_minus), np.where(undefined, np.nan, p_values))
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def mannwhitneyu(x, y):
+        """
+        Conducts the two-sided Mann–Whitney U test on a batch of independent samples.
+
+        The normal approximation with the tie and continuity corrections is used, unless either sample holds at most
+        8 values, where scipy is called for each pair of samples, since it may then pick the exact distribution.
+
+        :param np.ndarray x: An array of shape (..., n1), NaN values are left out of their sample
+        :param np.ndarray y: An array of shape (..., n2), NaN values are left out of their sample
+        :return: A tuple of the U statistic of x and the p-value, each shaped as the broadcast leading axes,
+                 NaN where a sample is empty
+        """
+
+        n1, n2 = x.shape[-1], y.shape[-1]
+        shape = np.broadcast_shapes(x.shape[:-1], y.shape[:-1])
+
+        x = np.broadcast_to(x, shape + (n1,))
+        y = np.broadcast_to(y, shape + (n2,))
+
+        if np.isnan(x).any() or np.isnan(y).any():
+            return StatisticsHandler.__mannwhitneyu_ragged(x, y)
+
+        if n1 <= 8 or n2 <= 8:
+            u1 = np.empty(shape)
+            p_values = np.empty(shape)
+
+            for index in np.ndindex(shape):
+                u1[index], p_values[index] = mannwhitneyu(x[index], y[index])
+
+            return u1, p_values
+
+        ranks = rankdata(np.concatenate([x, y], axis=-1), axis=-1)
+        u1 = ranks[..., :n1].sum(axis=-1) - n1 * (n1 + 1) / 2
+        u = np.maximum(u1, n1 * n2 - u1)
+
+        n = n1 + n2
+        tie_term = StatisticsHandler.get_tie_term(ranks)
+        s = np.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z = (u - n1 * n2 / 2 - 0.5) / s
+
+        return u1, np.clip(norm.sf(z) * 2, 0, 1)
+
+    @staticmethod
+    def __mannwhitneyu_ragged(x, y):
+        """
+        Conducts the Mann–Whitney U test on samples of unequal sizes, padded with NaN.
+
+        The samples are grouped by their sizes, and each group is tested in a single batch.
+
+        :param np.ndarray x: An array of shape (..., n1)
+        :param np.ndarray y: An array of shape (..., n2), sharing the leading axes of x
+        :return: A tuple of the U statistic of x and the p-value, NaN where a sample is empty
+        """
+
+        x = StatisticsHandler.compact(x)
+        y = StatisticsHandler.compact(y)
+
+        sizes = np.stack([(~np.isnan(x)).sum(axis=-1), (~np.isnan(y)).sum(axis=-1)], axis=-1)
+
+        u1 = np.full(x.shape[:-1], np.nan)
+        p_values = np.full(x.shape[:-1], np.nan)
+
+        for n1, n2 in np.unique(sizes.reshape(-1, 2), axis=0):
+            if n1 == 0 or n2 == 0:
+                continue
+
+            group = (sizes[..., 0] == n1) & (sizes[..., 1] == n2)
+            u1[group], p_values[group] = StatisticsHandler.mannwhitneyu(x[group][:, :n1], y[group][:, :n2])
+
+        return u1, p_values
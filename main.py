@@ -1,7 +1,10 @@
 from helpers.dataframe_beautifier import DataframeBeautifier
+from helpers.instrumentation_handler import InstrumentationHandler
 from providers.data_acquisition_provider import DataAcquisitionProvider
 from providers.non_parametric_tests_provider import NonParametricTestsProvider
 from providers.plots_provider import PlotsProvider
+from providers.render_provider import RenderProvider
+from providers.sweep_provider import SweepProvider
 
 print('Comparing....')
 print('--------------------------------------------------')
@@ -17,9 +20,18 @@ print('--------------------------------------------------')
 #     r'assets/algorithms'
 # )
 
-# 2) Cache your data -Time consuming- 'One time only, when assets/cached_instances is empty'
+# Optionally, spread the parsing of the raw files over several processes (None uses every available core)
+# DataAcquisitionProvider.set_workers(None)
+
+# Optionally, keep only the running mean and standard deviation of each file, rather than every run
+# DataAcquisitionProvider.set_streaming(True)
+
+# 2) Cache your data -Time consuming- 'Only changed algorithm/dimension slices are recomputed on later calls'
 # DataAcquisitionProvider.cache_algorithms_comparisons()
 
+# Or, once cached, splice a newly added algorithm folder without reprocessing the others
+# DataAcquisitionProvider.register_algorithm('ALGO-NAME')
+
 # 3) Specify The Desired Dimension, Parameter, & Alpha to Test
 DIMENSION = 10
 PARAMETER = 8
@@ -84,6 +96,16 @@ DataframeBeautifier.print_console_stream(
     transpose=True,
 )
 
+# Optionally, add bootstrap confidence intervals of the mean ranks and a permutation p-value
+# df = NonParametricTestsProvider.friedman_test_resampled(
+#     dimension=DIMENSION,
+#     parameter=PARAMETER,
+#     alpha=ALPHA,
+#     replicates=1000,
+#     seed=0,
+# )
+# print(df)
+
 # Post Hoc Tests With Pair-wise Comparisons-----------------------------------------------------------------------------
 df = NonParametricTestsProvider.get_post_hoc_tests(
     dimension=DIMENSION,
@@ -135,5 +157,29 @@ PlotsProvider.plot_algorithm_performance_fluctuation(
 # Best Algorithm Plotting-----------------------------------------------------------------------------------------------
 PlotsProvider.plot_best_algorithms()
 
+# Critical Difference Diagram (Nemenyi)---------------------------------------------------------------------------------
+PlotsProvider.plot_critical_difference(
+    dimension=DIMENSION,
+    parameter=PARAMETER,
+    alpha=ALPHA,
+)
+
+# Sweep Every Dimension and Parameter (or run 'python cli.py sweep')----------------------------------------------------
+# results = SweepProvider.sweep(workers=None)
+# results.save('sweep')
+
+# Render Every Plot to Files (or run 'python cli.py render')------------------------------------------------------------
+# RenderProvider.render(output_directory='plots', workers=None)
+
+# Compact float32 Runs and Memory Report (or run 'python cli.py memory --stores raw cube --lossy')----------------------
+# DataAcquisitionProvider.set_compact(lossless=False)
+# DataAcquisitionProvider.get_algorithms_cube()
+# print(DataAcquisitionProvider.get_memory_report())
+
+# Timing Spans of the Providers (or run 'python cli.py --trace spans.json rank')----------------------------------------
+# InstrumentationHandler.enable(trace_memory=True)
+# NonParametricTestsProvider.friedman_test(dimension=DIMENSION, parameter=PARAMETER, alpha=ALPHA)
+# InstrumentationHandler.dump('spans.json')
+
 print('--------------------------------------------------')
 print('Done.')
@@ -0,0 +1,143 @@
+import numpy as np
+import pandas as pd
+
+
+class FriedmanRankings:
+    """
+    Friedman ranks, mean ranks, statistics and p-values of many (dimension, parameter) slices at once.
+
+    Attributes
+    ----------
+        ranks               A float array of shape (dimensions, parameters, problems, algorithms),
+                            NaN where a problem or an algorithm has no value in a slice
+        mean_ranks          A float array of shape (dimensions, parameters, algorithms)
+        statistics          A float array of shape (dimensions, parameters) holding the chi-square statistics
+        p_values            A float array of shape (dimensions, parameters)
+        dimensions          Dimension labels, ordered as the first axis
+        parameters          Parameter labels, ordered as the second axis
+        problems            Problem labels, ordered as the third axis
+        algorithms          Algorithm labels, ordered as the last axis
+        dimension_index     Maps a dimension label to its position on the first axis
+        parameter_index     Maps a parameter label to its position on the second axis
+
+    Methods
+    -------
+        get_ranks(dimension=10, parameter=0):
+            Retrieves the rank of each algorithm for each problem of a single slice.
+        get_mean_ranks(dimension=10, parameter=0):
+            Retrieves the mean rank of each algorithm of a single slice.
+        get_best_algorithm(dimension=10, parameter=0):
+            Retrieves the algorithm with the lowest mean rank of a single slice.
+        get_best_algorithms():
+            Retrieves the algorithm with the lowest mean rank of every slice.
+        to_frame():
+            Retrieves the mean ranks, statistic and p-value of every slice in a single dataframe.
+    """
+
+    def __init__(self, ranks, mean_ranks, statistics, p_values, dimensions, parameters, problems, algorithms):
+        """
+        :param np.ndarray ranks: An array of shape (dimensions, parameters, problems, algorithms)
+        :param np.ndarray mean_ranks: An array of shape (dimensions, parameters, algorithms)
+        :param np.ndarray statistics: An array of shape (dimensions, parameters)
+        :param np.ndarray p_values: An array of shape (dimensions, parameters)
+        :param list dimensions: Dimension labels
+        :param list parameters: Parameter labels
+        :param list problems: Problem labels
+        :param list algorithms: Algorithm labels
+        """
+
+        if ranks.shape != (len(dimensions), len(parameters), len(problems), len(algorithms)):
+            raise ValueError('Labels do not match the shape of the ranks')
+
+        self.ranks = ranks
+        self.mean_ranks = mean_ranks
+        self.statistics = statistics
+        self.p_values = p_values
+        self.dimensions = [int(dimension) for dimension in dimensions]
+        self.parameters = [int(parameter) for parameter in parameters]
+        self.problems = list(problems)
+        self.algorithms = list(algorithms)
+
+        self.dimension_index = {label: index for index, label in enumerate(self.dimensions)}
+        self.parameter_index = {label: index for index, label in enumerate(self.parameters)}
+
+        for values in [self.ranks, self.mean_ranks, self.statistics, self.p_values]:
+            values.flags.writeable = False
+
+    def __get_position(self, dimension, parameter):
+        if int(dimension) not in self.dimension_index:
+            raise ValueError('Invalid dimension value')
+        if int(parameter) not in self.parameter_index:
+            raise ValueError('Invalid parameter value')
+
+        return self.dimension_index[int(dimension)], self.parameter_index[int(parameter)]
+
+    def get_ranks(self, dimension=10, parameter=0):
+        """
+        Retrieves the rank of each algorithm for each problem of a single slice.
+
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: A dataframe with the problems as rows and the ranked algorithms as columns
+        """
+
+        position = self.__get_position(dimension, parameter)
+
+        df = pd.DataFrame(self.ranks[position], index=pd.Index(self.problems, name='Problem'), columns=self.algorithms)
+
+        return df.dropna(how='all', axis=0).dropna(how='all', axis=1)
+
+    def get_mean_ranks(self, dimension=10, parameter=0):
+        """
+        Retrieves the mean rank of each algorithm of a single slice.
+
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: A series of the mean rank of each ranked algorithm
+        """
+
+        position = self.__get_position(dimension, parameter)
+
+        return pd.Series(self.mean_ranks[position], index=self.algorithms).dropna()
+
+    def get_best_algorithm(self, dimension=10, parameter=0):
+        """
+        Retrieves the algorithm with the lowest mean rank of a single slice.
+
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: The best algorithm, the first one in order on ties
+        """
+
+        position = self.__get_position(dimension, parameter)
+
+        return self.algorithms[int(np.nanargmin(self.mean_ranks[position]))]
+
+    def get_best_algorithms(self):
+        """
+        Retrieves the algorithm with the lowest mean rank of every slice.
+
+        :return: A dataframe with the parameters as rows and the dimensions as columns
+        """
+
+        best = np.argmin(np.where(np.isnan(self.mean_ranks), np.inf, self.mean_ranks), axis=-1)
+
+        return pd.DataFrame(np.array(self.algorithms, dtype=object)[best].T,
+                            index=self.parameters, columns=self.dimensions)
+
+    def to_frame(self):
+        """
+        Retrieves the mean ranks, statistic and p-value of every slice in a single dataframe.
+
+        :return: A dataframe indexed by (Dimension, Parameter), with a column for each algorithm's mean rank
+                 in addition to the 'Statistic' and 'P-Value' columns
+        """
+
+        index = pd.MultiIndex.from_product([self.dimensions, self.parameters], names=['Dimension', 'Parameter'])
+
+        df = pd.DataFrame(self.mean_ranks.reshape(-1, len(self.algorithms)), index=index, columns=self.algorithms)
+
+        df['Statistic'] = self.statistics.reshape(-1)
+        df['P-Value'] = self.p_values.reshape(-1)
+
+        return df
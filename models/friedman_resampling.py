@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+
+
+class FriedmanResampling:
+    """
+    Bootstrap and permutation replicates of the Friedman ranking of a single slice.
+
+    Bootstrap replicates resample the problems with replacement and yield the confidence interval of each mean rank,
+    whereas permutation replicates shuffle the ranks within each problem and yield the permutation p-value.
+
+    Attributes
+    ----------
+        mean_ranks              A float array of shape (algorithms,) holding the observed mean ranks
+        bootstrap_mean_ranks    A float array of shape (replicates, algorithms)
+        statistic               The observed chi-square statistic
+        permutation_statistics  A float array of shape (replicates,)
+        confidence              The confidence level of the intervals
+        algorithms              Algorithm labels, ordered as the last axis
+        seed                    The seed the replicates were drawn from
+
+    Methods
+    -------
+        get_confidence_intervals():
+            Retrieves the percentile bootstrap confidence interval of each mean rank.
+        get_best_probabilities():
+            Retrieves how often each algorithm has the lowest mean rank among the bootstrap replicates.
+        get_permutation_p_value():
+            Retrieves the share of permutation replicates whose statistic is at least the observed one.
+    """
+
+    def __init__(self, mean_ranks, bootstrap_mean_ranks, statistic, permutation_statistics, confidence, algorithms,
+                 seed):
+        """
+        :param np.ndarray mean_ranks: An array of shape (algorithms,)
+        :param np.ndarray bootstrap_mean_ranks: An array of shape (replicates, algorithms)
+        :param float statistic: The observed chi-square statistic
+        :param np.ndarray permutation_statistics: An array of shape (replicates,)
+        :param float confidence: The confidence level of the intervals
+        :param list algorithms: Algorithm labels
+        :param int seed: The seed the replicates were drawn from
+        """
+
+        if bootstrap_mean_ranks.shape[1:] != (len(algorithms),) or mean_ranks.shape != (len(algorithms),):
+            raise ValueError('Labels do not match the shape of the mean ranks')
+
+        self.mean_ranks = mean_ranks
+        self.bootstrap_mean_ranks = bootstrap_mean_ranks
+        self.statistic = float(statistic)
+        self.permutation_statistics = permutation_statistics
+        self.confidence = float(confidence)
+        self.algorithms = list(algorithms)
+        self.seed = seed
+
+        for values in [self.mean_ranks, self.bootstrap_mean_ranks, self.permutation_statistics]:
+            values.flags.writeable = False
+
+    def get_confidence_intervals(self):
+        """
+        Retrieves the percentile bootstrap confidence interval of each mean rank.
+
+        :return: A dataframe with the algorithms as rows and the 'CI Lower' and 'CI Upper' columns
+        """
+
+        quantiles = np.quantile(self.bootstrap_mean_ranks, [(1 - self.confidence) / 2, (1 + self.confidence) / 2],
+                                axis=0)
+
+        return pd.DataFrame(quantiles.T, index=self.algorithms, columns=['CI Lower', 'CI Upper'])
+
+    def get_best_probabilities(self):
+        """
+        Retrieves how often each algorithm has the lowest mean rank among the bootstrap replicates.
+
+        :return: A series of the share of replicates each algorithm was the best in, the first one in order on ties
+        """
+
+        best = np.bincount(self.bootstrap_mean_ranks.argmin(axis=-1), minlength=len(self.algorithms))
+
+        return pd.Series(best / len(self.bootstrap_mean_ranks), index=self.algorithms)
+
+    def get_permutation_p_value(self):
+        """
+        Retrieves the share of permutation replicates whose statistic is at least the observed one.
+
+        The observed ranking counts as one of the replicates, hence the p-value is never zero.
+
+        :return: The permutation p-value
+        """
+
+        # Shuffled sums of squares can differ from the observed one in the last digit, hence the relative tolerance
+        extreme = np.sum(self.permutation_statistics >= self.statistic - 1e-12 * abs(self.statistic))
+
+        return (extreme + 1) / (len(self.permutation_statistics) + 1)
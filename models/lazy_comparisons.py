@@ -0,0 +1,121 @@
+import threading
+from collections.abc import Mapping
+
+
+class LazyComparisons(Mapping):
+    """
+    Dictionary of dimensions containing a dictionary of parameters containing dataframes,
+    where each dataframe is only loaded on its first access, then kept for later accesses.
+
+    Attributes
+    ----------
+        __loader            A callable receiving (dimension, parameter) and returning the slice's dataframe
+        __dimensions        The dimensions which can be accessed
+        __parameters        The parameters which can be accessed
+        __slices            Stores the loaded dataframes, shared between the mappings created with as_copies
+        __lock              Guards the loading of the slices
+        __copy              Specify whether each access retrieves a deep copy of the loaded dataframe,
+                            rather than a shallow copy sharing its values
+
+    Methods
+    -------
+        get_slice(dimension, parameter):
+            Retrieves the dataframe of a single slice, loading it on the first access.
+        is_loaded(dimension, parameter):
+            Checks whether a slice was already loaded.
+        as_copies():
+            Retrieves a mapping sharing the loaded slices, which retrieves deep copies on each access.
+    """
+
+    def __init__(self, loader, dimensions, parameters, slices=None, lock=None, copy=False):
+        """
+        :param callable loader: Receives (dimension, parameter) and returns the slice's dataframe
+        :param list dimensions: The dimensions which can be accessed
+        :param list parameters: The parameters which can be accessed
+        :param dict slices: Stores the loaded dataframes, shared with the mapping this one was created from
+        :param threading.Lock lock: Guards the loading of the slices, shared with the mapping this one was created from
+        :param bool copy: Specify whether each access retrieves a deep copy of the loaded dataframe
+        """
+
+        self.__loader = loader
+        self.__dimensions = list(dimensions)
+        self.__parameters = list(parameters)
+        self.__slices = {} if slices is None else slices
+        self.__lock = threading.Lock() if lock is None else lock
+        self.__copy = copy
+
+    def get_slice(self, dimension, parameter):
+        """
+        Retrieves the dataframe of a single slice, loading it on the first access.
+
+        :param int dimension: Specify the desired dimension
+        :param int parameter: Specify the desired parameter
+        :return: A dataframe
+        """
+
+        if dimension not in self.__dimensions or parameter not in self.__parameters:
+            raise KeyError((dimension, parameter))
+
+        key = (int(dimension), int(parameter))
+
+        if key not in self.__slices:
+            with self.__lock:
+                if key not in self.__slices:
+                    self.__slices[key] = self.__loader(dimension, parameter)
+
+        # Even without a deep copy, a shallow copy is handed out, so adding or replacing
+        # a column on the retrieved dataframe never alters the loaded one
+        return self.__slices[key].copy(deep=self.__copy)
+
+    def is_loaded(self, dimension, parameter):
+        """
+        Checks whether a slice was already loaded.
+
+        :param int dimension: Specify the desired dimension
+        :param int parameter: Specify the desired parameter
+        :return: True if the slice is loaded
+        """
+
+        return (int(dimension), int(parameter)) in self.__slices
+
+    def as_copies(self):
+        """
+        Retrieves a mapping sharing the loaded slices, which retrieves deep copies on each access.
+
+        :return: A LazyComparisons
+        """
+
+        return LazyComparisons(self.__loader, self.__dimensions, self.__parameters,
+                               slices=self.__slices, lock=self.__lock, copy=True)
+
+    def __getitem__(self, dimension):
+        if dimension not in self.__dimensions:
+            raise KeyError(dimension)
+
+        return _LazyDimension(self, dimension, self.__parameters)
+
+    def __iter__(self):
+        return iter(self.__dimensions)
+
+    def __len__(self):
+        return len(self.__dimensions)
+
+
+class _LazyDimension(Mapping):
+    """
+    Dictionary of parameters containing dataframes for a single dimension of a LazyComparisons.
+    """
+
+    def __init__(self, comparisons, dimension, parameters):
+        self.__comparisons = comparisons
+        self.__dimension = dimension
+        self.__parameters = parameters
+
+    def __getitem__(self, parameter):
+        return self.__comparisons.get_slice(self.__dimension, parameter)
+
+    def __iter__(self):
+        return iter(self.__parameters)
+
+    def __len__(self):
+        return len(self.__parameters)
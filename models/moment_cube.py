@@ -0,0 +1,127 @@
+import numpy as np
+
+
+class MomentCube:
+    """
+    Running moments of every recorded cell, indexed by algorithm × problem × dimension × parameter.
+
+    Unlike RunCube, the runs themselves are not kept, only their count, mean, M2, minimum and maximum.
+
+    Attributes
+    ----------
+        moments             A RunningMoments of shape (algorithms, problems, dimensions, parameters),
+                            missing cells hold no observation
+        algorithms          Algorithm labels, ordered as the first axis
+        problems            Problem labels, ordered as the second axis
+        dimensions          Dimension labels, ordered as the third axis
+        parameters          Parameter labels, ordered as the fourth axis
+        algorithm_index     Maps an algorithm label to its position on the first axis
+        problem_index       Maps a problem label to its position on the second axis
+        dimension_index     Maps a dimension label to its position on the third axis
+        parameter_index     Maps a parameter label to its position on the fourth axis
+
+    Methods
+    -------
+        get_counts(dimension=10, parameter=0):
+            Retrieves the number of runs for each algorithm and problem.
+        get_means(dimension=10, parameter=0):
+            Retrieves the mean of the runs for each algorithm and problem.
+        get_stds(dimension=10, parameter=0):
+            Calculates the standard deviation of the runs for each algorithm and problem.
+        get_minimums(dimension=10, parameter=0):
+            Retrieves the best run for each algorithm and problem.
+        get_maximums(dimension=10, parameter=0):
+            Retrieves the worst run for each algorithm and problem.
+    """
+
+    def __init__(self, moments, algorithms, problems, dimensions, parameters):
+        """
+        :param RunningMoments moments: Moments of shape (algorithms, problems, dimensions, parameters)
+        :param list algorithms: Algorithm labels
+        :param list problems: Problem labels
+        :param list dimensions: Dimension labels
+        :param list parameters: Parameter labels
+        """
+
+        if moments.count.shape != (len(algorithms), len(problems), len(dimensions), len(parameters)):
+            raise ValueError('Labels do not match the shape of the moments')
+
+        self.moments = moments
+        self.algorithms = list(algorithms)
+        self.problems = [int(problem) for problem in problems]
+        self.dimensions = [int(dimension) for dimension in dimensions]
+        self.parameters = [int(parameter) for parameter in parameters]
+
+        self.algorithm_index = {label: index for index, label in enumerate(self.algorithms)}
+        self.problem_index = {label: index for index, label in enumerate(self.problems)}
+        self.dimension_index = {label: index for index, label in enumerate(self.dimensions)}
+        self.parameter_index = {label: index for index, label in enumerate(self.parameters)}
+
+    def __get_position(self, dimension, parameter):
+        if int(dimension) not in self.dimension_index:
+            raise ValueError('Invalid dimension value')
+        if int(parameter) not in self.parameter_index:
+            raise ValueError('Invalid parameter value')
+
+        return slice(None), slice(None), self.dimension_index[int(dimension)], self.parameter_index[int(parameter)]
+
+    def get_counts(self, dimension=10, parameter=0):
+        """
+        Retrieves the number of runs for each algorithm and problem.
+
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: An int64 array of shape (algorithms, problems)
+        """
+
+        return self.moments.count[self.__get_position(dimension, parameter)]
+
+    def get_means(self, dimension=10, parameter=0):
+        """
+        Retrieves the mean of the runs for each algorithm and problem.
+
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: A float64 array of shape (algorithms, problems), NaN for missing cells
+        """
+
+        return self.moments.mean[self.__get_position(dimension, parameter)]
+
+    def get_stds(self, dimension=10, parameter=0):
+        """
+        Calculates the standard deviation of the runs for each algorithm and problem.
+
+        The population standard deviation is taken, which is what RunCube.get_stds retrieves as well.
+
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: A float64 array of shape (algorithms, problems), NaN for missing cells
+        """
+
+        position = self.__get_position(dimension, parameter)
+        count = self.moments.count[position]
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(count > 0, np.sqrt(self.moments.m2[position] / count), np.nan)
+
+    def get_minimums(self, dimension=10, parameter=0):
+        """
+        Retrieves the best run for each algorithm and problem.
+
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: A float64 array of shape (algorithms, problems), NaN for missing cells
+        """
+
+        return self.moments.minimum[self.__get_position(dimension, parameter)]
+
+    def get_maximums(self, dimension=10, parameter=0):
+        """
+        Retrieves the worst run for each algorithm and problem.
+
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: A float64 array of shape (algorithms, problems), NaN for missing cells
+        """
+
+        return self.moments.maximum[self.__get_position(dimension, parameter)]
@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+
+
+class NemenyiMatrix:
+    """
+    Nemenyi post hoc test of every pair of algorithms, along with the critical difference, of many slices at once.
+
+    Attributes
+    ----------
+        mean_ranks              A float array of shape (dimensions, parameters, algorithms),
+                                NaN where an algorithm was not ranked in a slice
+        p_values                A float array of shape (dimensions, parameters, algorithms, algorithms)
+        critical_differences    A float array of shape (dimensions, parameters)
+        sample_sizes            An integer array of shape (dimensions, parameters) holding the number of ranked problems
+        alpha                   The level of significance of the critical differences
+        dimensions              Dimension labels, ordered as the first axis
+        parameters              Parameter labels, ordered as the second axis
+        algorithms              Algorithm labels, ordered as the last axes
+        dimension_index         Maps a dimension label to its position on the first axis
+        parameter_index         Maps a parameter label to its position on the second axis
+
+    Methods
+    -------
+        get_mean_ranks(dimension=10, parameter=0):
+            Retrieves the mean rank of each ranked algorithm of a single slice.
+        get_p_values(dimension=10, parameter=0):
+            Retrieves the p-value of every pair of ranked algorithms of a single slice.
+        get_critical_difference(dimension=10, parameter=0):
+            Retrieves the critical difference of a single slice.
+        get_cliques(dimension=10, parameter=0):
+            Retrieves the largest groups of algorithms whose mean ranks are within the critical difference.
+        to_frame():
+            Retrieves the p-value of every pair of ranked algorithms of every slice in a long dataframe.
+    """
+
+    def __init__(self, mean_ranks, p_values, critical_differences, sample_sizes, alpha, dimensions, parameters,
+                 algorithms):
+        """
+        :param np.ndarray mean_ranks: An array of shape (dimensions, parameters, algorithms)
+        :param np.ndarray p_values: An array of shape (dimensions, parameters, algorithms, algorithms)
+        :param np.ndarray critical_differences: An array of shape (dimensions, parameters)
+        :param np.ndarray sample_sizes: An array of shape (dimensions, parameters)
+        :param float alpha: The level of significance of the critical differences
+        :param list dimensions: Dimension labels
+        :param list parameters: Parameter labels
+        :param list algorithms: Algorithm labels
+        """
+
+        if p_values.shape != (len(dimensions), len(parameters), len(algorithms), len(algorithms)):
+            raise ValueError('Labels do not match the shape of the p-values')
+
+        self.mean_ranks = mean_ranks
+        self.p_values = p_values
+        self.critical_differences = critical_differences
+        self.sample_sizes = sample_sizes
+        self.alpha = float(alpha)
+        self.dimensions = [int(dimension) for dimension in dimensions]
+        self.parameters = [int(parameter) for parameter in parameters]
+        self.algorithms = list(algorithms)
+
+        self.dimension_index = {label: index for index, label in enumerate(self.dimensions)}
+        self.parameter_index = {label: index for index, label in enumerate(self.parameters)}
+
+        for values in [self.mean_ranks, self.p_values, self.critical_differences, self.sample_sizes]:
+            values.flags.writeable = False
+
+    def __get_position(self, dimension, parameter):
+        if int(dimension) not in self.dimension_index:
+            raise ValueError('Invalid dimension value')
+        if int(parameter) not in self.parameter_index:
+            raise ValueError('Invalid parameter value')
+
+        return self.dimension_index[int(dimension)], self.parameter_index[int(parameter)]
+
+    def get_mean_ranks(self, dimension=10, parameter=0):
+        """
+        Retrieves the mean rank of each ranked algorithm of a single slice.
+
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: A series of the mean rank of each ranked algorithm
+        """
+
+        mean_ranks = pd.Series(self.mean_ranks[self.__get_position(dimension, parameter)], index=self.algorithms)
+
+        return mean_ranks.dropna()
+
+    def get_p_values(self, dimension=10, parameter=0):
+        """
+        Retrieves the p-value of every pair of ranked algorithms of a single slice.
+
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: A dataframe with the ranked algorithms as both rows and columns
+        """
+
+        position = self.__get_position(dimension, parameter)
+        ranked = ~np.isnan(self.mean_ranks[position])
+        labels = [algorithm for algorithm, is_ranked in zip(self.algorithms, ranked) if is_ranked]
+
+        return pd.DataFrame(self.p_values[position][np.ix_(ranked, ranked)], index=labels, columns=labels)
+
+    def get_critical_difference(self, dimension=10, parameter=0):
+        """
+        Retrieves the critical difference of a single slice.
+
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: The smallest difference of mean ranks deemed significant at 'alpha'
+        """
+
+        return float(self.critical_differences[self.__get_position(dimension, parameter)])
+
+    def get_cliques(self, dimension=10, parameter=0):
+        """
+        Retrieves the largest groups of algorithms whose mean ranks are within the critical difference.
+
+        These are the groups joined by a bar in a critical difference diagram, none of them holds another one.
+
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: A list of lists of at least two algorithms, each ordered by mean rank
+        """
+
+        mean_ranks = self.get_mean_ranks(dimension=dimension, parameter=parameter).sort_values(kind='stable')
+        critical_difference = self.get_critical_difference(dimension=dimension, parameter=parameter)
+
+        values = mean_ranks.to_numpy()
+        ends = np.searchsorted(values, values + critical_difference, side='right')
+
+        cliques = []
+        last_end = 0
+
+        # A group ending no further than the previous one is held by it
+        for start, end in enumerate(ends):
+            if end - start > 1 and end > last_end:
+                cliques.append(mean_ranks.index[start:end].to_list())
+                last_end = end
+
+        return cliques
+
+    def to_frame(self):
+        """
+        Retrieves the p-value of every pair of ranked algorithms of every slice in a long dataframe.
+
+        :return: A dataframe indexed by (Dimension, Parameter, Algorithm, Opponent) with the 'P-Value' column,
+                 pairs involving an algorithm which was not ranked are left out
+        """
+
+        index = pd.MultiIndex.from_product([self.dimensions, self.parameters, self.algorithms, self.algorithms],
+                                           names=['Dimension', 'Parameter', 'Algorithm', 'Opponent'])
+
+        return pd.DataFrame({'P-Value': self.p_values.reshape(-1)}, index=index).dropna()
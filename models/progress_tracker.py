@@ -0,0 +1,204 @@
+import sys
+import threading
+import time
+
+
+class ProgressTracker:
+    """
+    Progress of a single loop, which may be updated concurrently, along with its measured throughput.
+
+    The throughput (items and bytes per second) is measured from the start of the loop, and the ETA extrapolates it to
+    the remaining items, hence no duration per item is assumed. Updates are guarded by a lock, hence threads can
+    update the same tracker; process pools update it from the parent process, as their results come back.
+    Each update is handed to the callbacks, and printed to the standard error stream at most once per interval,
+    unless the tracker is quiet.
+
+    Attributes
+    ----------
+        total               The number of items to process
+        description         Describes the processed items, e.g. 'Reading raw files'
+        __callbacks         Receive the snapshot of each update
+        __quiet             Specify whether nothing is printed
+        __interval          The minimum number of seconds between two printed lines
+        __processed         Counts the processed items
+        __bytes             Counts the processed bytes
+        __start             The time the tracker was created at
+        __last_printed      The time the last line was printed at, None if no line was printed yet
+        __reported          The processed items of the last snapshot handed to the callbacks, None if none was yet
+        __printed           The processed items of the last printed line, None if no line was printed yet
+        __closed            Specify whether the loop is over
+        __lock              Guards the counters, since they may be updated from several threads
+
+    Methods
+    -------
+        __enter__():
+            Retrieves the tracker, hence it is closed once the enclosed loop is over.
+        __exit__(exc_type, exc_value, traceback):
+            Closes the tracker.
+        update(items=1, size=0):
+            Counts newly processed items and bytes, then reports the progress.
+        get_snapshot():
+            Retrieves the progress and the measured throughput.
+        format(snapshot):
+            Formats a snapshot into a single line.
+        __report(snapshot, force=False, notify=True):
+            Hands a snapshot to the callbacks, and prints it if the interval elapsed.
+        close():
+            Reports the final progress, unless already reported, further updates are ignored.
+    """
+
+    def __init__(self, total, description='', callbacks=None, quiet=False, interval=0.5):
+        """
+        :param int total: The number of items to process
+        :param str description: Describes the processed items
+        :param list callbacks: Receive the snapshot of each update, as returned by get_snapshot
+        :param bool quiet: Specify whether nothing is printed, the callbacks are still called
+        :param float interval: The minimum number of seconds between two printed lines
+        """
+
+        if not isinstance(total, int) or total < 0:
+            raise ValueError('total must be a non-negative integer')
+
+        self.total = total
+        self.description = description
+        self.__callbacks = list(callbacks or [])
+        self.__quiet = quiet
+        self.__interval = interval
+        self.__processed = 0
+        self.__bytes = 0
+        self.__start = time.perf_counter()
+        self.__last_printed = None
+        self.__reported = None
+        self.__printed = None
+        self.__closed = False
+        self.__lock = threading.Lock()
+
+    def __enter__(self):
+        """
+        Retrieves the tracker, hence it is closed once the enclosed loop is over.
+
+        :return: The tracker
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Closes the tracker.
+        """
+
+        self.close()
+
+    def update(self, items=1, size=0):
+        """
+        Counts newly processed items and bytes, then reports the progress.
+
+        :param int items: Specify the number of newly processed items
+        :param int size: Specify the number of newly processed bytes
+        :return: The snapshot of the progress
+        """
+
+        if not isinstance(items, int) or items < 0:
+            raise ValueError('items must be a non-negative integer')
+
+        with self.__lock:
+            if self.__closed:
+                return self.get_snapshot()
+
+            if self.__processed + items > self.total:
+                raise ValueError('processed items cannot be greater than total')
+
+            self.__processed += items
+            self.__bytes += size
+
+            snapshot = self.get_snapshot()
+            self.__report(snapshot)
+
+        return snapshot
+
+    def get_snapshot(self):
+        """
+        Retrieves the progress and the measured throughput.
+
+        :return: A dictionary of the 'description', 'processed', 'total', 'bytes', elapsed 'seconds',
+                 'items_per_second', 'bytes_per_second' and 'eta' in seconds (None until an item is processed)
+        """
+
+        seconds = time.perf_counter() - self.__start
+        processed = self.__processed
+
+        items_per_second = processed / seconds if seconds > 0 else 0.
+        bytes_per_second = self.__bytes / seconds if seconds > 0 else 0.
+        eta = (self.total - processed) / items_per_second if items_per_second > 0 else None
+
+        return {'description': self.description, 'processed': processed, 'total': self.total, 'bytes': self.__bytes,
+                'seconds': seconds, 'items_per_second': items_per_second, 'bytes_per_second': bytes_per_second,
+                'eta': eta}
+
+    @staticmethod
+    def format(snapshot):
+        """
+        Formats a snapshot into a single line.
+
+        :param dict snapshot: Specify a snapshot, as returned by get_snapshot
+        :return: A string denoting the progress, e.g. 'Reading raw files  960/1920  50.00%  120.5 items/s  ...'
+        """
+
+        total = snapshot['total']
+        percent = snapshot['processed'] / total * 100 if total else 100.
+
+        line = f'{snapshot["processed"]}/{total}\t\t{percent:.2f}%\t\t{snapshot["items_per_second"]:.1f} items/s'
+
+        if snapshot['bytes']:
+            line += f'\t\t{snapshot["bytes_per_second"] / 1048576:.2f} MiB/s'
+
+        line += '\t\tETA: ' + ('-' if snapshot['eta'] is None else f'{snapshot["eta"]:.2f} second(s)')
+
+        return f'{snapshot["description"]}\t\t{line}' if snapshot['description'] else line
+
+    def __report(self, snapshot, force=False, notify=True):
+        """
+        Hands a snapshot to the callbacks, and prints it if the interval elapsed.
+
+        :param dict snapshot: Specify the snapshot
+        :param bool force: Specify whether to print regardless of the interval
+        :param bool notify: Specify whether to hand the snapshot to the callbacks
+        """
+
+        if notify:
+            for callback in self.__callbacks:
+                callback(snapshot)
+
+            self.__reported = snapshot['processed']
+
+        if self.__quiet:
+            return
+
+        now = time.perf_counter()
+
+        if force or self.__last_printed is None or now - self.__last_printed >= self.__interval:
+            self.__last_printed = now
+            self.__printed = snapshot['processed']
+            print(ProgressTracker.format(snapshot), file=sys.stderr)
+
+    def close(self):
+        """
+        Reports the final progress, unless already reported, further updates are ignored.
+
+        The last update of a completed loop usually reported its whole progress already, in which case neither the
+        callbacks nor the printed lines receive it twice.
+
+        :return: The final snapshot of the progress
+        """
+
+        with self.__lock:
+            snapshot = self.get_snapshot()
+
+            if not self.__closed:
+                self.__closed = True
+
+                # The line of the whole progress may still be held back by the interval
+                if self.__reported != self.total or self.__printed != self.total:
+                    self.__report(snapshot, force=True, notify=self.__reported != self.total)
+
+        return snapshot
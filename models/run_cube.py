@@ -0,0 +1,157 @@
+import numpy as np
+
+
+class RunCube:
+    """
+    Dense store of every recorded run, indexed by algorithm × problem × dimension × parameter × run.
+
+    Attributes
+    ----------
+        values              A float array of shape (algorithms, problems, dimensions, parameters, runs),
+                            missing cells are filled with NaN
+        algorithms          Algorithm labels, ordered as the first axis
+        problems            Problem labels, ordered as the second axis
+        dimensions          Dimension labels, ordered as the third axis
+        parameters          Parameter labels, ordered as the fourth axis
+        algorithm_index     Maps an algorithm label to its position on the first axis
+        problem_index       Maps a problem label to its position on the second axis
+        dimension_index     Maps a dimension label to its position on the third axis
+        parameter_index     Maps a parameter label to its position on the fourth axis
+
+    Methods
+    -------
+        select(algorithms):
+            Retrieves a cube holding only the provided algorithms.
+        get_slice(dimension=10, parameter=0):
+            Retrieves a view of every run for a given dimension and parameter.
+        get_runs(algorithm, problem, dimension=10, parameter=0):
+            Retrieves a view of the runs of a single cell.
+        get_available():
+            Retrieves a mask of the (algorithm, problem, dimension) cells holding at least one run.
+        get_means(dimension=10, parameter=0):
+            Calculates the mean of the runs for each algorithm and problem.
+        get_stds(dimension=10, parameter=0):
+            Calculates the standard deviation of the runs for each algorithm and problem.
+    """
+
+    def __init__(self, values, algorithms, problems, dimensions, parameters):
+        """
+        :param np.ndarray values: An array of shape (algorithms, problems, dimensions, parameters, runs)
+        :param list algorithms: Algorithm labels
+        :param list problems: Problem labels
+        :param list dimensions: Dimension labels
+        :param list parameters: Parameter labels
+        """
+
+        if values.shape[:4] != (len(algorithms), len(problems), len(dimensions), len(parameters)):
+            raise ValueError('Labels do not match the shape of the values')
+
+        self.values = values
+        self.algorithms = list(algorithms)
+        self.problems = [int(problem) for problem in problems]
+        self.dimensions = [int(dimension) for dimension in dimensions]
+        self.parameters = [int(parameter) for parameter in parameters]
+
+        self.algorithm_index = {label: index for index, label in enumerate(self.algorithms)}
+        self.problem_index = {label: index for index, label in enumerate(self.problems)}
+        self.dimension_index = {label: index for index, label in enumerate(self.dimensions)}
+        self.parameter_index = {label: index for index, label in enumerate(self.parameters)}
+
+    def __get_position(self, dimension, parameter):
+        if int(dimension) not in self.dimension_index:
+            raise ValueError('Invalid dimension value')
+        if int(parameter) not in self.parameter_index:
+            raise ValueError('Invalid parameter value')
+
+        return self.dimension_index[int(dimension)], self.parameter_index[int(parameter)]
+
+    def select(self, algorithms):
+        """
+        Retrieves a cube holding only the provided algorithms.
+
+        :param list algorithms: Specify the desired algorithms (must be within 'algorithms')
+        :return: A RunCube sharing the labels of the other axes
+        """
+
+        positions = [self.algorithm_index[algorithm] for algorithm in algorithms]
+
+        return RunCube(self.values[positions], algorithms, self.problems, self.dimensions, self.parameters)
+
+    def get_slice(self, dimension=10, parameter=0):
+        """
+        Retrieves a view of every run for a given dimension and parameter.
+
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: A view of shape (algorithms, problems, runs)
+        """
+
+        dimension_position, parameter_position = self.__get_position(dimension, parameter)
+
+        return self.values[:, :, dimension_position, parameter_position, :]
+
+    def get_runs(self, algorithm, problem, dimension=10, parameter=0):
+        """
+        Retrieves a view of the runs of a single cell.
+
+        :param str algorithm: Specify the desired algorithm (must be within 'algorithms')
+        :param int problem: Specify the desired problem (must be within 'problems')
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: A view of shape (runs,)
+        """
+
+        dimension_position, parameter_position = self.__get_position(dimension, parameter)
+
+        return self.values[self.algorithm_index[algorithm], self.problem_index[int(problem)],
+                           dimension_position, parameter_position, :]
+
+    def get_available(self):
+        """
+        Retrieves a mask of the (algorithm, problem, dimension) cells holding at least one run.
+
+        :return: A boolean array of shape (algorithms, problems, dimensions)
+        """
+
+        return ~np.isnan(self.values[:, :, :, 0, :]).all(axis=-1)
+
+    def get_means(self, dimension=10, parameter=0):
+        """
+        Calculates the mean of the runs for each algorithm and problem.
+
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: A float64 array of shape (algorithms, problems), NaN for missing cells
+        """
+
+        # Summing along the leading axis accumulates the runs one after the other, just as pandas did when
+        # reducing the raw dataframes, which keeps the published means identical to the last digit
+        runs = np.ascontiguousarray(np.moveaxis(self.get_slice(dimension, parameter), -1, 0), dtype=np.float64)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.nansum(runs, axis=0) / (~np.isnan(runs)).sum(axis=0)
+
+    def get_stds(self, dimension=10, parameter=0):
+        """
+        Calculates the standard deviation of the runs for each algorithm and problem.
+
+        The deviation is taken over the runs and their appended mean, just as the legacy raw dataframes did,
+        which is equivalent to the population standard deviation of the runs.
+
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: A float64 array of shape (algorithms, problems), NaN for missing cells
+        """
+
+        means = self.get_means(dimension=dimension, parameter=parameter)
+
+        # The runs and their mean are reduced along the contiguous axis, matching pandas' summation order
+        runs = np.concatenate([self.get_slice(dimension, parameter), means[..., None]], axis=-1)
+        runs = runs.astype(np.float64, copy=False)
+        count = (~np.isnan(runs)).sum(axis=-1)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            centre = np.nansum(runs, axis=-1) / count
+            variance = np.nansum((centre[..., None] - runs) ** 2, axis=-1) / (count - 1)
+
+        return np.where(count > 1, np.sqrt(variance), np.nan)
@@ -0,0 +1,170 @@
+import numpy as np
+
+
+class RunningMoments:
+    """
+    Running count, mean, sum of squared deviations (M2), minimum and maximum of many cells, updated in a single pass.
+
+    Observations are folded in one chunk at a time, and two sets of moments are combined with Chan's parallel
+    update, hence the observations themselves never have to be held in memory.
+
+    Attributes
+    ----------
+        count               An int64 array holding the number of observations of each cell
+        mean                A float64 array holding the mean of each cell, NaN for empty cells
+        m2                  A float64 array holding the sum of squared deviations from the mean of each cell
+        minimum             A float64 array holding the smallest observation of each cell, NaN for empty cells
+        maximum             A float64 array holding the largest observation of each cell, NaN for empty cells
+        __attributes        The names of the arrays holding the moments
+
+    Methods
+    -------
+        update(values):
+            Folds a chunk of observations into the moments, NaN observations are ignored.
+        merge(other):
+            Folds the moments of another set of observations of the same cells into the moments.
+        get_variance(ddof=0):
+            Calculates the variance of each cell.
+        get_std(ddof=0):
+            Calculates the standard deviation of each cell.
+        __getitem__(position):
+            Retrieves the moments of the cells at a position.
+        assign(position, other):
+            Overwrites the moments of the cells at a position with the moments of another set of cells.
+        stack(moments):
+            Joins the moments of several sets of cells along a new leading axis.
+    """
+
+    __attributes = ['count', 'mean', 'm2', 'minimum', 'maximum']
+
+    def __init__(self, shape=()):
+        """
+        :param tuple shape: The shape of the cells, each cell holds its own moments
+        """
+
+        self.count = np.zeros(shape, dtype=np.int64)
+        self.mean = np.full(shape, np.nan)
+        self.m2 = np.zeros(shape)
+        self.minimum = np.full(shape, np.nan)
+        self.maximum = np.full(shape, np.nan)
+
+    def __combine(self, count, mean, m2, minimum, maximum):
+        total = self.count + count
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = mean - self.mean
+            combined_mean = np.where(self.count == 0, mean, self.mean + delta * (count / total))
+            combined_m2 = np.where(self.count == 0, m2, self.m2 + m2 + delta ** 2 * (self.count * count / total))
+
+        empty = count == 0
+
+        self.mean = np.where(empty, self.mean, combined_mean)
+        self.m2 = np.where(empty, self.m2, combined_m2)
+        self.minimum = np.fmin(self.minimum, minimum)
+        self.maximum = np.fmax(self.maximum, maximum)
+        self.count = total
+
+    def update(self, values):
+        """
+        Folds a chunk of observations into the moments, NaN observations are ignored.
+
+        :param np.ndarray values: An array of shape (*shape, observations)
+        """
+
+        values = np.asarray(values, dtype=np.float64)
+
+        if values.shape[:-1] != self.count.shape:
+            raise ValueError('Values do not match the shape of the moments')
+
+        if values.shape[-1] == 0:
+            return
+
+        count = (~np.isnan(values)).sum(axis=-1)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.nansum(values, axis=-1) / count
+            m2 = np.nansum((values - mean[..., None]) ** 2, axis=-1)
+
+        # fmin/fmax skip the NaN observations, just as the NaN initial values of empty cells
+        minimum = np.fmin.reduce(values, axis=-1)
+        maximum = np.fmax.reduce(values, axis=-1)
+
+        self.__combine(count, mean, m2, minimum, maximum)
+
+    def merge(self, other):
+        """
+        Folds the moments of another set of observations of the same cells into the moments.
+
+        :param RunningMoments other: Specify the other moments, must share the same shape
+        """
+
+        if other.count.shape != self.count.shape:
+            raise ValueError('Moments do not share the same shape')
+
+        self.__combine(other.count, other.mean, other.m2, other.minimum, other.maximum)
+
+    def get_variance(self, ddof=0):
+        """
+        Calculates the variance of each cell.
+
+        :param int ddof: Specify the delta degrees of freedom, 0 retrieves the population variance
+        :return: A float64 array, NaN for cells holding no more than ddof observations
+        """
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > ddof, self.m2 / (self.count - ddof), np.nan)
+
+    def get_std(self, ddof=0):
+        """
+        Calculates the standard deviation of each cell.
+
+        :param int ddof: Specify the delta degrees of freedom, 0 retrieves the population standard deviation
+        :return: A float64 array, NaN for cells holding no more than ddof observations
+        """
+
+        return np.sqrt(self.get_variance(ddof=ddof))
+
+    def __getitem__(self, position):
+        """
+        Retrieves the moments of the cells at a position.
+
+        :param tuple position: Specify the position, any index accepted by numpy
+        :return: A RunningMoments holding the moments of the selected cells
+        """
+
+        selected = RunningMoments()
+
+        for attribute in RunningMoments.__attributes:
+            setattr(selected, attribute, getattr(self, attribute)[position])
+
+        return selected
+
+    def assign(self, position, other):
+        """
+        Overwrites the moments of the cells at a position with the moments of another set of cells.
+
+        :param tuple position: Specify the position, any index accepted by numpy
+        :param RunningMoments other: Specify the moments, must match the shape of the cells at the position
+        """
+
+        for attribute in RunningMoments.__attributes:
+            getattr(self, attribute)[position] = getattr(other, attribute)
+
+    @staticmethod
+    def stack(moments):
+        """
+        Joins the moments of several sets of cells along a new leading axis.
+
+        :param list moments: Specify the moments, must share the same shape
+        :return: A RunningMoments of shape (len(moments), *shape)
+        """
+
+        if not moments:
+            return RunningMoments((0,))
+
+        stacked = RunningMoments()
+
+        for attribute in RunningMoments.__attributes:
+            setattr(stacked, attribute, np.stack([getattr(moment, attribute) for moment in moments]))
+
+        return stacked
@@ -0,0 +1,160 @@
+import os
+
+import pandas as pd
+
+
+class SweepResults:
+    """
+    Results of every analysis over every swept (dimension, parameter) slice.
+
+    Attributes
+    ----------
+        results             A dictionary of (dimension, parameter) tuples containing a dictionary of analyses
+                            and their result, {(int, int): {str: object}}
+        analyses            The analyses which were run on each slice
+        dimensions          The swept dimensions
+        parameters          The swept parameters
+
+    Methods
+    -------
+        get(analysis, dimension=10, parameter=0):
+            Retrieves the result of a single analysis on a single slice.
+        get_best_algorithms():
+            Retrieves the best algorithm of every slice.
+        get_friedman_tests():
+            Retrieves the ranking, statistic and p-value of every slice.
+        get_wilcoxon_tests():
+            Retrieves the Wilcoxon test of every slice.
+        get_post_hoc_tests():
+            Retrieves the post hoc tests of every slice.
+        get_algorithms_comparisons_wtl():
+            Retrieves the w/t/l footer of every slice, as obtained from the raw iterations.
+        to_frames():
+            Retrieves each analysis over every slice as a single dataframe.
+        save(directory):
+            Exports each analysis over every slice into a CSV file.
+    """
+
+    def __init__(self, results, analyses, dimensions, parameters):
+        """
+        :param dict results: A dictionary of (dimension, parameter) tuples containing a dictionary of analyses
+        :param list analyses: The analyses which were run on each slice
+        :param list dimensions: The swept dimensions
+        :param list parameters: The swept parameters
+        """
+
+        self.results = results
+        self.analyses = list(analyses)
+        self.dimensions = [int(dimension) for dimension in dimensions]
+        self.parameters = [int(parameter) for parameter in parameters]
+
+    def get(self, analysis, dimension=10, parameter=0):
+        """
+        Retrieves the result of a single analysis on a single slice.
+
+        :param str analysis: Specify the desired analysis (must be within 'analyses')
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: The result, as returned from its NonParametricTestsProvider method
+        """
+
+        if analysis not in self.analyses:
+            raise ValueError('Invalid analysis value')
+        if (int(dimension), int(parameter)) not in self.results:
+            raise ValueError('Invalid dimension or parameter value')
+
+        return self.results[(int(dimension), int(parameter))][analysis]
+
+    def __concat(self, analysis):
+        if analysis not in self.analyses:
+            raise ValueError('Invalid analysis value')
+
+        frames = {key: self.results[key][analysis] for key in sorted(self.results)}
+
+        return pd.concat(frames, names=['Dimension', 'Parameter'])
+
+    def get_best_algorithms(self):
+        """
+        Retrieves the best algorithm of every slice.
+
+        :return: A dataframe with the parameters as rows and the dimensions as columns
+        """
+
+        if 'best' not in self.analyses:
+            raise ValueError('Invalid analysis value')
+
+        best = {(dimension, parameter): result['best'] for (dimension, parameter), result in self.results.items()}
+
+        return pd.Series(best).unstack(level=0).reindex(index=self.parameters, columns=self.dimensions)
+
+    def get_friedman_tests(self):
+        """
+        Retrieves the ranking, statistic and p-value of every slice.
+
+        :return: A dataframe indexed by (Dimension, Parameter), with a column for each algorithm's mean rank
+                 in addition to the 'P-Value' and 'Statistic' columns
+        """
+
+        df = self.__concat('friedman').unstack(level=-1)
+
+        # Unstacking sorts the columns, hence they are put back in the order of the rankings
+        columns = list(dict.fromkeys(label
+                                     for result in self.results.values()
+                                     for label in result['friedman'].index))
+
+        return df[columns]
+
+    def get_wilcoxon_tests(self):
+        """
+        Retrieves the Wilcoxon test of every slice.
+
+        :return: A dataframe indexed by (Dimension, Parameter, Algorithm)
+        """
+
+        return self.__concat('wilcoxon')
+
+    def get_post_hoc_tests(self):
+        """
+        Retrieves the post hoc tests of every slice.
+
+        :return: A dataframe indexed by (Dimension, Parameter, Algorithm)
+        """
+
+        return self.__concat('post_hoc')
+
+    def get_algorithms_comparisons_wtl(self):
+        """
+        Retrieves the w/t/l footer of every slice, as obtained from the raw iterations.
+
+        :return: A dataframe indexed by (Dimension, Parameter), with a column for each algorithm
+        """
+
+        return self.__concat('wtl_mannwhitneyu').xs('w/t/l', level=-1)
+
+    def to_frames(self):
+        """
+        Retrieves each analysis over every slice as a single dataframe.
+
+        :return: A dictionary of analyses and their dataframe
+        """
+
+        getters = {'best': self.get_best_algorithms,
+                   'friedman': self.get_friedman_tests,
+                   'wilcoxon': self.get_wilcoxon_tests,
+                   'post_hoc': self.get_post_hoc_tests,
+                   'wtl_mannwhitneyu': self.get_algorithms_comparisons_wtl}
+
+        return {analysis: getters[analysis]() for analysis in self.analyses}
+
+    def save(self, directory):
+        """
+        Exports each analysis over every slice into a CSV file.
+
+        :param str directory: Specify the destination directory, created if it does not exist
+        """
+
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        for analysis, df in self.to_frames().items():
+            df.to_csv(f'{directory}/{analysis}.csv')
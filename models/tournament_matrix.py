@@ -0,0 +1,208 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+
+class TournamentMatrix:
+    """
+    Pairwise Mann–Whitney U tournament of every pair of algorithms, tallied over the problems of many slices.
+
+    Entry (d, p, i, j) counts how many problems the i-th algorithm won, tied and lost against the j-th algorithm,
+    stored along the last axis as (win, tie, lose).
+
+    Attributes
+    ----------
+        results             An uint16 array of shape (dimensions, parameters, algorithms, algorithms, 3)
+        alpha               The level of significance the tournament was held at
+        dimensions          Dimension labels, ordered as the first axis
+        parameters          Parameter labels, ordered as the second axis
+        algorithms          Algorithm labels, ordered as the third and the fourth axes
+        dimension_index     Maps a dimension label to its position on the first axis
+        parameter_index     Maps a parameter label to its position on the second axis
+        algorithm_index     Maps an algorithm label to its position on the third and the fourth axes
+
+    Methods
+    -------
+        get_wins(dimension=10, parameter=0):
+            Retrieves how many problems each algorithm won against each other algorithm.
+        get_ties(dimension=10, parameter=0):
+            Retrieves how many problems each algorithm tied with each other algorithm.
+        get_losses(dimension=10, parameter=0):
+            Retrieves how many problems each algorithm lost against each other algorithm.
+        get_pair(algorithm, other_algorithm, dimension=10, parameter=0):
+            Retrieves the win/tie/lose of an algorithm against another one.
+        get_wtl(dimension=10, parameter=0):
+            Retrieves the 'win/tie/lose' of each algorithm against each other algorithm.
+        get_dominance():
+            Retrieves the wins minus the losses of each algorithm over every opponent and slice.
+        to_frame():
+            Retrieves every tally in a long dataframe, suitable to be exported.
+        save(path):
+            Exports the tournament into a compressed '.npz' file.
+        load(path):
+            Imports a tournament exported with save.
+    """
+
+    def __init__(self, results, alpha, dimensions, parameters, algorithms):
+        """
+        :param np.ndarray results: An integer array of shape (dimensions, parameters, algorithms, algorithms, 3)
+        :param float alpha: The level of significance the tournament was held at
+        :param list dimensions: Dimension labels
+        :param list parameters: Parameter labels
+        :param list algorithms: Algorithm labels
+        """
+
+        if results.shape != (len(dimensions), len(parameters), len(algorithms), len(algorithms), 3):
+            raise ValueError('Labels do not match the shape of the results')
+
+        self.results = results.astype(np.uint16, copy=False)
+        self.alpha = float(alpha)
+        self.dimensions = [int(dimension) for dimension in dimensions]
+        self.parameters = [int(parameter) for parameter in parameters]
+        self.algorithms = list(algorithms)
+
+        self.dimension_index = {label: index for index, label in enumerate(self.dimensions)}
+        self.parameter_index = {label: index for index, label in enumerate(self.parameters)}
+        self.algorithm_index = {label: index for index, label in enumerate(self.algorithms)}
+
+        self.results.flags.writeable = False
+
+    def __get_position(self, dimension, parameter):
+        if int(dimension) not in self.dimension_index:
+            raise ValueError('Invalid dimension value')
+        if int(parameter) not in self.parameter_index:
+            raise ValueError('Invalid parameter value')
+
+        return self.dimension_index[int(dimension)], self.parameter_index[int(parameter)]
+
+    def __get_outcome(self, outcome, dimension, parameter):
+        position = self.__get_position(dimension, parameter)
+
+        return pd.DataFrame(self.results[position][..., outcome], index=self.algorithms, columns=self.algorithms)
+
+    def get_wins(self, dimension=10, parameter=0):
+        """
+        Retrieves how many problems each algorithm won against each other algorithm.
+
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: A dataframe with the algorithms as rows and their opponents as columns
+        """
+
+        return self.__get_outcome(0, dimension, parameter)
+
+    def get_ties(self, dimension=10, parameter=0):
+        """
+        Retrieves how many problems each algorithm tied with each other algorithm.
+
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: A dataframe with the algorithms as rows and their opponents as columns
+        """
+
+        return self.__get_outcome(1, dimension, parameter)
+
+    def get_losses(self, dimension=10, parameter=0):
+        """
+        Retrieves how many problems each algorithm lost against each other algorithm.
+
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: A dataframe with the algorithms as rows and their opponents as columns
+        """
+
+        return self.__get_outcome(2, dimension, parameter)
+
+    def get_pair(self, algorithm, other_algorithm, dimension=10, parameter=0):
+        """
+        Retrieves the win/tie/lose of an algorithm against another one.
+
+        :param str algorithm: Specify the algorithm (must be within 'algorithms')
+        :param str other_algorithm: Specify its opponent (must be within 'algorithms')
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: A (win, tie, lose) tuple
+        """
+
+        position = self.__get_position(dimension, parameter)
+        results = self.results[position][self.algorithm_index[algorithm], self.algorithm_index[other_algorithm]]
+
+        return tuple(int(result) for result in results)
+
+    def get_wtl(self, dimension=10, parameter=0):
+        """
+        Retrieves the 'win/tie/lose' of each algorithm against each other algorithm.
+
+        :param int dimension: Specify the desired dimension (must be within 'dimensions')
+        :param int parameter: Specify the desired parameter (must be within 'parameters')
+        :return: A dataframe of strings with the algorithms as rows and their opponents as columns
+        """
+
+        position = self.__get_position(dimension, parameter)
+        results = self.results[position].astype(str)
+
+        wtl = np.char.add(np.char.add(np.char.add(results[..., 0], '/'), np.char.add(results[..., 1], '/')),
+                          results[..., 2])
+
+        return pd.DataFrame(wtl, index=self.algorithms, columns=self.algorithms)
+
+    def get_dominance(self):
+        """
+        Retrieves the wins minus the losses of each algorithm over every opponent and slice.
+
+        :return: A dataframe with the parameters as rows, the dimensions as columns, and the algorithms as
+                 the inner level of the columns
+        """
+
+        results = self.results.astype(np.int64)
+        dominance = results[..., 0].sum(axis=-1) - results[..., 2].sum(axis=-1)
+
+        columns = pd.MultiIndex.from_product([self.dimensions, self.algorithms], names=['Dimension', 'Algorithm'])
+
+        return pd.DataFrame(dominance.transpose(1, 0, 2).reshape(len(self.parameters), -1),
+                            index=pd.Index(self.parameters, name='Parameter'), columns=columns)
+
+    def to_frame(self):
+        """
+        Retrieves every tally in a long dataframe, suitable to be exported.
+
+        :return: A dataframe indexed by (Dimension, Parameter, Algorithm, Opponent) with the 'win', 'tie'
+                 and 'lose' columns, pairs which were never compared are left out
+        """
+
+        index = pd.MultiIndex.from_product([self.dimensions, self.parameters, self.algorithms, self.algorithms],
+                                           names=['Dimension', 'Parameter', 'Algorithm', 'Opponent'])
+
+        df = pd.DataFrame(self.results.reshape(-1, 3), index=index, columns=['win', 'tie', 'lose'])
+
+        return df[df.sum(axis=1) > 0]
+
+    def save(self, path):
+        """
+        Exports the tournament into a compressed '.npz' file.
+
+        :param str path: Specify the destination path
+        """
+
+        labels = {'alpha': self.alpha,
+                  'dimensions': self.dimensions,
+                  'parameters': self.parameters,
+                  'algorithms': self.algorithms}
+
+        np.savez_compressed(path, results=self.results, labels=np.array(json.dumps(labels)))
+
+    @staticmethod
+    def load(path):
+        """
+        Imports a tournament exported with save.
+
+        :param str path: Specify the path of the '.npz' file
+        :return: A TournamentMatrix
+        """
+
+        with np.load(path) as archive:
+            labels = json.loads(str(archive['labels']))
+
+            return TournamentMatrix(archive['results'], labels['alpha'],
+                                    labels['dimensions'], labels['parameters'], labels['algorithms'])
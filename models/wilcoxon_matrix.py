@@ -0,0 +1,105 @@
+import pandas as pd
+
+
+class WilcoxonMatrix:
+    """
+    Wilcoxon signed-rank test results of every pair of algorithms of a single slice.
+
+    Entry (i, j) holds the test of the i-th algorithm's means against the j-th algorithm's means,
+    the diagonal is left as NaN.
+
+    Attributes
+    ----------
+        statistics          A float array of shape (algorithms, algorithms) holding the smaller of both rank sums
+        r_plus              A float array of shape (algorithms, algorithms) holding the sum of positive ranks
+        p_values            A float array of shape (algorithms, algorithms)
+        algorithms          Algorithm labels, ordered as both axes
+        sample_size         The number of problems the algorithms were compared on
+        algorithm_index     Maps an algorithm label to its position on both axes
+
+    Methods
+    -------
+        get_statistics():
+            Retrieves the statistic of every pair of algorithms.
+        get_p_values():
+            Retrieves the p-value of every pair of algorithms.
+        get_comparison(algorithm_to_compare, alpha=0.05):
+            Retrieves the comparison of every algorithm with a reference algorithm, laid out as 'wilcoxon_test'.
+    """
+
+    def __init__(self, statistics, r_plus, p_values, algorithms, sample_size):
+        """
+        :param np.ndarray statistics: An array of shape (algorithms, algorithms)
+        :param np.ndarray r_plus: An array of shape (algorithms, algorithms)
+        :param np.ndarray p_values: An array of shape (algorithms, algorithms)
+        :param list algorithms: Algorithm labels
+        :param int sample_size: The number of problems the algorithms were compared on
+        """
+
+        if statistics.shape != (len(algorithms), len(algorithms)):
+            raise ValueError('Labels do not match the shape of the statistics')
+
+        self.statistics = statistics
+        self.r_plus = r_plus
+        self.p_values = p_values
+        self.algorithms = list(algorithms)
+        self.sample_size = sample_size
+
+        self.algorithm_index = {label: index for index, label in enumerate(self.algorithms)}
+
+        for values in [self.statistics, self.r_plus, self.p_values]:
+            values.flags.writeable = False
+
+    def get_statistics(self):
+        """
+        Retrieves the statistic of every pair of algorithms.
+
+        :return: A dataframe with the algorithms as both rows and columns
+        """
+
+        return pd.DataFrame(self.statistics, index=self.algorithms, columns=self.algorithms)
+
+    def get_p_values(self):
+        """
+        Retrieves the p-value of every pair of algorithms.
+
+        :return: A dataframe with the algorithms as both rows and columns
+        """
+
+        return pd.DataFrame(self.p_values, index=self.algorithms, columns=self.algorithms)
+
+    def get_comparison(self, algorithm_to_compare, alpha=0.05):
+        """
+        Retrieves the comparison of every algorithm with a reference algorithm, laid out as 'wilcoxon_test'.
+
+        :param str algorithm_to_compare: Specify the reference algorithm (must be within 'algorithms')
+        :param float alpha: Specify the level of significance
+        :return: A dataframe of the P-Value, Hypothesis, W+ and W- of each algorithm
+        """
+
+        reference = self.algorithm_index[algorithm_to_compare]
+
+        algorithm_values = []
+
+        for index, algorithm in enumerate(self.algorithms):
+            if algorithm != algorithm_to_compare:
+                p_value = self.p_values[index, reference]
+                statistic = self.statistics[index, reference]
+
+                reject = 'X' if p_value < alpha else '✓'
+
+                algorithm_values.append([
+                    p_value,
+                    f'({reject})',
+                    (self.sample_size * (self.sample_size + 1) / 2) - statistic,
+                    statistic
+                ])
+            else:
+                algorithm_values.append([1, '(✓)', 0, 0])
+
+        df = pd.DataFrame(algorithm_values).T
+
+        df.columns = self.algorithms
+        df.index = ['P-Value', 'Hypothesis', 'W+', 'W-']
+
+        return df.T
@@ -0,0 +1,183 @@
+import hashlib
+import json
+import os
+from datetime import datetime
+
+from helpers.instrumentation_handler import InstrumentationHandler
+
+
+class CacheManifestProvider:
+    """
+    Static methods which link the cached comparisons to the raw files they were collected from.
+
+    The manifest records a fingerprint (size and modification time, or a content hash) of every raw txt file,
+    which allows detecting a stale cache and recomputing only the (algorithm, dimension) slices that changed.
+
+    Attributes
+    ----------
+        __manifest_file             Specify the path of the JSON manifest
+        __use_content_hash          Specify whether files are fingerprinted by their content instead of size and mtime
+
+    Methods
+    -------
+        set_manifest_file(path):
+            Specify the path of the JSON manifest.
+        set_use_content_hash(use_content_hash=True):
+            Specify whether files are fingerprinted by their content instead of their size and modification time.
+        get_file_fingerprint(path):
+            Fingerprints a single file.
+        collect_fingerprints(files):
+            Fingerprints the provided raw txt files.
+        get_manifest():
+            Retrieves the stored manifest.
+        save_manifest(directory, fingerprints):
+            Stores the manifest of the provided fingerprints.
+        get_changed_slices(directory, fingerprints):
+            Lists the (algorithm, dimension) slices whose files were added, modified or removed since the manifest.
+        get_fingerprint():
+            Retrieves a short digest identifying the fingerprinted files of the stored manifest.
+    """
+
+    __manifest_file = 'assets/cached_instances/manifest.json'
+    __use_content_hash = False
+
+    @staticmethod
+    def set_manifest_file(path):
+        """
+        Specify the path of the JSON manifest.
+
+        :param str path: Specify the path
+        """
+
+        if path != '':
+            CacheManifestProvider.__manifest_file = path
+
+    @staticmethod
+    def set_use_content_hash(use_content_hash=True):
+        """
+        Specify whether files are fingerprinted by their content instead of their size and modification time.
+
+        :param bool use_content_hash: Hashing is slower, but survives checkouts and copies which reset the mtime
+        """
+
+        CacheManifestProvider.__use_content_hash = use_content_hash
+
+    @staticmethod
+    def get_file_fingerprint(path):
+        """
+        Fingerprints a single file.
+
+        :param str path: Specify the path of the file
+        :return: A dictionary of the file size, in addition to either the modification time or the content hash
+        """
+
+        stat = os.stat(path)
+
+        if not CacheManifestProvider.__use_content_hash:
+            return {'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+
+        return {'size': stat.st_size, 'sha1': digest.hexdigest()}
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def collect_fingerprints(files):
+        """
+        Fingerprints the provided raw txt files.
+
+        :param list files: A list of (algorithm, problem, dimension, path) tuples
+        :return: A dictionary of file names (relative to their algorithm directory's parent) and their fingerprints
+        """
+
+        fingerprints = {}
+
+        for algorithm, problem, dimension, path in files:
+            fingerprint = CacheManifestProvider.get_file_fingerprint(path)
+            fingerprint['algorithm'] = algorithm
+            fingerprint['problem'] = problem
+            fingerprint['dimension'] = dimension
+
+            fingerprints[f'{algorithm}/{os.path.basename(path)}'] = fingerprint
+
+        return fingerprints
+
+    @staticmethod
+    def get_manifest():
+        """
+        Retrieves the stored manifest.
+
+        :return: A dictionary holding the raw directory and the fingerprint of each file, None if nothing is stored
+        """
+
+        if not os.path.exists(CacheManifestProvider.__manifest_file):
+            return None
+
+        with open(CacheManifestProvider.__manifest_file) as f:
+            return json.load(f)
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def save_manifest(directory, fingerprints):
+        """
+        Stores the manifest of the provided fingerprints.
+
+        :param str directory: Specify the raw directory the fingerprints were collected from
+        :param dict fingerprints: A dictionary as returned from collect_fingerprints
+        """
+
+        path = CacheManifestProvider.__manifest_file
+
+        if not os.path.exists(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+
+        with open(f'{path}.tmp', 'w') as f:
+            json.dump({'directory': directory,
+                       'timestamp': str(datetime.utcnow()),
+                       'files': fingerprints}, f, indent=4)
+
+        os.replace(f'{path}.tmp', path)
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def get_changed_slices(directory, fingerprints):
+        """
+        Lists the (algorithm, dimension) slices whose files were added, modified or removed since the manifest.
+
+        :param str directory: Specify the raw directory the fingerprints were collected from
+        :param dict fingerprints: A dictionary as returned from collect_fingerprints
+        :return: A set of (algorithm, dimension) tuples, None if no comparable manifest is stored
+        """
+
+        manifest = CacheManifestProvider.get_manifest()
+
+        if manifest is None or manifest['directory'] != directory:
+            return None
+
+        stored = manifest['files']
+        changed = set()
+
+        for name in stored.keys() | fingerprints.keys():
+            if stored.get(name) != fingerprints.get(name):
+                fingerprint = fingerprints.get(name) or stored.get(name)
+                changed.add((fingerprint['algorithm'], fingerprint['dimension']))
+
+        return changed
+
+    @staticmethod
+    def get_fingerprint():
+        """
+        Retrieves a short digest identifying the fingerprinted files of the stored manifest.
+
+        :return: A hex digest, None if no manifest is stored
+        """
+
+        manifest = CacheManifestProvider.get_manifest()
+
+        if manifest is None:
+            return None
+
+        return hashlib.sha1(json.dumps(manifest['files'], sort_keys=True).encode()).hexdigest()[:16]
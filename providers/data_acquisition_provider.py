@@ -1,14 +1,21 @@
-import copy
 import os
-import shutil
-import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
 
 import numpy as np
 import pandas as pd
 
+from helpers.instrumentation_handler import InstrumentationHandler
+from helpers.memoization_handler import MemoizationHandler
 from helpers.progress_handler import ProgressHandler
+from models.lazy_comparisons import LazyComparisons
+from models.moment_cube import MomentCube
+from models.run_cube import RunCube
+from models.running_moments import RunningMoments
+from providers.cache_manifest_provider import CacheManifestProvider
 from providers.data_manifest_provider import DataManifestProvider
+from providers.snapshot_provider import SnapshotProvider
 
 
 class DataAcquisitionProvider:
@@ -18,45 +25,427 @@ class DataAcquisitionProvider:
     Attributes
     ----------
         __algorithms_raw_directory  Specify the directory from where to read the assets from
+        __workers                   Specify the number of processes used to read the assets, 1 reads serially
+        __streaming                 Specify whether summary-only workflows read the assets into running moments
+        __chunk_size                Specify the number of characters read at once from a raw txt file when streaming
+        __compact                   Specify whether the runs are stored as float32 where precision permits
+        __lossless                  Specify whether compact runs must keep every significant digit
         __algorithms_raw            Acts as a cache for storing raw algorithm input
+        __algorithms_cube           Acts as a cache for storing raw algorithm input as a dense run cube
+        __algorithms_moments        Acts as a cache for storing the running moments of raw algorithm input
         __algorithms_comparisons    Acts as a cache for storing reordered algorithm input
+        __data_fingerprint          Acts as a cache for storing the identifier of the loaded data
+        __generation                Counts the times the loaded data was discarded
 
     Methods
     -------
         set_algorithms_raw_directory(directory):
             Specify the directory from where to read the assets from
+        get_algorithms_raw_directory():
+            Retrieves the directory from where the assets are read.
+        __reset():
+            Discards the loaded data along with every memoized result computed from it.
+        reset():
+            Discards the loaded data, hence the next access reads it again, as a cold start would.
+        get_data_fingerprint():
+            Retrieves an identifier of the loaded data, used to key memoized results.
+        set_workers(workers=None):
+            Specify the number of processes used to read the assets.
+        set_streaming(streaming=True, chunk_size=1048576):
+            Specify whether summary-only workflows read the assets into running moments, rather than a run cube.
+        set_compact(compact=True, lossless=True):
+            Specify whether the runs are stored as float32 where precision permits, rather than float64.
+        __fits_float32(values):
+            Checks whether float32 holds every significant digit of the provided values.
+        __get_compact_dataframes(dataframes):
+            Stores the runs of raw dataframes as float32 where precision permits, sharing their labels.
+        read_algorithm_file(path, with_statistics=True):
+            Reads a single raw txt file, optionally adding the mean and the standard deviation.
+        read_algorithm_file_moments(path, chunk_size=1048576):
+            Reads a single raw txt file in chunks, keeping only the running moments of each row.
+        __read_algorithm_files(paths, with_statistics=True, streaming=False):
+            Reads the provided raw txt files, spreading the work over __workers processes.
         __get_algorithms_raw():
             Loads raw txt algorithms from __algorithms_raw_directory directory in a dataframe,
             while adding the mean and the standard deviation in the process.
         get_algorithms_raw():
             Calls __get_algorithms_raw if __algorithms_raw is None, otherwise,
             it retrieves __algorithms_raw immediately.
+        __get_algorithm_files():
+            Lists the raw txt files found in __algorithms_raw_directory.
+        __get_algorithms_cube():
+            Loads raw txt algorithms from __algorithms_raw_directory directory in a single dense run cube.
+        __get_snapshot_algorithms_cube():
+            Memory-maps the run cube from the binary snapshot, if it was collected from __algorithms_raw_directory.
+        get_algorithms_cube():
+            Calls __get_algorithms_cube if __algorithms_cube is None, otherwise,
+            it retrieves __algorithms_cube immediately.
+        __get_algorithms_moments():
+            Streams raw txt algorithms from __algorithms_raw_directory directory into running moments.
+        get_algorithms_moments():
+            Calls __get_algorithms_moments if __algorithms_moments is None, otherwise,
+            it retrieves __algorithms_moments immediately.
         __get_algorithms_performance_dataframe_by_dimension_and_parameter(dimension=10, parameter=0):
             Shows each algorithm performance for each problem set by showing the mean and the standard deviation.
+        __get_comparisons_loader(comparisons, header):
+            Creates a loader which wraps a slice of the comparisons array into a dataframe, without copying.
+        __read_cached_algorithms_comparison(dimension, parameter):
+            Reads a single slice of the algorithm comparison's snapshot from its CSV table.
         __get_cached_algorithms_comparisons():
-            Retrieves the algorithm comparison's snapshot.
+            Retrieves the algorithm comparison's snapshot, each slice is only read on its first access.
+        __refresh_stale_cache():
+            Updates the cached comparisons if any raw txt file changed since they were collected.
+        __store_cache(cube, comparisons, dimensions):
+            Writes the CSV tables of the provided dimensions, along with the binary snapshot.
+        __rebuild_cache():
+            Recomputes every slice of the cache from the raw txt files.
+        __update_cache(files, changed, new_algorithm=None):
+            Recomputes only the changed (algorithm, dimension) slices of the cache.
+        __update_streamed_cache(header, files, changed, comparisons):
+            Recomputes only the changed (algorithm, dimension) slices of the cache from running moments.
         cache_algorithms_comparisons():
-            Collects a snapshot of algorithms comparisons for faster fetch in the future.
+            Collects a snapshot of algorithms comparisons and raw runs for faster fetch in the future.
+        register_algorithm(algorithm):
+            Splices a newly added algorithm into the cached comparisons, without processing the other algorithms.
         __get_algorithms_comparisons(fast_fetch=True):
-            Processes the loaded raw txt file into display a dataframe suitable for algorithms comparisons.
-        get_algorithms_comparisons(fast_fetch=True):
+            Processes the loaded raw txt file into a dataframe suitable for algorithms comparisons,
+            each slice is only processed on its first access.
+        __get_read_only_dataframe(df):
+            Wraps the values of the dataframe into a read-only array, hence any in-place assignment raises an error.
+        __get_lazy_comparisons(loader):
+            Wraps a slice loader into a LazyComparisons, where every loaded slice is read-only.
+        get_algorithms_comparisons(fast_fetch=True, copy=False):
             Calls __get_algorithms_comparisons if __algorithms_comparisons is None, otherwise,
             it retrieves __algorithms_comparisons immediately.
+        get_algorithms_comparison(dimension=10, parameter=0, copy=False):
+            Retrieves the algorithms comparison of a single dimension and parameter.
+        get_algorithms_means(dimension=10, parameter=0):
+            Retrieves the mean of each algorithm for each problem, dropping problems and algorithms without any value.
+        get_algorithms_means_array(dimensions=None, parameters=None):
+            Stacks the mean of each algorithm for each problem of several slices in a single array.
+        __is_memory_mapped(values):
+            Checks whether an array is backed by a memory-mapped file.
+        __get_dataframes_memory(dataframes):
+            Measures the memory held by dataframes, counting shared labels and values once.
+        get_memory_report():
+            Measures the memory held by each loaded store.
     """
 
     __algorithms_raw_directory = 'assets/algorithms'
+    __workers = 1
+    __streaming = False
+    __compact = False
+    __lossless = True
+    __chunk_size = 1048576
     __algorithms_raw = None
+    __algorithms_cube = None
+    __algorithms_moments = None
     __algorithms_comparisons = None
+    __data_fingerprint = None
+    __generation = 0
 
     @staticmethod
     def set_algorithms_raw_directory(directory):
         """
         Specify the directory from where to read the assets from
         """
-        if directory != '':
+        if directory != '' and directory != DataAcquisitionProvider.__algorithms_raw_directory:
             DataAcquisitionProvider.__algorithms_raw_directory = directory
+            DataAcquisitionProvider.__reset()
 
     @staticmethod
+    def get_algorithms_raw_directory():
+        """
+        Retrieves the directory from where the assets are read.
+
+        :return: The directory
+        """
+
+        return DataAcquisitionProvider.__algorithms_raw_directory
+
+    @staticmethod
+    def __reset():
+        """
+        Discards the loaded data along with every memoized result computed from it.
+        """
+
+        DataAcquisitionProvider.__algorithms_raw = None
+        DataAcquisitionProvider.__algorithms_cube = None
+        DataAcquisitionProvider.__algorithms_moments = None
+        DataAcquisitionProvider.__algorithms_comparisons = None
+        DataAcquisitionProvider.__data_fingerprint = None
+        DataAcquisitionProvider.__generation += 1
+
+        MemoizationHandler.clear()
+
+    @staticmethod
+    def reset():
+        """
+        Discards the loaded data, hence the next access reads it again, as a cold start would.
+        """
+
+        DataAcquisitionProvider.__reset()
+
+    @staticmethod
+    def get_data_fingerprint():
+        """
+        Retrieves an identifier of the loaded data, used to key memoized results.
+
+        :return: A string combining the cache manifest digest (if any) and the number of times data was discarded
+        """
+
+        if DataAcquisitionProvider.__data_fingerprint is None:
+            manifest = CacheManifestProvider.get_manifest()
+
+            if manifest is not None and manifest['directory'] == DataAcquisitionProvider.__algorithms_raw_directory:
+                digest = CacheManifestProvider.get_fingerprint()
+            else:
+                digest = DataAcquisitionProvider.__algorithms_raw_directory
+
+            DataAcquisitionProvider.__data_fingerprint = f'{DataAcquisitionProvider.__generation}:{digest}'
+
+        return DataAcquisitionProvider.__data_fingerprint
+
+    @staticmethod
+    def set_workers(workers=None):
+        """
+        Specify the number of processes used to read the assets.
+
+        :param int workers: Specify the number of processes, None uses every available core and 1 reads serially
+        """
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError('workers must be a positive integer')
+
+        DataAcquisitionProvider.__workers = workers
+
+    @staticmethod
+    def set_streaming(streaming=True, chunk_size=1048576):
+        """
+        Specify whether summary-only workflows read the assets into running moments, rather than a run cube.
+
+        When streaming, each raw txt file is read in chunks and only the count, mean, M2, minimum and maximum of its
+        rows are kept, hence the comparisons (and their cache) are built without ever holding the runs in memory.
+        Analyses which need the runs themselves (e.g. the Mann–Whitney U tests) still load the run cube.
+        Means are accumulated chunk by chunk, hence they may differ from the run cube's in the last digit.
+
+        :param bool streaming: Specify whether to stream the assets
+        :param int chunk_size: Specify the number of characters read at once from a raw txt file (opened as text)
+        """
+
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError('chunk_size must be a positive integer')
+
+        DataAcquisitionProvider.__chunk_size = chunk_size
+
+        if bool(streaming) != DataAcquisitionProvider.__streaming:
+            DataAcquisitionProvider.__streaming = bool(streaming)
+            DataAcquisitionProvider.__reset()
+
+    @staticmethod
+    def set_compact(compact=True, lossless=True):
+        """
+        Specify whether the runs are stored as float32 where precision permits, rather than float64.
+
+        Compact stores halve the memory of the run cube and of the runs of the raw dataframes, whose labels are
+        shared as well. When lossless, precision permits if float32 holds every significant digit of the runs (most
+        raw txt files record six, some record every digit of a float64), otherwise the runs are kept as float64:
+        each raw dataframe is compacted on its own, the run cube only if every run fits. Otherwise, precision
+        permits if the runs are within the float32 range, rounding them to about seven significant digits.
+        The mean and the standard deviation of the raw dataframes stay float64. Means are computed from the float32
+        runs, hence they may differ from the float64 ones in the last digits, and so may the comparisons cached
+        while compact. A run cube memory-mapped from the snapshot is used as stored, its pages being read on access.
+
+        :param bool compact: Specify whether to store the runs as float32
+        :param bool lossless: Specify whether float32 must keep every significant digit of the runs
+        """
+
+        if bool(compact) != DataAcquisitionProvider.__compact or bool(lossless) != DataAcquisitionProvider.__lossless:
+            DataAcquisitionProvider.__compact = bool(compact)
+            DataAcquisitionProvider.__lossless = bool(lossless)
+            DataAcquisitionProvider.__reset()
+
+    @staticmethod
+    def __fits_float32(values):
+        """
+        Checks whether float32 holds every significant digit of the provided values.
+
+        Values are expected to hold at most as many significant digits as float32 guarantees (six), within its
+        normal range, unless lossless is unset, in which case only the range is checked. NaN, infinite and zero
+        values always fit.
+
+        :param np.ndarray values: Specify the float64 values
+        :return: True if the values can be stored as float32 without losing any significant digit
+        """
+
+        info = np.finfo(np.float32)
+
+        values = values[np.isfinite(values) & (values != 0)]
+
+        if values.size == 0:
+            return True
+
+        magnitudes = np.abs(values)
+
+        if magnitudes.min() < info.tiny or magnitudes.max() > info.max:
+            return False
+
+        if not DataAcquisitionProvider.__lossless:
+            return True
+
+        # Each value is scaled so its significant digits make up the integer part
+        scale = 10. ** (np.floor(np.log10(magnitudes)) - (info.precision - 1))
+        digits = values / scale
+
+        return bool(np.all(np.abs(digits - np.round(digits)) < 1e-6) and
+                    np.array_equal(np.round(digits), np.round(values.astype(np.float32) / scale)))
+
+    @staticmethod
+    def __get_compact_dataframes(dataframes):
+        """
+        Stores the runs of raw dataframes as float32 where precision permits, sharing their labels.
+
+        Dataframes with the same shape share the same index and columns objects, rather than holding a copy each.
+
+        :param list dataframes: Specify the dataframes, as returned by read_algorithm_file with the statistics
+        :return: A list of dataframes, ordered as the provided ones
+        """
+
+        labels = {}
+        compact = []
+
+        for df in dataframes:
+            key = (len(df.index), tuple(df.columns))
+            index, columns = labels.setdefault(key, (df.index, df.columns))
+
+            runs = df.iloc[:, :-2].to_numpy(dtype=np.float64)
+
+            if DataAcquisitionProvider.__fits_float32(runs):
+                runs = runs.astype(np.float32)
+
+            compact_df = pd.DataFrame(runs, index=index, copy=False)
+            compact_df['mean'] = df['mean'].to_numpy()
+            compact_df['std'] = df['std'].to_numpy()
+            compact_df.columns = columns
+
+            compact.append(compact_df)
+
+        return compact
+
+    @staticmethod
+    def read_algorithm_file(path, with_statistics=True):
+        """
+        Reads a single raw txt file, optionally adding the mean and the standard deviation.
+
+        :param str path: Specify the path of the raw txt file
+        :param bool with_statistics: Specify whether to append the 'mean' and 'std' columns
+        :return: A dataframe with the parameters as rows and the iterations as columns
+        """
+
+        df = pd.read_csv(path, delim_whitespace=True, header=None)
+
+        if with_statistics:
+            df['mean'] = df.mean(axis=1)
+            df['std'] = df.std(axis=1)
+
+        return df
+
+    @staticmethod
+    def read_algorithm_file_moments(path, chunk_size=1048576):
+        """
+        Reads a single raw txt file in chunks, keeping only the running moments of each row.
+
+        A row may span several chunks, hence a number cut at the end of a chunk is carried over to the next one.
+        Blank lines are skipped, just as read_algorithm_file does.
+
+        :param str path: Specify the path of the raw txt file
+        :param int chunk_size: Specify the number of characters read at once (the file is opened as text)
+        :return: A RunningMoments of shape (parameters,)
+        """
+
+        rows = []
+        row = None
+        remainder = ''
+
+        with open(path) as f:
+            while True:
+                chunk = f.read(chunk_size)
+                text = remainder + chunk
+
+                end = len(text)
+                if chunk:
+                    while end > 0 and not text[end - 1].isspace():
+                        end -= 1
+
+                text, remainder = text[:end], text[end:]
+                lines = text.split('\n')
+
+                for position, line in enumerate(lines):
+                    values = np.array(line.split(), dtype=np.float64)
+
+                    if values.size > 0:
+                        if row is None:
+                            row = RunningMoments()
+                        row.update(values)
+
+                    # Every line but the last one is followed by a line break, which ends the row
+                    if position < len(lines) - 1 and row is not None:
+                        rows.append(row)
+                        row = None
+
+                if not chunk:
+                    break
+
+        if row is not None:
+            rows.append(row)
+
+        return RunningMoments.stack(rows)
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def __read_algorithm_files(paths, with_statistics=True, streaming=False):
+        """
+        Reads the provided raw txt files, spreading the work over __workers processes.
+
+        :param list paths: Specify the paths of the raw txt files
+        :param bool with_statistics: Specify whether to append the 'mean' and 'std' columns
+        :param bool streaming: Specify whether to keep only the running moments of each file
+        :return: A list of dataframes (or RunningMoments if streaming), ordered as the provided paths
+        """
+
+        if streaming:
+            read = partial(DataAcquisitionProvider.read_algorithm_file_moments,
+                           chunk_size=DataAcquisitionProvider.__chunk_size)
+        else:
+            read = partial(DataAcquisitionProvider.read_algorithm_file, with_statistics=with_statistics)
+        workers = min(DataAcquisitionProvider.__workers, len(paths))
+
+        dataframes = []
+
+        with ProgressHandler.track(len(paths), description='Reading raw files') as progress:
+            if workers <= 1:
+                for path in paths:
+                    dataframes.append(read(path))
+                    progress.update(size=os.path.getsize(path))
+
+                return dataframes
+
+            chunk_size = max(1, len(paths) // (workers * 4))
+
+            # Files are handed out in chunks to amortize the inter-process overhead, the results come back in order,
+            # and the progress is only reported from the parent process
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for path, df in zip(paths, executor.map(read, paths, chunksize=chunk_size)):
+                    dataframes.append(df)
+                    progress.update(size=os.path.getsize(path))
+
+        return dataframes
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
     def __get_algorithms_raw():
         """
         Loads raw txt algorithms from __algorithms_raw_directory directory in a dataframe,
@@ -66,38 +455,22 @@ class DataAcquisitionProvider:
                  containing dataframes as the value pair, {str: {str: {str: DataFrame()}}}.
         """
 
-        dataframes = {}
-        processed = 0
-
-        directory = DataAcquisitionProvider.__algorithms_raw_directory
-
-        for algorithm in os.listdir(directory):
-            print(ProgressHandler.show_progress(processed, len(os.listdir(directory))))
-            processed += 1
-            dataframes[algorithm] = {}
-            for problem_set in os.listdir(f'{directory}/{algorithm}'):
-                filename = os.path.splitext(problem_set)[0].split('_')
-                problem = filename[-2]
-                dimension = filename[-1]
-
-                if problem not in dataframes[algorithm]:
-                    dataframes[algorithm][problem] = {}
+        files = DataAcquisitionProvider.__get_algorithm_files()
 
-                dataframes[algorithm][problem][dimension] = pd.read_csv(
-                    f'{directory}/{algorithm}/{problem_set}',
-                    delim_whitespace=True,
-                    header=None)
+        raw = DataAcquisitionProvider.__read_algorithm_files([file[3] for file in files])
 
-                current_df = dataframes[algorithm][problem][dimension]  # type: pd.DataFrame
+        if DataAcquisitionProvider.__compact:
+            raw = DataAcquisitionProvider.__get_compact_dataframes(raw)
 
-                current_df['mean'] = current_df.mean(axis=1)
-                current_df['std'] = current_df.std(axis=1)
+        dataframes = {}
 
-        ProgressHandler.reset_progress()
+        for (algorithm, problem, dimension, _), df in zip(files, raw):
+            dataframes.setdefault(algorithm, {}).setdefault(str(problem), {})[str(dimension)] = df
 
         DataAcquisitionProvider.__algorithms_raw = dataframes
 
     @staticmethod
+    @InstrumentationHandler.instrument()
     def get_algorithms_raw():
         """
         Calls __get_algorithms_raw if __algorithms_raw is None, otherwise,
@@ -114,6 +487,168 @@ class DataAcquisitionProvider:
         return DataAcquisitionProvider.__algorithms_raw
 
     @staticmethod
+    @InstrumentationHandler.instrument()
+    def __get_algorithm_files():
+        """
+        Lists the raw txt files found in __algorithms_raw_directory.
+
+        :return: A list of (algorithm, problem, dimension, path) tuples, algorithms are sorted case-insensitively
+        """
+
+        directory = DataAcquisitionProvider.__algorithms_raw_directory
+
+        files = []
+
+        for algorithm in sorted(os.listdir(directory), key=str.lower):
+            for problem_set in sorted(os.listdir(f'{directory}/{algorithm}')):
+                filename = os.path.splitext(problem_set)[0].split('_')
+                problem = int(filename[-2])
+                dimension = int(filename[-1])
+
+                files.append((algorithm, problem, dimension, f'{directory}/{algorithm}/{problem_set}'))
+
+        return files
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def __get_algorithms_cube():
+        """
+        Loads raw txt algorithms from __algorithms_raw_directory directory in a single dense run cube.
+        """
+
+        files = DataAcquisitionProvider.__get_algorithm_files()
+
+        algorithms = list(dict.fromkeys(file[0] for file in files))
+        problems = sorted({file[1] for file in files})
+        dimensions = list(DataManifestProvider.DIMENSIONS)
+        parameters = list(DataManifestProvider.PARAMETERS)
+
+        files = [file for file in files if file[2] in dimensions]
+
+        raw = DataAcquisitionProvider.__read_algorithm_files([file[3] for file in files], with_statistics=False)
+
+        runs = {(algorithm, problem, dimension): df.values
+                for (algorithm, problem, dimension, _), df in zip(files, raw)}
+
+        run_count = max((value.shape[1] for value in runs.values()), default=0)
+
+        dtype = np.float64
+
+        if DataAcquisitionProvider.__compact:
+            if all(DataAcquisitionProvider.__fits_float32(value[:len(parameters)]) for value in runs.values()):
+                dtype = np.float32
+            else:
+                print('Some runs need float64 precision, the run cube is not compacted')
+
+        values = np.full((len(algorithms), len(problems), len(dimensions), len(parameters), run_count), np.nan,
+                         dtype=dtype)
+
+        cube = RunCube(values, algorithms, problems, dimensions, parameters)
+
+        for (algorithm, problem, dimension), value in runs.items():
+            value = value[:len(parameters)]
+            values[cube.algorithm_index[algorithm],
+                   cube.problem_index[problem],
+                   cube.dimension_index[dimension],
+                   :value.shape[0],
+                   :value.shape[1]] = value
+
+        DataAcquisitionProvider.__algorithms_cube = cube
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def __get_snapshot_algorithms_cube():
+        """
+        Memory-maps the run cube from the binary snapshot, if it was collected from __algorithms_raw_directory.
+
+        :return: A RunCube backed by a read-only memory map, None if no matching snapshot is stored
+        """
+
+        if not SnapshotProvider.has_snapshot():
+            return None
+
+        header = SnapshotProvider.get_header()
+
+        if header['directory'] != DataAcquisitionProvider.__algorithms_raw_directory:
+            return None
+
+        runs = SnapshotProvider.get_runs()
+
+        # Snapshots collected while streaming hold no runs, hence they are read from the raw txt files instead
+        if runs.shape[-1] == 0:
+            return None
+
+        return RunCube(runs, header['algorithms'], header['problems'], header['dimensions'], header['parameters'])
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def get_algorithms_cube():
+        """
+        Calls __get_algorithms_cube if __algorithms_cube is None, otherwise,
+        it retrieves __algorithms_cube immediately.
+
+        :return: A RunCube indexed by algorithm × problem × dimension × parameter × run
+        """
+
+        if DataAcquisitionProvider.__algorithms_cube is None:
+            DataAcquisitionProvider.__refresh_stale_cache()
+            DataAcquisitionProvider.__algorithms_cube = DataAcquisitionProvider.__get_snapshot_algorithms_cube()
+
+        if DataAcquisitionProvider.__algorithms_cube is None:
+            print('Fetching Raw Files, this is a one time process...')
+            DataAcquisitionProvider.__get_algorithms_cube()
+
+        return DataAcquisitionProvider.__algorithms_cube
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def __get_algorithms_moments():
+        """
+        Streams raw txt algorithms from __algorithms_raw_directory directory into running moments.
+        """
+
+        files = DataAcquisitionProvider.__get_algorithm_files()
+
+        algorithms = list(dict.fromkeys(file[0] for file in files))
+        problems = sorted({file[1] for file in files})
+        dimensions = list(DataManifestProvider.DIMENSIONS)
+        parameters = list(DataManifestProvider.PARAMETERS)
+
+        files = [file for file in files if file[2] in dimensions]
+
+        raw = DataAcquisitionProvider.__read_algorithm_files([file[3] for file in files], streaming=True)
+
+        moments = RunningMoments((len(algorithms), len(problems), len(dimensions), len(parameters)))
+
+        cube = MomentCube(moments, algorithms, problems, dimensions, parameters)
+
+        for (algorithm, problem, dimension, _), value in zip(files, raw):
+            value = value[:len(parameters)]
+            moments.assign((cube.algorithm_index[algorithm],
+                            cube.problem_index[problem],
+                            cube.dimension_index[dimension],
+                            slice(None, value.count.shape[0])), value)
+
+        DataAcquisitionProvider.__algorithms_moments = cube
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def get_algorithms_moments():
+        """
+        Calls __get_algorithms_moments if __algorithms_moments is None, otherwise,
+        it retrieves __algorithms_moments immediately.
+
+        :return: A MomentCube indexed by algorithm × problem × dimension × parameter
+        """
+
+        if DataAcquisitionProvider.__algorithms_moments is None:
+            print('Streaming Raw Files, this is a one time process...')
+            DataAcquisitionProvider.__get_algorithms_moments()
+
+        return DataAcquisitionProvider.__algorithms_moments
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
     def __get_algorithms_performance_dataframe_by_dimension_and_parameter(dimension=10, parameter=0):
         """
         Shows each algorithm performance for each problem set by showing the mean and the standard deviation.
@@ -123,139 +658,443 @@ class DataAcquisitionProvider:
         :return: A dataframe indicating each algorithm performance for a selected dimension and parameter
         """
 
-        # Since appending to a dataframe is inefficient, we will be using 3D arrays,
-        # then we will instantiate a new dataframe from the array's values.
-
         if dimension not in DataManifestProvider.DIMENSIONS:
             raise ValueError('Invalid dimension value')
         if parameter not in DataManifestProvider.PARAMETERS:
             raise ValueError('Invalid parameter value')
 
-        algorithm_names = DataAcquisitionProvider.get_algorithms_raw().keys()
-        index_names = []
-        performance_array = []
+        if DataAcquisitionProvider.__streaming:
+            cube = DataAcquisitionProvider.get_algorithms_moments()
+        else:
+            cube = DataAcquisitionProvider.get_algorithms_cube()
+
+        means = cube.get_means(dimension=dimension, parameter=parameter)
+        stds = cube.get_stds(dimension=dimension, parameter=parameter)
+
+        # Interleave the (algorithm, problem) planes into (problem, measurement) rows
+        performance_array = np.stack([means.T, stds.T], axis=1).reshape(-1, len(cube.algorithms))
 
-        for algorithm in DataAcquisitionProvider.get_algorithms_raw():
-            performance_array.append([])
-            index_names = []
-            for problem in DataAcquisitionProvider.get_algorithms_raw()[algorithm]:
-                index_names.append(problem)
-                if str(dimension) in DataAcquisitionProvider.get_algorithms_raw()[algorithm][problem]:
+        index = pd.MultiIndex.from_product([cube.problems, ['Mean', 'Std']], names=['Problem', 'Measurement'])
+        columns = pd.Index(cube.algorithms, name='Algorithm')
 
-                    row = DataAcquisitionProvider.get_algorithms_raw()[algorithm][problem][str(dimension)].iloc[
-                        parameter]
+        return pd.DataFrame(performance_array, index=index, columns=columns)
 
-                    performance_array[-1].append([row['mean'],
-                                                  row['std']
-                                                  ])
-                else:
-                    performance_array[-1].append([None, None])
+    @staticmethod
+    def __get_comparisons_loader(comparisons, header):
+        """
+        Creates a loader which wraps a slice of the comparisons array into a dataframe, without copying.
 
-        performance_array = np.array(performance_array)
+        :param np.ndarray comparisons: An array of shape (dimensions, parameters, problems × 2, algorithms)
+        :param dict header: Labels of each axis, as stored in the snapshot header
+        :return: A callable receiving (dimension, parameter) and returning the slice's dataframe
+        """
 
-        names = ['Algorithm', 'Problem', 'Measurement']
-        index = pd.MultiIndex.from_product([range(s) for s in performance_array.shape], names=names)
-        df = pd.DataFrame({'A': performance_array.flatten()}, index=index)['A']
+        index = pd.MultiIndex.from_product([header['problems'], ['Mean', 'Std']], names=['Problem', 'Measurement'])
+        columns = pd.Index(header['algorithms'])
 
-        index_names = [int(k) for k in index_names]
+        dimension_index = {dimension: position for position, dimension in enumerate(header['dimensions'])}
+        parameter_index = {parameter: position for position, parameter in enumerate(header['parameters'])}
 
-        df.index = df.index.set_levels([algorithm_names, index_names, ['Mean', 'Std']])
-        df = df.unstack(level='Algorithm')
+        def load(dimension, parameter):
+            return pd.DataFrame(comparisons[dimension_index[int(dimension)], parameter_index[int(parameter)]],
+                                index=index,
+                                columns=columns,
+                                copy=False)
 
-        return df.sort_index()
+        return load
 
     @staticmethod
-    def __get_cached_algorithms_comparisons():
+    @InstrumentationHandler.instrument()
+    def __read_cached_algorithms_comparison(dimension, parameter):
         """
-        Retrieves the algorithm comparison's snapshot.
+        Reads a single slice of the algorithm comparison's snapshot from its CSV table.
+
+        :param int dimension: Specify the desired dimension (must be within 'DataManifestProvider.DIMENSIONS')
+        :param int parameter: Specify the desired parameter (must be within 'DataManifestProvider.PARAMETERS')
+        :return: A dataframe indicating each algorithm performance for a selected dimension and parameter
         """
 
         root_directory = 'assets/cached_instances/algorithms_comparisons'
 
-        dataframes = {}
+        df = pd.read_csv(f'{root_directory}/{dimension}D/{parameter}.csv', skiprows=1)
 
-        for dimension in DataManifestProvider.DIMENSIONS:
-            dataframes[dimension] = {}
-            for parameter in DataManifestProvider.PARAMETERS:
-                file_directory = f'{root_directory}/{dimension}D/{parameter}.csv'
-                dataframes[dimension][parameter] = pd.read_csv(file_directory, skiprows=1)
+        return df.set_index(['Problem', 'Measurement'])
 
-                dataframes[dimension][parameter] = dataframes[dimension][parameter].set_index(
-                    ['Problem', 'Measurement'])
+    @staticmethod
+    def __get_read_only_dataframe(df):
+        """
+        Wraps the values of the dataframe into a read-only array, hence any in-place assignment raises an error.
 
-        return dataframes
+        :param pd.DataFrame() df: Specify the dataframe, must hold a single dtype
+        :return: A dataframe, the provided one if its values are already read-only
+        """
+
+        values = df.to_numpy()
+
+        if not values.flags.writeable:
+            return df
+
+        values = values.copy()
+        values.flags.writeable = False
+
+        return pd.DataFrame(values, index=df.index, columns=df.columns, copy=False)
 
     @staticmethod
-    def cache_algorithms_comparisons():
+    def __get_lazy_comparisons(loader):
+        """
+        Wraps a slice loader into a LazyComparisons, where every loaded slice is read-only.
+
+        :param callable loader: Receives (dimension, parameter) and returns the slice's dataframe
+        :return: A LazyComparisons of every dimension and parameter
+        """
+
+        def load(dimension, parameter):
+            with InstrumentationHandler.span('DataAcquisitionProvider.load_slice'):
+                return DataAcquisitionProvider.__get_read_only_dataframe(loader(dimension, parameter))
+
+        return LazyComparisons(load, DataManifestProvider.DIMENSIONS, DataManifestProvider.PARAMETERS)
+
+    @staticmethod
+    def __get_cached_algorithms_comparisons():
+        """
+        Retrieves the algorithm comparison's snapshot, each slice is only read on its first access.
+        """
+
+        if SnapshotProvider.has_snapshot():
+            loader = DataAcquisitionProvider.__get_comparisons_loader(SnapshotProvider.get_comparisons(),
+                                                                      SnapshotProvider.get_header())
+        else:
+            loader = DataAcquisitionProvider.__read_cached_algorithms_comparison
+
+        return DataAcquisitionProvider.__get_lazy_comparisons(loader)
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def __refresh_stale_cache():
         """
-        Collects a snapshot of algorithms comparisons for faster fetch in the future.
+        Updates the cached comparisons if any raw txt file changed since they were collected.
+
+        Nothing is checked if the cache has no manifest, was collected from another directory,
+        or if the raw txt files are not available (e.g. only the snapshot was deployed).
+        """
+
+        directory = DataAcquisitionProvider.__algorithms_raw_directory
+        manifest = CacheManifestProvider.get_manifest()
+
+        if manifest is None or manifest['directory'] != directory or not os.path.isdir(directory):
+            return
+
+        files = DataAcquisitionProvider.__get_algorithm_files()
+        changed = CacheManifestProvider.get_changed_slices(directory, CacheManifestProvider.collect_fingerprints(files))
+
+        if changed:
+            print(f'Cached comparisons are stale ({len(changed)} algorithm/dimension slices changed), updating...')
+            DataAcquisitionProvider.cache_algorithms_comparisons()
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def __store_cache(cube, comparisons, dimensions):
+        """
+        Writes the CSV tables of the provided dimensions, along with the binary snapshot.
+
+        :param RunCube cube: Specify the run cube
+        :param np.ndarray comparisons: An array of shape (dimensions, parameters, problems × 2, algorithms)
+        :param list dimensions: Specify the dimensions whose CSV tables should be written
         """
 
         root_directory = 'assets/cached_instances/algorithms_comparisons'
 
-        algorithms_comparisons = DataAcquisitionProvider.get_algorithms_comparisons(fast_fetch=False)
+        header = {
+            'directory': DataAcquisitionProvider.__algorithms_raw_directory,
+            'algorithms': cube.algorithms,
+            'problems': cube.problems,
+            'dimensions': cube.dimensions,
+            'parameters': cube.parameters,
+        }
+
+        load = DataAcquisitionProvider.__get_comparisons_loader(comparisons, header)
+
+        with ProgressHandler.track(len(dimensions) * len(DataManifestProvider.PARAMETERS),
+                                   description='Writing cached tables') as progress:
+            for dimension in dimensions:
+                for parameter in DataManifestProvider.PARAMETERS:
+                    file_directory = f'{root_directory}/{dimension}D/{parameter}.csv'
+
+                    os.makedirs(os.path.dirname(file_directory), exist_ok=True)
+
+                    with open(file_directory, 'w') as f:
+                        f.write(f'# Timestamp: {datetime.utcnow()}\n')
+                        load(dimension, parameter).to_csv(f)
+
+                    progress.update(size=os.path.getsize(file_directory))
+
+        SnapshotProvider.save_snapshot(comparisons, cube.values, header)
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def __rebuild_cache():
+        """
+        Recomputes every slice of the cache from the raw txt files.
+        """
+
+        if DataAcquisitionProvider.__streaming:
+            DataAcquisitionProvider.__get_algorithms_moments()
+            moments = DataAcquisitionProvider.__algorithms_moments
 
-        if os.path.exists(os.path.dirname(root_directory)):
-            subprocess.check_call(('attrib -R ' + root_directory + '\\* /S').split())
-            shutil.rmtree(root_directory)
-            os.makedirs(root_directory)
+            # Streamed runs are never held in memory, hence the snapshot is stored without them
+            cube = RunCube(np.empty(moments.moments.count.shape + (0,)),
+                           moments.algorithms, moments.problems, moments.dimensions, moments.parameters)
         else:
-            os.makedirs(root_directory)
+            DataAcquisitionProvider.__get_algorithms_cube()
+            cube = DataAcquisitionProvider.__algorithms_cube
+
+        DataAcquisitionProvider.__get_algorithms_comparisons(fast_fetch=False)
+
+        algorithms_comparisons = DataAcquisitionProvider.__algorithms_comparisons
+
+        comparisons = np.stack([
+            np.stack([algorithms_comparisons[dimension][parameter].values
+                      for parameter in DataManifestProvider.PARAMETERS])
+            for dimension in DataManifestProvider.DIMENSIONS])
+
+        DataAcquisitionProvider.__store_cache(cube, comparisons, DataManifestProvider.DIMENSIONS)
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def __update_cache(files, changed, new_algorithm=None):
+        """
+        Recomputes only the changed (algorithm, dimension) slices of the cache.
+
+        :param list files: A list of (algorithm, problem, dimension, path) tuples
+        :param set changed: A set of (algorithm, dimension) tuples to be recomputed
+        :param str new_algorithm: Specify a newly added algorithm, whose empty column is spliced into the snapshot first
+        :return: False if the cache cannot be updated in place (e.g. the set of algorithms or problems changed)
+        """
+
+        if not SnapshotProvider.has_snapshot():
+            return False
+
+        header = SnapshotProvider.get_header()
+        comparisons = np.array(SnapshotProvider.get_comparisons())
+
+        if new_algorithm is not None:
+            algorithms = list(dict.fromkeys(file[0] for file in files))
+
+            if new_algorithm not in algorithms or new_algorithm in header['algorithms']:
+                return False
+
+            position = algorithms.index(new_algorithm)
+
+            header['algorithms'] = header['algorithms'][:position] + [new_algorithm] + header['algorithms'][position:]
+            comparisons = np.insert(comparisons, position, np.nan, axis=-1)
+
+        if header['directory'] != DataAcquisitionProvider.__algorithms_raw_directory or \
+                header['algorithms'] != list(dict.fromkeys(file[0] for file in files)) or \
+                header['problems'] != sorted({file[1] for file in files}) or \
+                header['dimensions'] != [int(dimension) for dimension in DataManifestProvider.DIMENSIONS] or \
+                header['parameters'] != [int(parameter) for parameter in DataManifestProvider.PARAMETERS]:
+            return False
+
+        # Every table gains the new algorithm's column, even where it has no files
+        if new_algorithm is not None:
+            changed = changed | {(new_algorithm, dimension) for dimension in header['dimensions']}
+
+        changed = {(algorithm, dimension) for algorithm, dimension in changed if dimension in header['dimensions']}
+        files = [file for file in files if (file[0], file[2]) in changed]
+
+        if DataAcquisitionProvider.__streaming:
+            DataAcquisitionProvider.__update_streamed_cache(header, files, changed, comparisons)
+            return True
+
+        runs = np.array(SnapshotProvider.get_runs())
+
+        # Snapshots collected while streaming hold no runs, hence the runs of the unchanged slices are unknown
+        if runs.shape[-1] == 0:
+            return False
+
+        if new_algorithm is not None:
+            runs = np.insert(runs, position, np.nan, axis=0)
+
+        raw = DataAcquisitionProvider.__read_algorithm_files([file[3] for file in files], with_statistics=False)
+
+        run_count = max((df.shape[1] for df in raw), default=0)
+
+        # A compact snapshot only stays compact while compact, and if the changed runs fit into float32 as well
+        if runs.dtype == np.float32 and not (DataAcquisitionProvider.__compact and all(
+                DataAcquisitionProvider.__fits_float32(df.values[:len(header['parameters'])]) for df in raw)):
+            runs = runs.astype(np.float64)
+
+        if run_count > runs.shape[-1]:
+            runs = np.concatenate([runs, np.full(runs.shape[:-1] + (run_count - runs.shape[-1],), np.nan,
+                                                 dtype=runs.dtype)], axis=-1)
+
+        cube = RunCube(runs, header['algorithms'], header['problems'], header['dimensions'], header['parameters'])
+
+        for algorithm, dimension in changed:
+            runs[cube.algorithm_index[algorithm], :, cube.dimension_index[dimension]] = np.nan
+
+        for (algorithm, problem, dimension, _), df in zip(files, raw):
+            value = df.values[:len(cube.parameters)]
+            runs[cube.algorithm_index[algorithm],
+                 cube.problem_index[problem],
+                 cube.dimension_index[dimension],
+                 :value.shape[0],
+                 :value.shape[1]] = value
+
+        for algorithm, dimension in changed:
+            algorithm_cube = cube.select([algorithm])
+            for parameter in cube.parameters:
+                means = algorithm_cube.get_means(dimension=dimension, parameter=parameter)[0]
+                stds = algorithm_cube.get_stds(dimension=dimension, parameter=parameter)[0]
+
+                comparisons[cube.dimension_index[dimension],
+                            cube.parameter_index[parameter],
+                            :,
+                            cube.algorithm_index[algorithm]] = np.stack([means, stds], axis=1).reshape(-1)
+
+        DataAcquisitionProvider.__store_cache(cube, comparisons, sorted({dimension for _, dimension in changed}))
+
+        return True
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def __update_streamed_cache(header, files, changed, comparisons):
+        """
+        Recomputes only the changed (algorithm, dimension) slices of the cache from running moments.
+
+        The runs are not kept, hence the snapshot is stored without them.
+
+        :param dict header: Labels of each axis, as stored in the snapshot header
+        :param list files: A list of the (algorithm, problem, dimension, path) tuples of the changed slices
+        :param set changed: A set of (algorithm, dimension) tuples to be recomputed
+        :param np.ndarray comparisons: A writable copy of the snapshot's comparisons array
+        """
+
+        raw = DataAcquisitionProvider.__read_algorithm_files([file[3] for file in files], streaming=True)
+
+        cube = RunCube(np.empty((len(header['algorithms']), len(header['problems']),
+                                 len(header['dimensions']), len(header['parameters']), 0)),
+                       header['algorithms'], header['problems'], header['dimensions'], header['parameters'])
+
+        for algorithm, dimension in changed:
+            comparisons[cube.dimension_index[dimension], :, :, cube.algorithm_index[algorithm]] = np.nan
+
+        for (algorithm, problem, dimension, _), value in zip(files, raw):
+            value = value[:len(cube.parameters)]
+            rows = value.count.shape[0]
+            problem_position = 2 * cube.problem_index[problem]
+
+            comparisons[cube.dimension_index[dimension], :rows, problem_position,
+                        cube.algorithm_index[algorithm]] = value.mean
+            comparisons[cube.dimension_index[dimension], :rows, problem_position + 1,
+                        cube.algorithm_index[algorithm]] = value.get_std()
+
+        DataAcquisitionProvider.__store_cache(cube, comparisons, sorted({dimension for _, dimension in changed}))
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def cache_algorithms_comparisons():
+        """
+        Collects a snapshot of algorithms comparisons and raw runs for faster fetch in the future.
 
-        for dimension in algorithms_comparisons:
-            for parameter in algorithms_comparisons[dimension]:
-                file_directory = f'{root_directory}/{dimension}D/{parameter}.csv'
+        Besides the CSV tables, a binary snapshot is stored, which is memory-mapped when opened,
+        hence neither the tables nor the raw txt files have to be parsed again.
+        A manifest of the raw txt files' fingerprints is stored as well, hence subsequent calls
+        only recompute the (algorithm, dimension) slices whose files changed.
+        """
+
+        directory = DataAcquisitionProvider.__algorithms_raw_directory
 
-                if not os.path.exists(os.path.dirname(file_directory)):
-                    os.makedirs(os.path.dirname(file_directory))
+        files = DataAcquisitionProvider.__get_algorithm_files()
+        fingerprints = CacheManifestProvider.collect_fingerprints(files)
+        changed = CacheManifestProvider.get_changed_slices(directory, fingerprints)
 
-                f = open(f'{file_directory}', "w+")
-                f.write(f'# Timestamp: {datetime.utcnow()}\n')
-                f.close()
+        if changed is not None and len(changed) == 0 and SnapshotProvider.has_snapshot():
+            print('Cached comparisons are up to date')
+            return
 
-                algorithms_comparisons[dimension][parameter].to_csv(f'{file_directory}', mode='a')
+        if changed is None or not DataAcquisitionProvider.__update_cache(files, changed):
+            print('Caching every slice, this is a one time process...')
+            DataAcquisitionProvider.__rebuild_cache()
+
+        CacheManifestProvider.save_manifest(directory, fingerprints)
+
+        # The refreshed snapshot is memory-mapped again on the next access
+        DataAcquisitionProvider.__reset()
 
     @staticmethod
+    @InstrumentationHandler.instrument()
+    def register_algorithm(algorithm):
+        """
+        Splices a newly added algorithm into the cached comparisons, without processing the other algorithms.
+
+        Only the raw txt files of the new algorithm are read, its column is inserted into every cached
+        (dimension, parameter) table and the snapshot, then the memoized results are discarded, hence rankings and
+        tests are recomputed on their next access.
+        If the cache cannot be spliced (e.g. no snapshot is stored, or other algorithms changed as well),
+        the changed slices are cached as cache_algorithms_comparisons does.
+
+        :param str algorithm: Specify the algorithm, as named by its directory within __algorithms_raw_directory
+        """
+
+        directory = DataAcquisitionProvider.__algorithms_raw_directory
+
+        if algorithm == '' or not os.path.isdir(f'{directory}/{algorithm}'):
+            raise ValueError('Invalid algorithm value')
+
+        if SnapshotProvider.has_snapshot() and algorithm in SnapshotProvider.get_header()['algorithms']:
+            print(f'{algorithm} is already registered, updating its changed slices...')
+            DataAcquisitionProvider.cache_algorithms_comparisons()
+            return
+
+        files = DataAcquisitionProvider.__get_algorithm_files()
+        fingerprints = CacheManifestProvider.collect_fingerprints(files)
+        changed = CacheManifestProvider.get_changed_slices(directory, fingerprints)
+
+        if changed is None or {changed_algorithm for changed_algorithm, _ in changed} != {algorithm} or \
+                not DataAcquisitionProvider.__update_cache(files, changed, new_algorithm=algorithm):
+            print(f'{algorithm} cannot be spliced into the cache, caching every changed slice...')
+            DataAcquisitionProvider.cache_algorithms_comparisons()
+            return
+
+        CacheManifestProvider.save_manifest(directory, fingerprints)
+
+        print(f'Registered {algorithm}')
+
+        # The spliced snapshot is memory-mapped again on the next access
+        DataAcquisitionProvider.__reset()
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
     def __get_algorithms_comparisons(fast_fetch=True):
         """
-        Processes the loaded raw txt file into a dataframe suitable for algorithms comparisons.
+        Processes the loaded raw txt file into a dataframe suitable for algorithms comparisons,
+        each slice is only processed on its first access.
 
         :param bool fast_fetch: Retrieves algorithms comparisons from a saved snapshot instantly
-        :return: A dictionary of dimensions containing a dictionary of parameters
-                 containing dataframes as the value pair, {str: {str: DataFrame()}}.
         """
 
         if fast_fetch:
+            DataAcquisitionProvider.__refresh_stale_cache()
             DataAcquisitionProvider.__algorithms_comparisons = \
                 DataAcquisitionProvider.__get_cached_algorithms_comparisons()
             return
 
-        print('Reordering Dataframe, this is a one time process...')
-
-        dataframes = {}
-        processed = 0
-
-        for dimension in DataManifestProvider.DIMENSIONS:
-            dataframes[dimension] = {}
-            for parameter in DataManifestProvider.PARAMETERS:
-                print(ProgressHandler.show_progress(processed, len(DataManifestProvider.DIMENSIONS) * len(
-                    DataManifestProvider.PARAMETERS)))
-                processed += 1
-                dataframes[dimension][parameter] = \
-                    DataAcquisitionProvider.__get_algorithms_performance_dataframe_by_dimension_and_parameter(
-                        dimension=dimension, parameter=parameter)
-
-        ProgressHandler.reset_progress()
-
-        DataAcquisitionProvider.__algorithms_comparisons = dataframes
+        DataAcquisitionProvider.__algorithms_comparisons = DataAcquisitionProvider.__get_lazy_comparisons(
+            DataAcquisitionProvider.__get_algorithms_performance_dataframe_by_dimension_and_parameter)
 
     @staticmethod
-    def get_algorithms_comparisons(fast_fetch=True):
+    @InstrumentationHandler.instrument()
+    def get_algorithms_comparisons(fast_fetch=True, copy=False):
         """
         Calls __get_algorithms_comparisons if __algorithms_comparisons is None, otherwise,
         it retrieves __algorithms_comparisons immediately.
 
+        Slices are loaded lazily, hence accessing a single slice only costs that slice's I/O.
+        Unless a copy is requested, the retrieved dataframes share read-only values with the cache.
+
         :param bool fast_fetch: Retrieves algorithms comparisons from a saved snapshot instantly
+        :param bool copy: Specify whether each accessed dataframe should be a writable deep copy
         :return: A dictionary of dimensions containing a dictionary of parameters
                  containing dataframes as the value pair, {str: {str: DataFrame()}}.
         """
@@ -263,4 +1102,179 @@ class DataAcquisitionProvider:
         if DataAcquisitionProvider.__algorithms_comparisons is None:
             DataAcquisitionProvider.__get_algorithms_comparisons(fast_fetch=fast_fetch)
 
-        return copy.deepcopy(DataAcquisitionProvider.__algorithms_comparisons)
+        if copy:
+            return DataAcquisitionProvider.__algorithms_comparisons.as_copies()
+
+        return DataAcquisitionProvider.__algorithms_comparisons
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def get_algorithms_comparison(dimension=10, parameter=0, copy=False):
+        """
+        Retrieves the algorithms comparison of a single dimension and parameter.
+
+        :param int dimension: Specify the desired dimension (must be within 'DataManifestProvider.DIMENSIONS')
+        :param int parameter: Specify the desired parameter (must be within 'DataManifestProvider.PARAMETERS')
+        :param bool copy: Specify whether the dataframe should be a writable deep copy, rather than a read-only view
+        :return: A dataframe indicating each algorithm performance for a selected dimension and parameter
+        """
+
+        if dimension not in DataManifestProvider.DIMENSIONS:
+            raise ValueError('Invalid dimension value')
+        if parameter not in DataManifestProvider.PARAMETERS:
+            raise ValueError('Invalid parameter value')
+
+        return DataAcquisitionProvider.get_algorithms_comparisons(copy=copy)[dimension][parameter]
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    @MemoizationHandler.memoize(fingerprint=lambda: DataAcquisitionProvider.get_data_fingerprint())
+    def get_algorithms_means(dimension=10, parameter=0):
+        """
+        Retrieves the mean of each algorithm for each problem, dropping problems and algorithms without any value.
+
+        :param int dimension: Specify the desired dimension (must be within 'DataManifestProvider.DIMENSIONS')
+        :param int parameter: Specify the desired parameter (must be within 'DataManifestProvider.PARAMETERS')
+        :return: A float64 dataframe with the problems as rows and the algorithms as columns
+        """
+
+        df = DataAcquisitionProvider.get_algorithms_comparison(dimension=dimension, parameter=parameter)
+
+        return df \
+            .xs('Mean', level='Measurement') \
+            .astype(np.float64) \
+            .dropna(how='all', axis=0) \
+            .dropna(how='all', axis=1)
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def get_algorithms_means_array(dimensions=None, parameters=None):
+        """
+        Stacks the mean of each algorithm for each problem of several slices in a single array.
+
+        Problems and algorithms without any value in a slice are kept as NaN, hence every slice shares the same axes.
+
+        :param list dimensions: Specify the desired dimensions, default is 'DataManifestProvider.DIMENSIONS'
+        :param list parameters: Specify the desired parameters, default is 'DataManifestProvider.PARAMETERS'
+        :return: A tuple of a float64 array of shape (dimensions, parameters, problems, algorithms),
+                 the problems and the algorithms
+        """
+
+        dimensions = list(DataManifestProvider.DIMENSIONS if dimensions is None else dimensions)
+        parameters = list(DataManifestProvider.PARAMETERS if parameters is None else parameters)
+
+        means = {}
+        problems = pd.Index([])
+        algorithms = pd.Index([])
+
+        for dimension in dimensions:
+            for parameter in parameters:
+                df = DataAcquisitionProvider.get_algorithms_comparison(dimension=dimension, parameter=parameter)
+                df = df.xs('Mean', level='Measurement')
+
+                means[(dimension, parameter)] = df
+                problems = problems.union(df.index, sort=False)
+                algorithms = algorithms.union(df.columns, sort=False)
+
+        values = np.full((len(dimensions), len(parameters), len(problems), len(algorithms)), np.nan)
+
+        for (dimension, parameter), df in means.items():
+            values[dimensions.index(dimension), parameters.index(parameter)] = \
+                df.reindex(index=problems, columns=algorithms).to_numpy(dtype=np.float64)
+
+        return values, problems.to_list(), algorithms.to_list()
+
+    @staticmethod
+    def __is_memory_mapped(values):
+        """
+        Checks whether an array is backed by a memory-mapped file.
+
+        :param np.ndarray values: Specify the array
+        :return: True if the array, or any array it is a view of, is memory-mapped
+        """
+
+        while values is not None:
+            if isinstance(values, np.memmap):
+                return True
+            values = values.base if isinstance(values, np.ndarray) else None
+
+        return False
+
+    @staticmethod
+    def __get_dataframes_memory(dataframes):
+        """
+        Measures the memory held by dataframes, counting shared labels once.
+
+        :param list dataframes: Specify the dataframes
+        :return: A dictionary of the number of 'dataframes', the bytes of their 'values' (split by dtype in 'dtypes'),
+                 of their memory-mapped values, of their 'labels' and in total, and the number of distinct labels
+        """
+
+        labels = {}
+        dtypes = {}
+        memory_mapped = 0
+
+        for df in dataframes:
+            for axis in [df.index, df.columns]:
+                labels.setdefault(id(axis), axis)
+
+            # Slices of the snapshot hold a single dtype, and wrap the memory-mapped array without copying it
+            if df.dtypes.nunique() == 1 and DataAcquisitionProvider.__is_memory_mapped(df.to_numpy()):
+                memory_mapped += int(df.memory_usage(index=False).sum())
+                continue
+
+            for dtype, size in zip(df.dtypes, df.memory_usage(index=False)):
+                dtypes[str(dtype)] = dtypes.get(str(dtype), 0) + int(size)
+
+        labels_bytes = int(sum(axis.memory_usage(deep=True) for axis in labels.values()))
+        values_bytes = sum(dtypes.values())
+
+        return {'dataframes': len(dataframes), 'values': values_bytes, 'dtypes': dtypes,
+                'memory_mapped': memory_mapped, 'labels': labels_bytes, 'label_objects': len(labels),
+                'bytes': values_bytes + labels_bytes}
+
+    @staticmethod
+    def get_memory_report():
+        """
+        Measures the memory held by each loaded store.
+
+        Memory-mapped arrays (e.g. the run cube and the comparisons read from the snapshot) are reported apart,
+        since they are paged in from the file on access rather than held in memory.
+
+        :return: A dictionary of 'raw' (the raw dataframes), 'cube' (the run cube), 'moments' (the running moments)
+                 and 'comparisons' (the loaded slices), each None if not loaded, along with 'compact' and the
+                 'bytes' held in total
+        """
+
+        report = {'compact': DataAcquisitionProvider.__compact, 'raw': None, 'cube': None, 'moments': None,
+                  'comparisons': None}
+
+        raw = DataAcquisitionProvider.__algorithms_raw
+        if raw is not None:
+            report['raw'] = DataAcquisitionProvider.__get_dataframes_memory(
+                [df for problems in raw.values() for dimensions in problems.values() for df in dimensions.values()])
+
+        cube = DataAcquisitionProvider.__algorithms_cube
+        if cube is not None:
+            memory_mapped = DataAcquisitionProvider.__is_memory_mapped(cube.values)
+            report['cube'] = {'shape': list(cube.values.shape), 'dtype': str(cube.values.dtype),
+                              'memory_mapped': memory_mapped, 'values': cube.values.nbytes,
+                              'bytes': 0 if memory_mapped else cube.values.nbytes}
+
+        moments = DataAcquisitionProvider.__algorithms_moments
+        if moments is not None:
+            arrays = [moments.moments.count, moments.moments.mean, moments.moments.m2, moments.moments.minimum,
+                      moments.moments.maximum]
+            report['moments'] = {'shape': list(moments.moments.count.shape),
+                                 'bytes': sum(array.nbytes for array in arrays)}
+
+        comparisons = DataAcquisitionProvider.__algorithms_comparisons
+        if comparisons is not None:
+            report['comparisons'] = DataAcquisitionProvider.__get_dataframes_memory(
+                [comparisons.get_slice(dimension, parameter) for dimension in comparisons
+                 for parameter in comparisons[dimension] if comparisons.is_loaded(dimension, parameter)])
+
+        report['bytes'] = sum(store['bytes'] for store in [report['raw'], report['cube'], report['moments'],
+                                                            report['comparisons']] if store is not None)
+
+        return report
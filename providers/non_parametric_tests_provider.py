@@ -1,13 +1,23 @@
+import os
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 import deprecation
 import numpy as np
 import pandas as pd
-import statsmodels.stats.multitest as smt
-import scikit_posthocs as sp
-from scikit_posthocs import posthoc_nemenyi_friedman
-from scipy.stats import wilcoxon, friedmanchisquare, mannwhitneyu
+from scipy.stats import friedmanchisquare
+
 from enums.adjusted_p_value_methods import AdjustedPValueMethods
+from helpers.instrumentation_handler import InstrumentationHandler
+from helpers.memoization_handler import MemoizationHandler
+from helpers.progress_handler import ProgressHandler
+from helpers.statistics_handler import StatisticsHandler
+from models.friedman_rankings import FriedmanRankings
+from models.friedman_resampling import FriedmanResampling
+from models.nemenyi_matrix import NemenyiMatrix
+from models.tournament_matrix import TournamentMatrix
+from models.wilcoxon_matrix import WilcoxonMatrix
 from providers.data_acquisition_provider import DataAcquisitionProvider
 from providers.data_manifest_provider import DataManifestProvider
 
@@ -16,6 +26,10 @@ class NonParametricTestsProvider:
     """
     Static methods which handles implementing nonparametric tests the transformed data.
 
+    The rankings (get_best_algorithm, __friedman_test, friedman_test, __get_friedman_rankings and
+    get_friedman_resampling) are memoized by MemoizationHandler, keyed by the data fingerprint and the provided
+    arguments.
+
     Methods
     -------
         estimate_best_algorithm(dimension=10, parameter=0):
@@ -24,25 +38,48 @@ class NonParametricTestsProvider:
             Provides a relatively accurate estimation of the best algorithm by calculating the mean of the ranks.
         wilcoxon_test(dimension=10, parameter=0, algorithm_to_compare=''):
             Compare all algorithms with a provided reference algorithm (preferably the best).
+        get_wilcoxon_matrix(dimension=10, parameter=0, chunk_size=4096):
+            Compares every pair of algorithms with the Wilcoxon signed-rank test.
         __friedman_test(dimension=10, parameter=0):
             Conducts friedman test on each algorithm.
         friedman_test(dimension=10, parameter=0):
             Returns the ranking of each algorithm.
+        __get_friedman_rankings(dimensions, parameters):
+            Ranks every provided slice at once, grouping the slices which share the same problems and algorithms.
+        get_friedman_rankings(dimensions=None, parameters=None):
+            Returns the ranks, mean ranks, statistic and p-value of many slices at once.
+        get_friedman_resampling(dimension=10, parameter=0, replicates=1000, confidence=0.95, seed=0, workers=1,
+                                batch_size=250):
+            Draws bootstrap and permutation replicates of the Friedman ranking of a single slice.
+        friedman_test_resampled(dimension=10, parameter=0, alpha=0.05, replicates=1000, confidence=0.95, seed=0,
+                                workers=1):
+            Returns the ranking of each algorithm along with its confidence interval and the permutation p-value.
         get_algorithms_comparisons_wtl(dimension=10, parameter=0):
             Adds win-tie-lose attribute with the get_algorithms_comparisons method.
+        __get_identical_runs(x, y):
+            Checks which pairs of samples hold the same runs, in the same order, once their missing runs are dropped.
         get_algorithms_comparisons_wtl_mannwhitneyu(dimension=10, parameter=0, alpha=0.05):
             Adds win-tie-lose attribute with the get_algorithms_comparisons method using Mann–Whitney U test
             and utilizing the raw iterations, does not respect caching.
+        get_tournament_slice(runs, alpha=0.05, chunk_size=256):
+            Holds the Mann–Whitney U tournament of a single slice's runs.
+        get_mann_whitney_tournament(dimensions=None, parameters=None, alpha=0.05, workers=1, chunk_size=256):
+            Holds the Mann–Whitney U tournament of every pair of algorithms over the raw iterations of many slices.
         __get_nemenyi_post_hoc_test(dimension=10, parameter=0, algorithm_to_compare=''):
             Displays adjusted p values from Nemenyi test.
         __get_nemenyi_friedman_post_hoc_test(dimension=10, parameter=0, algorithm_to_compare=''):
             Displays adjusted p values from Nemenyi-friedman test, used when Friedman p is significant.
+        __get_nemenyi_friedman_matrix(dimensions, parameters, alpha):
+            Conducts the Nemenyi post hoc test of every pair of algorithms from the rank cube of every provided slice.
+        get_nemenyi_friedman_matrix(dimensions=None, parameters=None, alpha=0.05):
+            Returns the Nemenyi p-value of every pair of algorithms and the critical difference of many slices at once.
 
         get_post_hoc_tests(dimension=10, parameter=0, algorithm_to_compare=''):
             Displays unadjusted p values obtained from wilcoxon in addition with selected correction methods.
     """
 
     @staticmethod
+    @InstrumentationHandler.instrument()
     @deprecation.deprecated(details="Use the get_best_algorithm function instead")
     def estimate_best_algorithm(dimension=10, parameter=0):
         """
@@ -58,7 +95,7 @@ class NonParametricTestsProvider:
         if parameter not in DataManifestProvider.PARAMETERS:
             raise ValueError('Invalid parameter value')
 
-        df = DataAcquisitionProvider.get_algorithms_comparisons()[dimension][parameter]
+        df = DataAcquisitionProvider.get_algorithms_comparison(dimension=dimension, parameter=parameter)
 
         algorithm_mean = {}
         count = 0
@@ -78,6 +115,8 @@ class NonParametricTestsProvider:
         return best
 
     @staticmethod
+    @InstrumentationHandler.instrument()
+    @MemoizationHandler.memoize(fingerprint=DataAcquisitionProvider.get_data_fingerprint)
     def get_best_algorithm(dimension=10, parameter=0):
         """
         Provides a relatively accurate estimation of the best algorithm by calculating the mean of the ranks.
@@ -96,6 +135,7 @@ class NonParametricTestsProvider:
         return best_algorithm
 
     @staticmethod
+    @InstrumentationHandler.instrument()
     def wilcoxon_test(dimension=10, parameter=0, algorithm_to_compare='', alpha=0.05):
         """
         Compare all algorithms with a provided reference algorithm (preferably the best).
@@ -114,33 +154,27 @@ class NonParametricTestsProvider:
             algorithm_to_compare = NonParametricTestsProvider.get_best_algorithm(dimension=dimension,
                                                                                  parameter=parameter)
 
-        df = DataAcquisitionProvider.get_algorithms_comparisons()[dimension][parameter]
-
-        sample_size = len(df.index.get_level_values('Problem').unique())
+        sample_size = len(DataAcquisitionProvider.get_algorithms_comparison(dimension=dimension, parameter=parameter)
+                          .index.get_level_values('Problem').unique())
 
-        for problem in df.index.get_level_values('Problem').unique():
-            for algorithm in df.loc[problem]:
-                df.loc[problem][algorithm]['Std'] = None
+        df = DataAcquisitionProvider.get_algorithms_means(dimension=dimension, parameter=parameter)
 
-        df = df \
-            .reset_index(level=1, drop=True) \
-            .dropna(how='all', axis=0) \
-            .dropna(how='all', axis=1)
+        # Every algorithm is tested against the reference in a single batch
+        values = df.to_numpy().T
+        statistics, _, _, p_values = StatisticsHandler.wilcoxon(values, df[algorithm_to_compare].to_numpy())
 
         algorithm_values = []
 
-        for column in df:
+        for index, column in enumerate(df):
             if column != algorithm_to_compare:
-                wilcoxon_result = wilcoxon(df[column].tolist(), df[algorithm_to_compare].tolist())
-
-                reject = 'X' if wilcoxon_result[1] < alpha else '✓'
+                reject = 'X' if p_values[index] < alpha else '✓'
                 reject = f'({reject})'
 
                 algorithm_values.append([
-                    wilcoxon_result[1],
+                    p_values[index],
                     reject,
-                    (sample_size * (sample_size + 1) / 2) - wilcoxon_result[0],
-                    wilcoxon_result[0]
+                    (sample_size * (sample_size + 1) / 2) - statistics[index],
+                    statistics[index]
                 ])
             else:
                 algorithm_values.append([1, '(✓)', 0, 0])
@@ -153,6 +187,58 @@ class NonParametricTestsProvider:
         return wilcoxon_result.T
 
     @staticmethod
+    @InstrumentationHandler.instrument()
+    @MemoizationHandler.memoize(fingerprint=DataAcquisitionProvider.get_data_fingerprint)
+    def get_wilcoxon_matrix(dimension=10, parameter=0, chunk_size=4096):
+        """
+        Compares every pair of algorithms with the Wilcoxon signed-rank test.
+
+        The pairs are tested in batches of chunk_size, hence the memory stays bounded however many algorithms
+        are compared, while each pair yields the same statistic and p-value as 'wilcoxon_test'.
+
+        :param int dimension: Specify the desired dimension (must be within 'DataManifestProvider.DIMENSIONS')
+        :param int parameter: Specify the desired parameter (must be within 'DataManifestProvider.PARAMETERS')
+        :param int chunk_size: Specify the number of pairs tested in a single batch
+        :return: A WilcoxonMatrix
+        """
+
+        if dimension not in DataManifestProvider.DIMENSIONS:
+            raise ValueError('Invalid dimension value')
+        if parameter not in DataManifestProvider.PARAMETERS:
+            raise ValueError('Invalid parameter value')
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError('chunk_size must be a positive integer')
+
+        sample_size = len(DataAcquisitionProvider.get_algorithms_comparison(dimension=dimension, parameter=parameter)
+                          .index.get_level_values('Problem').unique())
+
+        df = DataAcquisitionProvider.get_algorithms_means(dimension=dimension, parameter=parameter)
+
+        values = df.to_numpy().T
+        k = len(df.columns)
+
+        statistics = np.full((k, k), np.nan)
+        r_plus = np.full((k, k), np.nan)
+        p_values = np.full((k, k), np.nan)
+
+        # Only the upper triangle is tested, since swapping a pair swaps its rank sums and keeps its p-value
+        first, second = np.triu_indices(k, k=1)
+
+        for start in range(0, len(first), chunk_size):
+            i = first[start:start + chunk_size]
+            j = second[start:start + chunk_size]
+
+            statistic, positive, negative, p_value = StatisticsHandler.wilcoxon(values[i], values[j])
+
+            statistics[i, j] = statistics[j, i] = statistic
+            r_plus[i, j], r_plus[j, i] = positive, negative
+            p_values[i, j] = p_values[j, i] = p_value
+
+        return WilcoxonMatrix(statistics, r_plus, p_values, df.columns.to_list(), sample_size)
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    @MemoizationHandler.memoize(fingerprint=DataAcquisitionProvider.get_data_fingerprint)
     def __friedman_test(dimension=10, parameter=0):
         """
         Conducts friedman test on each algorithm.
@@ -167,16 +253,7 @@ class NonParametricTestsProvider:
         if parameter not in DataManifestProvider.PARAMETERS:
             raise ValueError('Invalid parameter value')
 
-        df = DataAcquisitionProvider.get_algorithms_comparisons()[dimension][parameter]
-
-        for problem in df.index.get_level_values('Problem').unique():
-            for algorithm in df.loc[problem]:
-                df.loc[problem][algorithm]['Std'] = None
-
-        df = df \
-            .reset_index(level=1, drop=True) \
-            .dropna(how='all', axis=0) \
-            .dropna(how='all', axis=1)
+        df = DataAcquisitionProvider.get_algorithms_means(dimension=dimension, parameter=parameter)
 
         algorithm_values = {}
         for column in df:
@@ -187,6 +264,8 @@ class NonParametricTestsProvider:
         return result
 
     @staticmethod
+    @InstrumentationHandler.instrument()
+    @MemoizationHandler.memoize(fingerprint=DataAcquisitionProvider.get_data_fingerprint)
     def friedman_test(dimension=10, parameter=0, alpha=0.05):
         """
         Returns the ranking of each algorithm.
@@ -202,16 +281,7 @@ class NonParametricTestsProvider:
         if parameter not in DataManifestProvider.PARAMETERS:
             raise ValueError('Invalid parameter value')
 
-        df = DataAcquisitionProvider.get_algorithms_comparisons()[dimension][parameter]
-
-        for problem in df.index.get_level_values('Problem').unique():
-            for algorithm in df.loc[problem]:
-                df.loc[problem][algorithm]['Std'] = None
-
-        df = df \
-            .reset_index(level=1, drop=True) \
-            .dropna(how='all', axis=0) \
-            .dropna(how='all', axis=1)
+        df = DataAcquisitionProvider.get_algorithms_means(dimension=dimension, parameter=parameter)
 
         df.index.name = 'Algorithm'
 
@@ -230,6 +300,186 @@ class NonParametricTestsProvider:
         return df
 
     @staticmethod
+    @InstrumentationHandler.instrument()
+    @MemoizationHandler.memoize(fingerprint=DataAcquisitionProvider.get_data_fingerprint)
+    def __get_friedman_rankings(dimensions, parameters):
+        """
+        Ranks every provided slice at once, grouping the slices which share the same problems and algorithms.
+
+        :param tuple dimensions: Specify the desired dimensions
+        :param tuple parameters: Specify the desired parameters
+        :return: A FriedmanRankings
+        """
+
+        values, problems, algorithms = DataAcquisitionProvider.get_algorithms_means_array(dimensions=list(dimensions),
+                                                                                          parameters=list(parameters))
+
+        ranks = np.full(values.shape, np.nan)
+        mean_ranks = np.full(values.shape[:2] + values.shape[3:], np.nan)
+        statistics = np.full(values.shape[:2], np.nan)
+        p_values = np.full(values.shape[:2], np.nan)
+
+        # Problems and algorithms without any value are dropped from a slice, just as friedman_test does,
+        # hence only the slices sharing the same available problems and algorithms can be stacked together
+        rows = ~np.isnan(values).all(axis=3)
+        columns = ~np.isnan(values).all(axis=2)
+
+        groups = defaultdict(list)
+        for dimension_position in range(values.shape[0]):
+            for parameter_position in range(values.shape[1]):
+                mask = (rows[dimension_position, parameter_position].tobytes(),
+                        columns[dimension_position, parameter_position].tobytes())
+                groups[mask].append((dimension_position, parameter_position))
+
+        for positions in groups.values():
+            row_mask = rows[positions[0]]
+            column_mask = columns[positions[0]]
+
+            if row_mask.sum() == 0 or column_mask.sum() < 3:
+                continue
+
+            batch = values[tuple(np.array(positions).T)][:, row_mask][:, :, column_mask]
+
+            with np.errstate(invalid='ignore', divide='ignore'):
+                batch_ranks, batch_mean_ranks, batch_statistics, batch_p_values = StatisticsHandler.friedman(batch)
+
+            for index, position in enumerate(positions):
+                ranks[position][np.ix_(row_mask, column_mask)] = batch_ranks[index]
+                mean_ranks[position][column_mask] = batch_mean_ranks[index]
+                statistics[position] = batch_statistics[index]
+                p_values[position] = batch_p_values[index]
+
+        return FriedmanRankings(ranks, mean_ranks, statistics, p_values, dimensions, parameters, problems, algorithms)
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def get_friedman_rankings(dimensions=None, parameters=None):
+        """
+        Returns the ranks, mean ranks, statistic and p-value of many slices at once.
+
+        The ranks of every slice are computed in a single vectorized pass, instead of ranking slice by slice,
+        and the resulting rankings are memoized for the other tests to reuse.
+
+        :param list dimensions: Specify the desired dimensions, default is 'DataManifestProvider.DIMENSIONS'
+        :param list parameters: Specify the desired parameters, default is 'DataManifestProvider.PARAMETERS'
+        :return: A FriedmanRankings
+        """
+
+        dimensions = tuple(DataManifestProvider.DIMENSIONS if dimensions is None else dimensions)
+        parameters = tuple(DataManifestProvider.PARAMETERS if parameters is None else parameters)
+
+        for dimension in dimensions:
+            if dimension not in DataManifestProvider.DIMENSIONS:
+                raise ValueError('Invalid dimension value')
+        for parameter in parameters:
+            if parameter not in DataManifestProvider.PARAMETERS:
+                raise ValueError('Invalid parameter value')
+
+        return NonParametricTestsProvider.__get_friedman_rankings(dimensions=tuple(int(d) for d in dimensions),
+                                                                  parameters=tuple(int(p) for p in parameters))
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    @MemoizationHandler.memoize(fingerprint=DataAcquisitionProvider.get_data_fingerprint)
+    def get_friedman_resampling(dimension=10, parameter=0, replicates=1000, confidence=0.95, seed=0, workers=1,
+                                batch_size=250):
+        """
+        Draws bootstrap and permutation replicates of the Friedman ranking of a single slice.
+
+        Replicates are drawn in batches, each from its own child of the seed, hence the replicates only depend on the
+        seed and the batch size, whatever the number of processes the batches are spread over.
+        Problems missing any algorithm's mean are left out, since their ranks would not be comparable.
+
+        :param int dimension: Specify the desired dimension (must be within 'DataManifestProvider.DIMENSIONS')
+        :param int parameter: Specify the desired parameter (must be within 'DataManifestProvider.PARAMETERS')
+        :param int replicates: Specify the number of replicates of each kind
+        :param float confidence: Specify the confidence level of the intervals
+        :param int seed: Specify the seed of the replicates
+        :param int workers: Specify the number of processes, None uses every available core, 1 runs serially
+        :param int batch_size: Specify the number of replicates drawn in a single batch
+        :return: A FriedmanResampling
+        """
+
+        if dimension not in DataManifestProvider.DIMENSIONS:
+            raise ValueError('Invalid dimension value')
+        if parameter not in DataManifestProvider.PARAMETERS:
+            raise ValueError('Invalid parameter value')
+        if not isinstance(replicates, int) or replicates < 1:
+            raise ValueError('replicates must be a positive integer')
+        if not 0 < confidence < 1:
+            raise ValueError('Invalid confidence value')
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError('batch_size must be a positive integer')
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError('workers must be a positive integer')
+
+        df = DataAcquisitionProvider.get_algorithms_means(dimension=dimension, parameter=parameter).dropna()
+
+        if df.shape[1] < 3:
+            raise ValueError('At least 3 algorithms are required to be ranked')
+
+        ranks, mean_ranks, statistic, _ = StatisticsHandler.friedman(df.to_numpy())
+
+        sizes = [min(batch_size, replicates - start) for start in range(0, replicates, batch_size)]
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+        draw = partial(StatisticsHandler.friedman_replicates, ranks)
+        workers = min(workers, len(sizes))
+
+        if workers <= 1:
+            batches = list(map(draw, sizes, seeds))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                batches = list(executor.map(draw, sizes, seeds))
+
+        return FriedmanResampling(mean_ranks,
+                                  np.concatenate([batch[0] for batch in batches]),
+                                  statistic,
+                                  np.concatenate([batch[1] for batch in batches]),
+                                  confidence,
+                                  df.columns.to_list(),
+                                  seed)
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def friedman_test_resampled(dimension=10, parameter=0, alpha=0.05, replicates=1000, confidence=0.95, seed=0,
+                                workers=1):
+        """
+        Returns the ranking of each algorithm along with its confidence interval and the permutation p-value.
+
+        :param int dimension: Specify the desired dimension (must be within 'DataManifestProvider.DIMENSIONS')
+        :param int parameter: Specify the desired parameter (must be within 'DataManifestProvider.PARAMETERS')
+        :param float alpha: Specify the level of significance
+        :param int replicates: Specify the number of replicates of each kind
+        :param float confidence: Specify the confidence level of the intervals
+        :param int seed: Specify the seed of the replicates
+        :param int workers: Specify the number of processes, None uses every available core, 1 runs serially
+        :return: A dataframe whose 'Friedman' column is the output of 'friedman_test' with an additional
+                 'Permutation P-Value' row, along with the 'CI Lower' and 'CI Upper' columns of each algorithm
+        """
+
+        friedman = NonParametricTestsProvider.friedman_test(dimension=dimension, parameter=parameter, alpha=alpha)
+        resampling = NonParametricTestsProvider.get_friedman_resampling(dimension=dimension,
+                                                                         parameter=parameter,
+                                                                         replicates=replicates,
+                                                                         confidence=confidence,
+                                                                         seed=seed,
+                                                                         workers=workers)
+
+        p_value = resampling.get_permutation_p_value()
+        reject = 'X' if p_value < alpha else '✓'
+
+        friedman = friedman.copy()
+        friedman['Permutation P-Value'] = f'{p_value}  ({reject})'
+
+        return pd.concat([friedman.rename('Friedman'), resampling.get_confidence_intervals()], axis=1)
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
     @deprecation.deprecated(details="Use the get_algorithms_comparisons_wtl_wilcoxon function instead")
     def get_algorithms_comparisons_wtl(dimension=10, parameter=0):
         """
@@ -245,16 +495,7 @@ class NonParametricTestsProvider:
         if parameter not in DataManifestProvider.PARAMETERS:
             raise ValueError('Invalid parameter value')
 
-        df = DataAcquisitionProvider.get_algorithms_comparisons()[dimension][parameter]
-
-        for problem in df.index.get_level_values('Problem').unique():
-            for algorithm in df.loc[problem]:
-                df.loc[problem][algorithm]['Std'] = None
-
-        df = df \
-            .reset_index(level=1, drop=True) \
-            .dropna(how='all', axis=0) \
-            .dropna(how='all', axis=1)
+        df = DataAcquisitionProvider.get_algorithms_means(dimension=dimension, parameter=parameter)
 
         df.index.name = 'Algorithm'
 
@@ -282,12 +523,28 @@ class NonParametricTestsProvider:
                                f'{value.get("draw", 0)}/'
                                f'{value.get("lose", 0)}')
 
-        results_df = DataAcquisitionProvider.get_algorithms_comparisons()[dimension][parameter] \
+        results_df = DataAcquisitionProvider.get_algorithms_comparison(dimension=dimension, parameter=parameter) \
             .append(pd.DataFrame({'w/t/l': results_str}, index=df.columns).T)
 
         return results_df
 
     @staticmethod
+    def __get_identical_runs(x, y):
+        """
+        Checks which pairs of samples hold the same runs, in the same order, once their missing runs are dropped.
+
+        :param np.ndarray x: An array of shape (..., runs), NaN for missing runs
+        :param np.ndarray y: An array of the same shape
+        :return: A boolean array shaped as the samples without their last axis
+        """
+
+        x = StatisticsHandler.compact(x)
+        y = StatisticsHandler.compact(y)
+
+        return ((x == y) | (np.isnan(x) & np.isnan(y))).all(axis=-1)
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
     def get_algorithms_comparisons_wtl_mannwhitneyu(dimension=10, parameter=0, alpha=0.05):
         """
         Adds win-tie-lose attribute with the get_algorithms_comparisons method using Mann–Whitney U test
@@ -304,68 +561,167 @@ class NonParametricTestsProvider:
         if parameter not in DataManifestProvider.PARAMETERS:
             raise ValueError('Invalid parameter value')
 
-        df = DataAcquisitionProvider.get_algorithms_comparisons()[dimension][parameter]
-
-        for problem in df.index.get_level_values('Problem').unique():
-            for algorithm in df.loc[problem]:
-                df.loc[problem][algorithm]['Std'] = None
-
-        df = df \
-            .reset_index(level=1, drop=True) \
-            .dropna(how='all', axis=0) \
-            .dropna(how='all', axis=1)
+        df = DataAcquisitionProvider.get_algorithms_means(dimension=dimension, parameter=parameter)
 
         df.index.name = 'Algorithm'
 
         df = df.astype('str')
 
-        total_result = defaultdict(dict)
-
-        raw_df = DataAcquisitionProvider.get_algorithms_raw()
+        cube = DataAcquisitionProvider.get_algorithms_cube()
 
         best_algorithm = NonParametricTestsProvider.get_best_algorithm(dimension=dimension, parameter=parameter)
 
-        for rowIndex, row in df.iterrows():
-            for columnIndex, value in row.items():
+        # Runs of shape (algorithms, problems, runs), ordered as the table, along with the best algorithm's runs
+        runs = cube.get_slice(dimension, parameter)
+        runs = runs[[cube.algorithm_index[algorithm] for algorithm in df.columns]]
+        runs = runs[:, [cube.problem_index[int(problem)] for problem in df.index]]
+        best_runs = runs[df.columns.get_loc(best_algorithm)]
 
-                problem = str(rowIndex)
-                algorithm = columnIndex
-                dimension = str(dimension)
-                parameter = parameter
+        best_runs = np.broadcast_to(best_runs, runs.shape)
 
-                best_algorithm_iterations = raw_df[algorithm][problem][str(dimension)].loc[parameter]
-                this_algorithm_iterations = raw_df[best_algorithm][problem][str(dimension)].loc[parameter]
+        # Every cell is tested against the best algorithm in a single batch, identical runs are never different
+        p_values = np.ones(runs.shape[:2])
+        tested = ~NonParametricTestsProvider.__get_identical_runs(runs, best_runs)
 
-                best_algorithm_iterations = best_algorithm_iterations.drop(labels=['mean', 'std'])
-                this_algorithm_iterations = this_algorithm_iterations.drop(labels=['mean', 'std'])
+        if tested.any():
+            p_values[tested] = StatisticsHandler.mannwhitneyu(runs[tested], best_runs[tested])[1]
 
-                if best_algorithm_iterations.equals(this_algorithm_iterations):
-                    p_value = 1
-                else:
-                    p_value = mannwhitneyu(best_algorithm_iterations,
-                                           this_algorithm_iterations)[1]
-
-                if p_value < alpha:
-                    if value < row[best_algorithm]:
-                        df.at[rowIndex, columnIndex] = str(df[columnIndex][rowIndex]) + ' (w)'
-                        total_result[columnIndex]['win'] = total_result[columnIndex].get('win', 0) + 1
-                    else:
-                        df.at[rowIndex, columnIndex] = str(df[columnIndex][rowIndex]) + ' (l)'
-                        total_result[columnIndex]['lose'] = total_result[columnIndex].get('lose', 0) + 1
-                else:
-                    df.at[rowIndex, columnIndex] = str(df[columnIndex][rowIndex]) + ' (t)'
-                    total_result[columnIndex]['draw'] = total_result[columnIndex].get('draw', 0) + 1
+        # The means are compared as they are displayed, just as the table always did
+        values = df.to_numpy(dtype=str).T
+        better = values < df[best_algorithm].to_numpy(dtype=str)
 
-        results_str = []
-        for key, value in total_result.items():
-            results_str.append(f'{value.get("win", 0)}/'
-                               f'{value.get("draw", 0)}/'
-                               f'{value.get("lose", 0)}')
+        significant = p_values < alpha
+        wins = significant & better
+        losses = significant & ~better
+        draws = ~significant
+
+        annotations = np.where(wins, ' (w)', np.where(losses, ' (l)', ' (t)'))
+
+        df = pd.DataFrame(np.char.add(values, annotations).T.astype(object), index=df.index, columns=df.columns)
+
+        results_str = [f'{win}/{draw}/{lose}' for win, draw, lose in zip(wins.sum(axis=-1),
+                                                                        draws.sum(axis=-1),
+                                                                        losses.sum(axis=-1))]
 
         results_df = df.append(pd.DataFrame({'w/t/l': results_str}, index=df.columns).T)
 
         return results_df
 
+    @staticmethod
+    def get_tournament_slice(runs, alpha=0.05, chunk_size=256):
+        """
+        Holds the Mann–Whitney U tournament of a single slice's runs.
+
+        For each problem, an algorithm wins against another one when their runs differ significantly and its mean
+        is lower, loses when its mean is higher, and ties otherwise. Problems where either algorithm has no run are
+        not counted.
+
+        :param np.ndarray runs: An array of shape (algorithms, problems, runs), NaN for missing runs
+        :param float alpha: Specify the level of significance
+        :param int chunk_size: Specify the number of pairs of algorithms tested in a single batch
+        :return: An uint16 array of shape (algorithms, algorithms, 3) holding the (win, tie, lose) of each pair
+        """
+
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError('chunk_size must be a positive integer')
+
+        k = runs.shape[0]
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = np.nansum(runs, axis=-1) / (~np.isnan(runs)).sum(axis=-1)
+
+        results = np.zeros((k, k, 3), dtype=np.uint16)
+
+        # The test is symmetric, hence only the upper triangle is tested and mirrored
+        first, second = np.triu_indices(k, k=1)
+
+        for start in range(0, len(first), chunk_size):
+            i = first[start:start + chunk_size]
+            j = second[start:start + chunk_size]
+
+            x = runs[i]
+            y = runs[j]
+
+            p_values = np.ones(x.shape[:2])
+
+            available = ~np.isnan(x).all(axis=-1) & ~np.isnan(y).all(axis=-1)
+            tested = available & ~NonParametricTestsProvider.__get_identical_runs(x, y)
+
+            if tested.any():
+                p_values[tested] = StatisticsHandler.mannwhitneyu(x[tested], y[tested])[1]
+
+            significant = available & (p_values < alpha)
+            wins = (significant & (means[i] < means[j])).sum(axis=-1)
+            losses = (significant & (means[i] > means[j])).sum(axis=-1)
+            ties = available.sum(axis=-1) - wins - losses
+
+            results[i, j] = np.stack([wins, ties, losses], axis=-1)
+            results[j, i] = np.stack([losses, ties, wins], axis=-1)
+
+        return results
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def get_mann_whitney_tournament(dimensions=None, parameters=None, alpha=0.05, workers=1, chunk_size=256):
+        """
+        Holds the Mann–Whitney U tournament of every pair of algorithms over the raw iterations of many slices.
+
+        Each slice is a separate job, spread over the provided number of processes, and the pairs of each slice are
+        tested in chunks, hence the memory stays bounded however many algorithms are compared.
+
+        :param list dimensions: Specify the desired dimensions, default is 'DataManifestProvider.DIMENSIONS'
+        :param list parameters: Specify the desired parameters, default is 'DataManifestProvider.PARAMETERS'
+        :param float alpha: Specify the level of significance
+        :param int workers: Specify the number of processes, None uses every available core, 1 runs serially
+        :param int chunk_size: Specify the number of pairs of algorithms tested in a single batch
+        :return: A TournamentMatrix
+        """
+
+        dimensions = list(DataManifestProvider.DIMENSIONS if dimensions is None else dimensions)
+        parameters = list(DataManifestProvider.PARAMETERS if parameters is None else parameters)
+
+        for dimension in dimensions:
+            if dimension not in DataManifestProvider.DIMENSIONS:
+                raise ValueError('Invalid dimension value')
+        for parameter in parameters:
+            if parameter not in DataManifestProvider.PARAMETERS:
+                raise ValueError('Invalid parameter value')
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError('workers must be a positive integer')
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError('chunk_size must be a positive integer')
+
+        cube = DataAcquisitionProvider.get_algorithms_cube()
+
+        slices = [(dimension, parameter) for dimension in dimensions for parameter in parameters]
+        hold = partial(NonParametricTestsProvider.get_tournament_slice, alpha=alpha, chunk_size=chunk_size)
+
+        results = np.zeros((len(dimensions), len(parameters), len(cube.algorithms), len(cube.algorithms), 3),
+                           dtype=np.uint16)
+
+        def get_runs():
+            for dimension, parameter in slices:
+                yield np.asarray(cube.get_slice(dimension, parameter))
+
+        workers = min(workers, len(slices))
+
+        with ProgressHandler.track(len(slices), description='Holding the tournament') as progress:
+            if workers <= 1:
+                for (dimension, parameter), tournament in zip(slices, map(hold, get_runs())):
+                    results[dimensions.index(dimension), parameters.index(parameter)] = tournament
+                    progress.update()
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    for (dimension, parameter), tournament in zip(slices, executor.map(hold, get_runs())):
+                        results[dimensions.index(dimension), parameters.index(parameter)] = tournament
+                        progress.update()
+
+        return TournamentMatrix(results, alpha, dimensions, parameters, cube.algorithms)
+
     @staticmethod
     def __get_nemenyi_post_hoc_test(dimension=10, parameter=0, algorithm_to_compare=''):
         """
@@ -386,16 +742,10 @@ class NonParametricTestsProvider:
             algorithm_to_compare = NonParametricTestsProvider.get_best_algorithm(dimension=dimension,
                                                                                  parameter=parameter)
 
-        df = DataAcquisitionProvider.get_algorithms_comparisons()[dimension][parameter]
-
-        for problem in df.index.get_level_values('Problem').unique():
-            for algorithm in df.loc[problem]:
-                df.loc[problem][algorithm]['Std'] = None
+        df = DataAcquisitionProvider.get_algorithms_means(dimension=dimension, parameter=parameter)
 
-        df = df \
-            .reset_index(level=1, drop=True) \
-            .dropna(how='all', axis=0) \
-            .dropna(how='all', axis=1)
+        # scikit_posthocs (along with matplotlib and seaborn) is slow to import, hence it is only imported once needed
+        import scikit_posthocs as sp
 
         p_values = []
         for algorithm in df.columns:
@@ -425,16 +775,9 @@ class NonParametricTestsProvider:
             algorithm_to_compare = NonParametricTestsProvider.get_best_algorithm(dimension=dimension,
                                                                                  parameter=parameter)
 
-        df = DataAcquisitionProvider.get_algorithms_comparisons()[dimension][parameter]
-
-        for problem in df.index.get_level_values('Problem').unique():
-            for algorithm in df.loc[problem]:
-                df.loc[problem][algorithm]['Std'] = None
+        df = DataAcquisitionProvider.get_algorithms_means(dimension=dimension, parameter=parameter)
 
-        df = df \
-            .reset_index(level=1, drop=True) \
-            .dropna(how='all', axis=0) \
-            .dropna(how='all', axis=1)
+        from scikit_posthocs import posthoc_nemenyi_friedman
 
         p_values = []
         for algorithm in df.columns:
@@ -445,6 +788,64 @@ class NonParametricTestsProvider:
         return p_values
 
     @staticmethod
+    @InstrumentationHandler.instrument()
+    @MemoizationHandler.memoize(fingerprint=DataAcquisitionProvider.get_data_fingerprint)
+    def __get_nemenyi_friedman_matrix(dimensions, parameters, alpha):
+        """
+        Conducts the Nemenyi post hoc test of every pair of algorithms from the rank cube of every provided slice.
+
+        :param tuple dimensions: Specify the desired dimensions
+        :param tuple parameters: Specify the desired parameters
+        :param float alpha: Specify the level of significance of the critical differences
+        :return: A NemenyiMatrix
+        """
+
+        rankings = NonParametricTestsProvider.__get_friedman_rankings(dimensions=dimensions, parameters=parameters)
+
+        # Problems without any rank were dropped from their slice before ranking
+        sample_sizes = (~np.isnan(rankings.ranks).all(axis=-1)).sum(axis=-1)
+        k = (~np.isnan(rankings.mean_ranks)).sum(axis=-1)
+
+        p_values = StatisticsHandler.nemenyi_friedman(rankings.mean_ranks, sample_sizes)
+        critical_differences = StatisticsHandler.get_critical_difference(k, sample_sizes, alpha=alpha)
+
+        return NemenyiMatrix(np.array(rankings.mean_ranks), p_values, critical_differences, sample_sizes, alpha,
+                             dimensions, parameters, rankings.algorithms)
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def get_nemenyi_friedman_matrix(dimensions=None, parameters=None, alpha=0.05):
+        """
+        Returns the Nemenyi p-value of every pair of algorithms and the critical difference of many slices at once.
+
+        Unlike the pairwise columns of get_post_hoc_tests, which test each algorithm against the reference alone,
+        every pair is tested against the studentized range of all the ranked algorithms, straight from the memoized
+        Friedman rank cube.
+
+        :param list dimensions: Specify the desired dimensions, default is 'DataManifestProvider.DIMENSIONS'
+        :param list parameters: Specify the desired parameters, default is 'DataManifestProvider.PARAMETERS'
+        :param float alpha: Specify the level of significance of the critical differences
+        :return: A NemenyiMatrix
+        """
+
+        dimensions = tuple(DataManifestProvider.DIMENSIONS if dimensions is None else dimensions)
+        parameters = tuple(DataManifestProvider.PARAMETERS if parameters is None else parameters)
+
+        for dimension in dimensions:
+            if dimension not in DataManifestProvider.DIMENSIONS:
+                raise ValueError('Invalid dimension value')
+        for parameter in parameters:
+            if parameter not in DataManifestProvider.PARAMETERS:
+                raise ValueError('Invalid parameter value')
+        if not 0.001 <= alpha <= 0.9:
+            raise ValueError('Invalid alpha value')
+
+        return NonParametricTestsProvider.__get_nemenyi_friedman_matrix(dimensions=tuple(int(d) for d in dimensions),
+                                                                        parameters=tuple(int(p) for p in parameters),
+                                                                        alpha=float(alpha))
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
     def get_post_hoc_tests(dimension=10, parameter=0, algorithm_to_compare='', alpha=0.05):
         """
         Displays unadjusted p values obtained from wilcoxon in addition with selected correction methods.
@@ -480,6 +881,8 @@ class NonParametricTestsProvider:
         algorithm_to_compare_index = algorithm_names.index(algorithm_to_compare)
         del unadjusted_p_values[algorithm_to_compare_index]
 
+        import statsmodels.stats.multitest as smt
+
         p_values = [unadjusted_p_values]
 
         for method in AdjustedPValueMethods:
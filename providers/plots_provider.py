@@ -1,8 +1,9 @@
+import os
+
 import matplotlib.pyplot as plt
 import matplotlib as mpl
 import pandas as pd
 from scipy.stats import stats
-import statsmodels.api as sm
 
 from helpers.progress_handler import ProgressHandler
 from providers.data_acquisition_provider import DataAcquisitionProvider
@@ -14,8 +15,25 @@ class PlotsProvider:
     """
     Static methods which perform the plotting functionality.
 
+    Plots are shown, unless an output directory is specified, in which case each figure is saved as a PNG file within
+    the directory of its category (normality, comparison, performance or ranking), then closed.
+
+    Attributes
+    ----------
+        __output_directory          Specify the directory where figures are saved, None shows them instead
+        __saved_files               The paths of the figures saved since the last call of 'pop_saved_files'
+
     Methods
     -------
+        set_output_directory(directory=None):
+            Specify the directory where figures are saved instead of being shown.
+        get_output_directory():
+            Retrieves the directory where figures are saved, None if they are shown.
+        pop_saved_files():
+            Retrieves the paths of the figures saved since the last call, then forgets them.
+        __show(category, name):
+            Shows the current figure, or saves it within the output directory.
+
         plot_algorithm_normality_histogram(dimension=10, parameter=1, algorithm='', alpha=0.05):
             Checks normality for the given parameters and displays rejects/accepts the null hypothesis.
         plot_algorithm_normality_qq(dimension=10, parameter=1, algorithm='', alpha=0.05):
@@ -31,8 +49,69 @@ class PlotsProvider:
 
         plot_best_algorithms(estimate=False):
             Shows how many times each algorithm was considered the best.
+
+        plot_critical_difference(dimension=10, parameter=1, alpha=0.05):
+            Shows the mean rank of each algorithm, joining those which do not differ significantly (Nemenyi).
     """
 
+    __output_directory = None
+    __saved_files = []
+
+    @staticmethod
+    def set_output_directory(directory=None):
+        """
+        Specify the directory where figures are saved instead of being shown.
+
+        :param str directory: Specify the directory, None shows the figures again
+        """
+
+        PlotsProvider.__output_directory = directory
+
+    @staticmethod
+    def get_output_directory():
+        """
+        Retrieves the directory where figures are saved, None if they are shown.
+
+        :return: The output directory
+        """
+
+        return PlotsProvider.__output_directory
+
+    @staticmethod
+    def pop_saved_files():
+        """
+        Retrieves the paths of the figures saved since the last call, then forgets them.
+
+        :return: A list of paths
+        """
+
+        saved_files = PlotsProvider.__saved_files
+        PlotsProvider.__saved_files = []
+
+        return saved_files
+
+    @staticmethod
+    def __show(category, name):
+        """
+        Shows the current figure, or saves it within the output directory.
+
+        :param str category: Specify the category of the figure, used as the name of its subdirectory
+        :param str name: Specify the file name of the figure, without its extension
+        """
+
+        if PlotsProvider.__output_directory is None:
+            plt.show()
+            return
+
+        directory = os.path.join(PlotsProvider.__output_directory, category)
+        os.makedirs(directory, exist_ok=True)
+
+        path = os.path.join(directory, f'{name}.png')
+        plt.savefig(path)
+        plt.close('all')
+
+        PlotsProvider.__saved_files.append(path)
+
     @staticmethod
     def plot_algorithm_normality_histogram(dimension=10, parameter=1, algorithm='', alpha=0.05):
         """
@@ -43,20 +122,13 @@ class PlotsProvider:
         :param float alpha: Specify the level of significance
         :param str algorithm: Specify the desired algorithm, default is the best algorithm
         """
+        suffix = f'_{algorithm}' if len(algorithm) > 0 else ''
+
         if len(algorithm) == 0:
             algorithm = NonParametricTestsProvider.get_best_algorithm(dimension=dimension,
                                                                       parameter=parameter)
 
-        df = DataAcquisitionProvider.get_algorithms_comparisons()[dimension][parameter]
-
-        for problem in df.index.get_level_values('Problem').unique():
-            for algorithm_ in df.loc[problem]:
-                df.loc[problem][algorithm_]['Std'] = None
-
-        df = df \
-            .reset_index(level=1, drop=True) \
-            .dropna(how='all', axis=0) \
-            .dropna(how='all', axis=1)
+        df = DataAcquisitionProvider.get_algorithms_means(dimension=dimension, parameter=parameter)
 
         df = df[algorithm]
 
@@ -72,7 +144,7 @@ class PlotsProvider:
 
         plt.xlabel('Mean')
 
-        plt.show()
+        PlotsProvider.__show('normality', f'plot_algorithm_normality_histogram_{dimension}_{parameter}{suffix}')
 
     @staticmethod
     def plot_algorithm_normality_qq(dimension=10, parameter=1, algorithm='', alpha=0.05):
@@ -84,20 +156,13 @@ class PlotsProvider:
         :param float alpha: Specify the level of significance
         :param str algorithm: Specify the desired algorithm, default is the best algorithm
         """
+        suffix = f'_{algorithm}' if len(algorithm) > 0 else ''
+
         if len(algorithm) == 0:
             algorithm = NonParametricTestsProvider.get_best_algorithm(dimension=dimension,
                                                                       parameter=parameter)
 
-        df = DataAcquisitionProvider.get_algorithms_comparisons()[dimension][parameter]
-
-        for problem in df.index.get_level_values('Problem').unique():
-            for algorithm_ in df.loc[problem]:
-                df.loc[problem][algorithm_]['Std'] = None
-
-        df = df \
-            .reset_index(level=1, drop=True) \
-            .dropna(how='all', axis=0) \
-            .dropna(how='all', axis=1)
+        df = DataAcquisitionProvider.get_algorithms_means(dimension=dimension, parameter=parameter)
 
         df = df[algorithm]
 
@@ -105,6 +170,9 @@ class PlotsProvider:
 
         reject = 'REJECTED' if p_value < alpha else 'FAILED TO REJECT'
 
+        # statsmodels is slow to import, hence it is only imported once a qq plot is drawn
+        import statsmodels.api as sm
+
         with mpl.rc_context():
             mpl.rc("figure", figsize=(12, 8))
             sm.qqplot(df, line='45')
@@ -114,7 +182,7 @@ class PlotsProvider:
 
         plt.xlabel('Mean')
 
-        plt.show()
+        PlotsProvider.__show('normality', f'plot_algorithm_normality_qq_{dimension}_{parameter}{suffix}')
 
     @staticmethod
     def plot_algorithm_comparison_bar(dimension=10, parameter=1):
@@ -125,16 +193,7 @@ class PlotsProvider:
         :param int parameter: Specify the desired parameter (must be within 'DataManifestProvider.PARAMETERS')
         """
 
-        df = DataAcquisitionProvider.get_algorithms_comparisons()[dimension][parameter]
-
-        for problem in df.index.get_level_values('Problem').unique():
-            for algorithm in df.loc[problem]:
-                df.loc[problem][algorithm]['Std'] = None
-
-        df = df \
-            .reset_index(level=1, drop=True) \
-            .dropna(how='all', axis=0) \
-            .dropna(how='all', axis=1)
+        df = DataAcquisitionProvider.get_algorithms_means(dimension=dimension, parameter=parameter)
 
         df = df.mean()
 
@@ -153,7 +212,7 @@ class PlotsProvider:
         plt.xticks(rotation=35)
         plt.yscale('log')
 
-        plt.show()
+        PlotsProvider.__show('comparison', f'plot_algorithm_comparison_bar_{dimension}_{parameter}')
 
     @staticmethod
     def plot_algorithm_comparison_box(dimension=10, parameter=1):
@@ -164,16 +223,7 @@ class PlotsProvider:
         :param int parameter: Specify the desired parameter (must be within 'DataManifestProvider.PARAMETERS')
         """
 
-        df = DataAcquisitionProvider.get_algorithms_comparisons()[dimension][parameter]
-
-        for problem in df.index.get_level_values('Problem').unique():
-            for algorithm in df.loc[problem]:
-                df.loc[problem][algorithm]['Std'] = None
-
-        df = df \
-            .reset_index(level=1, drop=True) \
-            .dropna(how='all', axis=0) \
-            .dropna(how='all', axis=1)
+        df = DataAcquisitionProvider.get_algorithms_means(dimension=dimension, parameter=parameter)
 
         df.columns = df.columns.to_series().apply(lambda x: (x[:10] + '..') if len(x) > 10 else x)
 
@@ -188,7 +238,7 @@ class PlotsProvider:
         plt.xticks(rotation=35)
         plt.yscale('log')
 
-        plt.show()
+        PlotsProvider.__show('comparison', f'plot_algorithm_comparison_box_{dimension}_{parameter}')
 
     @staticmethod
     def plot_algorithm_performance_fluctuation(parameter=1, normalize=True):
@@ -202,16 +252,7 @@ class PlotsProvider:
         result = []
 
         for dimension in DataManifestProvider.DIMENSIONS:
-            df = DataAcquisitionProvider.get_algorithms_comparisons()[dimension][parameter]
-
-            for problem in df.index.get_level_values('Problem').unique():
-                for algorithm in df.loc[problem]:
-                    df.loc[problem][algorithm]['Std'] = None
-
-            df = df \
-                .reset_index(level=1, drop=True) \
-                .dropna(how='all', axis=0) \
-                .dropna(how='all', axis=1)
+            df = DataAcquisitionProvider.get_algorithms_means(dimension=dimension, parameter=parameter)
 
             df = df.mean()
 
@@ -222,6 +263,8 @@ class PlotsProvider:
 
         result = pd.DataFrame(result, columns=algorithm_names, index=[str(x) for x in DataManifestProvider.DIMENSIONS])
 
+        suffix = '_normalized' if normalize else ''
+
         if normalize:
             title = f'Normalized Algorithm Performance Fluctuation, Parameter: {parameter}'
         else:
@@ -239,7 +282,7 @@ class PlotsProvider:
         if normalize:
             plt.yscale('log')
 
-        plt.show()
+        PlotsProvider.__show('performance', f'plot_algorithm_performance_fluctuation{suffix}_{parameter}')
 
     @staticmethod
     def plot_best_algorithms(estimate=False):
@@ -250,27 +293,30 @@ class PlotsProvider:
         """
 
         results = {}
-        print('Traversing through dimensions and parameters...')
-        processed = 0
+        suffix = '_estimated' if estimate else ''
+
+        if estimate:
+            print('Traversing through dimensions and parameters...')
+
+            with ProgressHandler.track(len(DataManifestProvider.DIMENSIONS) * len(DataManifestProvider.PARAMETERS),
+                                       description='Estimating the best algorithms') as progress:
+                for dimension in DataManifestProvider.DIMENSIONS:
+                    result = {}
+                    for parameter in DataManifestProvider.PARAMETERS:
+                        best_algorithm = NonParametricTestsProvider.estimate_best_algorithm(dimension=dimension,
+                                                                                            parameter=parameter)
+                        result[best_algorithm] = result.get(best_algorithm, 0) + 1
+                        progress.update()
+                    results[dimension] = result
+        else:
+            # Every slice is ranked at once, rather than ranking each dimension and parameter one by one
+            best_algorithms = NonParametricTestsProvider.get_friedman_rankings().get_best_algorithms()
 
-        for dimension in DataManifestProvider.DIMENSIONS:
-            result = {}
-            for parameter in DataManifestProvider.PARAMETERS:
-                print(ProgressHandler.show_progress(processed,
-                                                    len(DataManifestProvider.DIMENSIONS) * len(
-                                                        DataManifestProvider.PARAMETERS)))
-                processed += 1
-
-                if estimate:
-                    best_algorithm = NonParametricTestsProvider.estimate_best_algorithm(dimension=dimension,
-                                                                                        parameter=parameter)
-                else:
-                    best_algorithm = NonParametricTestsProvider.get_best_algorithm(dimension=dimension,
-                                                                                   parameter=parameter)
-                result[best_algorithm] = result.get(best_algorithm, 0) + 1
-            results[dimension] = result
-
-        ProgressHandler.reset_progress()
+            for dimension in DataManifestProvider.DIMENSIONS:
+                result = {}
+                for best_algorithm in best_algorithms[dimension]:
+                    result[best_algorithm] = result.get(best_algorithm, 0) + 1
+                results[dimension] = result
 
         df = pd.DataFrame(results)
 
@@ -294,7 +340,7 @@ class PlotsProvider:
         plt.xticks(rotation=35)
 
         plt.tight_layout()
-        plt.show()
+        PlotsProvider.__show('performance', f'plot_best_algorithms{suffix}')
 
         df = df.T
 
@@ -307,4 +353,70 @@ class PlotsProvider:
 
         plt.ylim(0, 14)
 
-        plt.show()
+        PlotsProvider.__show('performance', f'plot_best_algorithms_stacked{suffix}')
+
+    @staticmethod
+    def plot_critical_difference(dimension=10, parameter=1, alpha=0.05):
+        """
+        Shows the mean rank of each algorithm, joining those which do not differ significantly (Nemenyi).
+
+        The algorithms are laid on an axis of mean ranks, the better half on the left and the other on the right,
+        and each group of algorithms whose mean ranks are within the critical difference is joined by a thick bar.
+
+        :param int dimension: Specify the desired dimension (must be within 'DataManifestProvider.DIMENSIONS')
+        :param int parameter: Specify the desired parameter (must be within 'DataManifestProvider.PARAMETERS')
+        :param float alpha: Specify the level of significance
+        """
+
+        nemenyi = NonParametricTestsProvider.get_nemenyi_friedman_matrix(dimensions=[dimension],
+                                                                         parameters=[parameter],
+                                                                         alpha=alpha)
+
+        mean_ranks = nemenyi.get_mean_ranks(dimension=dimension, parameter=parameter).sort_values(kind='stable')
+        critical_difference = nemenyi.get_critical_difference(dimension=dimension, parameter=parameter)
+        cliques = nemenyi.get_cliques(dimension=dimension, parameter=parameter)
+
+        k = len(mean_ranks)
+        left = (k + 1) // 2
+        step = 0.5
+
+        fig, ax = plt.subplots(figsize=(12, 2 + step * left))
+
+        # Rank axis, along with the critical difference above it
+        ax.hlines(0, 1, k, color='black')
+        for rank in range(1, k + 1):
+            ax.vlines(rank, 0, -0.1, color='black')
+            ax.text(rank, -0.15, str(rank), ha='center', va='bottom')
+
+        ax.hlines(-0.9, 1, 1 + critical_difference, color='black', linewidth=2)
+        ax.text(1 + critical_difference / 2, -0.95, f'CD = {critical_difference:.3f}', ha='center', va='bottom')
+
+        # Each algorithm is pointed from its mean rank to the nearest side
+        for position, (algorithm, mean_rank) in enumerate(mean_ranks.items()):
+            if position < left:
+                height = step * (position + 1) + 0.3
+                side = 0.5
+                alignment = 'right'
+            else:
+                height = step * (k - position) + 0.3
+                side = k + 0.5
+                alignment = 'left'
+
+            ax.vlines(mean_rank, 0, height, color='black', linewidth=0.8)
+            ax.hlines(height, min(mean_rank, side), max(mean_rank, side), color='black', linewidth=0.8)
+            ax.text(side - 0.05 if alignment == 'right' else side + 0.05, height, f'{algorithm} ({mean_rank:.2f})',
+                    ha=alignment, va='center')
+
+        for position, clique in enumerate(cliques):
+            height = 0.1 + 0.2 * step * (position % max(1, left))
+            ax.hlines(height, mean_ranks[clique[0]] - 0.05, mean_ranks[clique[-1]] + 0.05, color='black', linewidth=4)
+
+        ax.set_xlim(-2.5, k + 3.5)
+        ax.set_ylim(step * left + 0.6, -1.2)
+        ax.axis('off')
+
+        plt.title(f'Critical Difference (Nemenyi), Dimension: {dimension} | Parameter: {parameter}\n'
+                  f'\u03B1 = {alpha}')
+
+        plt.tight_layout()
+        PlotsProvider.__show('ranking', f'plot_critical_difference_{dimension}_{parameter}')
@@ -0,0 +1,190 @@
+import os
+import socketserver
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+import pandas as pd
+
+from helpers.query_request_handler import QueryRequestHandler, UnknownQueryError
+from providers.data_acquisition_provider import DataAcquisitionProvider
+from providers.non_parametric_tests_provider import NonParametricTestsProvider
+
+
+class QueryProvider:
+    """
+    Static methods which answer test queries from a long-running server, keeping the dataset loaded between queries.
+
+    The comparisons (and optionally the raw runs) are loaded once when the server starts, and results are memoized
+    by the providers, hence a query only pays for its own test instead of a whole process start and data load.
+
+    Attributes
+    ----------
+        QUERIES                     The queries which can be answered, each one runs a NonParametricTestsProvider method
+
+    Methods
+    -------
+        __get_slice_arguments(arguments):
+            Parses the dimension, parameter and level of significance of a query.
+        __to_json(result):
+            Converts a result to a JSON serializable value.
+        run_query(query, arguments):
+            Answers a single query.
+        warm_up(runs=False):
+            Loads every slice, and the raw runs if requested, before the first query.
+        serve(host='127.0.0.1', port=8000, socket_path=None, warm_runs=False, verbose=False):
+            Answers queries over HTTP until interrupted, on a TCP port or a Unix socket.
+    """
+
+    QUERIES = ['health', 'best', 'friedman', 'wilcoxon', 'posthoc', 'wtl']
+
+    @staticmethod
+    def __get_slice_arguments(arguments):
+        """
+        Parses the dimension, parameter and level of significance of a query.
+
+        :param dict arguments: Specify the arguments of the query string
+        :return: A tuple of the dimension, the parameter and the level of significance
+        """
+
+        try:
+            dimension = int(arguments.get('dimension', 10))
+            parameter = int(arguments.get('parameter', 0))
+        except ValueError:
+            raise ValueError('dimension and parameter must be integers')
+
+        try:
+            alpha = float(arguments.get('alpha', 0.05))
+        except ValueError:
+            raise ValueError('alpha must be a number')
+
+        return dimension, parameter, alpha
+
+    @staticmethod
+    def __to_json(result):
+        """
+        Converts a result to a JSON serializable value.
+
+        :param result: Specify a dataframe, a series or a plain value
+        :return: A dictionary of the index, columns and data of dataframes and series (NaN as None),
+                 the value itself otherwise
+        """
+
+        if isinstance(result, pd.DataFrame):
+            data = result.astype(object).where(result.notna(), None)
+            return {'columns': data.columns.to_list(), 'index': data.index.to_list(), 'data': data.to_numpy().tolist()}
+        if isinstance(result, pd.Series):
+            data = result.astype(object).where(result.notna(), None)
+            return {'index': data.index.to_list(), 'data': data.to_list()}
+
+        return result
+
+    @staticmethod
+    def run_query(query, arguments):
+        """
+        Answers a single query.
+
+        An UnknownQueryError is raised if the query is not within 'QUERIES', and a ValueError if an argument is
+        invalid, e.g. an algorithm without any value within the slice.
+
+        :param str query: Specify the query (must be within 'QUERIES')
+        :param dict arguments: Specify the arguments of the query string, 'dimension', 'parameter', 'alpha' and
+                               'algorithm' (the reference algorithm of 'wilcoxon' and 'posthoc')
+        :return: A JSON serializable dictionary holding the 'result' and the time it took in 'seconds'
+        """
+
+        if query not in QueryProvider.QUERIES:
+            raise UnknownQueryError(repr(query))
+
+        start = time.perf_counter()
+
+        if query == 'health':
+            return {'result': 'ok', 'seconds': 0.0}
+
+        dimension, parameter, alpha = QueryProvider.__get_slice_arguments(arguments)
+        algorithm = arguments.get('algorithm', '')
+
+        # The tests compare the algorithms holding values within the slice, as kept by the means
+        if algorithm and algorithm not in DataAcquisitionProvider.get_algorithms_means(dimension=dimension,
+                                                                                       parameter=parameter):
+            raise ValueError(f'Unknown algorithm {algorithm!r} for dimension {dimension} and parameter {parameter}')
+
+        if query == 'best':
+            result = NonParametricTestsProvider.get_best_algorithm(dimension=dimension, parameter=parameter)
+        elif query == 'friedman':
+            result = NonParametricTestsProvider.friedman_test(dimension=dimension, parameter=parameter, alpha=alpha)
+        elif query == 'wilcoxon':
+            result = NonParametricTestsProvider.wilcoxon_test(dimension=dimension, parameter=parameter,
+                                                              algorithm_to_compare=algorithm, alpha=alpha)
+        elif query == 'posthoc':
+            result = NonParametricTestsProvider.get_post_hoc_tests(dimension=dimension, parameter=parameter,
+                                                                   algorithm_to_compare=algorithm, alpha=alpha)
+        else:
+            result = NonParametricTestsProvider.get_algorithms_comparisons_wtl_mannwhitneyu(dimension=dimension,
+                                                                                            parameter=parameter,
+                                                                                            alpha=alpha)
+
+        return {'result': QueryProvider.__to_json(result), 'seconds': time.perf_counter() - start}
+
+    @staticmethod
+    def warm_up(runs=False):
+        """
+        Loads every slice, and the raw runs if requested, before the first query.
+
+        :param bool runs: Specify whether to load the raw runs as well, which the 'wtl' query needs
+        """
+
+        comparisons = DataAcquisitionProvider.get_algorithms_comparisons()
+
+        for dimension in comparisons:
+            for parameter in comparisons[dimension]:
+                comparisons.get_slice(dimension, parameter)
+
+        NonParametricTestsProvider.get_friedman_rankings()
+
+        if runs:
+            DataAcquisitionProvider.get_algorithms_cube()
+
+    @staticmethod
+    def serve(host='127.0.0.1', port=8000, socket_path=None, warm_runs=False, verbose=False):
+        """
+        Answers queries over HTTP until interrupted, on a TCP port or a Unix socket.
+
+        Each query is a GET request whose path names the query, e.g. '/wilcoxon?dimension=30&parameter=2&alpha=0.01',
+        and whose response is a JSON object, holding an 'error' message along with a 4xx/5xx status on failure.
+
+        :param str host: Specify the address to listen on, only the local host is listened on by default
+        :param int port: Specify the TCP port to listen on
+        :param str socket_path: Specify the path of a Unix socket to listen on instead of a TCP port
+        :param bool warm_runs: Specify whether to load the raw runs before the first query, which 'wtl' needs
+        :param bool verbose: Specify whether each request is logged to the standard error stream
+        """
+
+        print('Loading the dataset...')
+        QueryProvider.warm_up(runs=warm_runs)
+
+        QueryRequestHandler.verbose = verbose
+
+        if socket_path is not None:
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+            server = socketserver.ThreadingUnixStreamServer(socket_path, QueryRequestHandler)
+            address = socket_path
+        else:
+            server = ThreadingHTTPServer((host, port), QueryRequestHandler)
+            address = f'http://{host}:{server.server_port}'
+
+        server.daemon_threads = True
+        server.run_query = QueryProvider.run_query
+        server.query_lock = threading.Lock()
+
+        print(f'Answering {", ".join(QueryProvider.QUERIES)} queries on {address}, press Ctrl+C to stop')
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            if socket_path is not None and os.path.exists(socket_path):
+                os.remove(socket_path)
@@ -0,0 +1,299 @@
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+import matplotlib.pyplot as plt
+import numpy as np
+
+from helpers.progress_handler import ProgressHandler
+from providers.data_acquisition_provider import DataAcquisitionProvider
+from providers.data_manifest_provider import DataManifestProvider
+from providers.plots_provider import PlotsProvider
+
+
+class RenderProvider:
+    """
+    Static methods which save every plot of every dimension and parameter to files, spread over a process pool.
+
+    Figures are drawn with the non-interactive Agg backend, hence no display is needed. Each plot is fingerprinted by
+    the data it is drawn from, and the fingerprints are stored next to the figures, hence a later render only redraws
+    the plots whose data changed.
+
+    Attributes
+    ----------
+        PLOTS                       The plots which can be rendered, each one runs a PlotsProvider method
+        __manifest_name             The file name of the fingerprints, stored within the output directory
+
+    Methods
+    -------
+        initialize_worker(directory, output_directory):
+            Points a spawned worker process to the assets of the parent process, and saves its figures to files.
+        __run_plot(plot, arguments):
+            Draws a single plot.
+        render_tasks(tasks):
+            Draws each provided plot, saving its figures within the output directory.
+        __get_tasks(dimensions, parameters, plots, alpha=0.05):
+            Lists every plot to be drawn along with its arguments.
+        __get_fingerprint(plot, arguments, means):
+            Digests the data a single plot is drawn from.
+        __get_manifest(output_directory):
+            Retrieves the stored fingerprints of the rendered plots.
+        render(output_directory='plots', dimensions=None, parameters=None, plots=None, alpha=0.05, workers=None,
+               chunk_size=1, force=False):
+            Saves every provided plot of every provided slice, skipping those whose data did not change.
+    """
+
+    PLOTS = ['normality_histogram', 'normality_qq', 'comparison_bar', 'comparison_box', 'performance_fluctuation',
+             'best_algorithms', 'critical_difference']
+
+    __manifest_name = 'fingerprints.json'
+
+    @staticmethod
+    def initialize_worker(directory, output_directory):
+        """
+        Points a spawned worker process to the assets of the parent process, and saves its figures to files.
+
+        :param str directory: Specify the directory from where to read the assets from
+        :param str output_directory: Specify the directory where figures are saved
+        """
+
+        plt.switch_backend('Agg')
+
+        DataAcquisitionProvider.set_algorithms_raw_directory(directory)
+        PlotsProvider.set_output_directory(output_directory)
+
+    @staticmethod
+    def __run_plot(plot, arguments):
+        """
+        Draws a single plot.
+
+        :param str plot: Specify the plot (must be within 'PLOTS')
+        :param dict arguments: Specify the keyword arguments of its PlotsProvider method
+        """
+
+        if plot == 'normality_histogram':
+            PlotsProvider.plot_algorithm_normality_histogram(**arguments)
+        elif plot == 'normality_qq':
+            PlotsProvider.plot_algorithm_normality_qq(**arguments)
+        elif plot == 'comparison_bar':
+            PlotsProvider.plot_algorithm_comparison_bar(**arguments)
+        elif plot == 'comparison_box':
+            PlotsProvider.plot_algorithm_comparison_box(**arguments)
+        elif plot == 'performance_fluctuation':
+            PlotsProvider.plot_algorithm_performance_fluctuation(**arguments)
+        elif plot == 'best_algorithms':
+            PlotsProvider.plot_best_algorithms(**arguments)
+        elif plot == 'critical_difference':
+            PlotsProvider.plot_critical_difference(**arguments)
+        else:
+            raise ValueError('Invalid plot value')
+
+    @staticmethod
+    def render_tasks(tasks):
+        """
+        Draws each provided plot, saving its figures within the output directory.
+
+        :param list tasks: Specify the (key, plot, arguments) tuples
+        :return: A list of (key, saved files) tuples, ordered as the tasks
+        """
+
+        results = []
+
+        for key, plot, arguments in tasks:
+            RenderProvider.__run_plot(plot, arguments)
+            results.append((key, PlotsProvider.pop_saved_files()))
+
+        return results
+
+    @staticmethod
+    def __get_tasks(dimensions, parameters, plots, alpha=0.05):
+        """
+        Lists every plot to be drawn along with its arguments.
+
+        :param list dimensions: Specify the desired dimensions
+        :param list parameters: Specify the desired parameters
+        :param list plots: Specify the desired plots (must be within 'PLOTS')
+        :param float alpha: Specify the level of significance
+        :return: A list of (plot, arguments) tuples
+        """
+
+        tasks = []
+
+        for dimension in dimensions:
+            for parameter in parameters:
+                for plot in ['normality_histogram', 'normality_qq']:
+                    tasks.append((plot, {'dimension': dimension, 'parameter': parameter, 'alpha': alpha}))
+                for plot in ['comparison_bar', 'comparison_box']:
+                    tasks.append((plot, {'dimension': dimension, 'parameter': parameter}))
+                tasks.append(('critical_difference', {'dimension': dimension, 'parameter': parameter, 'alpha': alpha}))
+
+        for parameter in parameters:
+            for normalize in [True, False]:
+                tasks.append(('performance_fluctuation', {'parameter': parameter, 'normalize': normalize}))
+
+        tasks.append(('best_algorithms', {'estimate': False}))
+
+        return [(plot, arguments) for plot, arguments in tasks if plot in plots]
+
+    @staticmethod
+    def __get_fingerprint(plot, arguments, means):
+        """
+        Digests the data a single plot is drawn from.
+
+        Slice plots are drawn from the means of their slice, the performance fluctuation from the means of every
+        dimension of its parameter, and the best algorithms from the means of every slice.
+
+        :param str plot: Specify the plot (must be within 'PLOTS')
+        :param dict arguments: Specify the keyword arguments of its PlotsProvider method
+        :param dict means: Maps each (dimension, parameter) to the means dataframe of its slice
+        :return: A hexadecimal digest
+        """
+
+        if plot == 'best_algorithms':
+            slices = sorted(means)
+        elif plot == 'performance_fluctuation':
+            slices = [(dimension, arguments['parameter']) for dimension in DataManifestProvider.DIMENSIONS]
+        else:
+            slices = [(arguments['dimension'], arguments['parameter'])]
+
+        digest = hashlib.sha1(json.dumps([plot, arguments, matplotlib.__version__], sort_keys=True).encode())
+
+        for dimension, parameter in slices:
+            df = means[(dimension, parameter)]
+
+            digest.update(json.dumps([dimension, parameter, df.columns.to_list(),
+                                      [int(problem) for problem in df.index]]).encode())
+            digest.update(np.ascontiguousarray(df.to_numpy(dtype=np.float64)).tobytes())
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def __get_manifest(output_directory):
+        """
+        Retrieves the stored fingerprints of the rendered plots.
+
+        :param str output_directory: Specify the directory where figures are saved
+        :return: A dictionary of plot keys and their fingerprint and saved files, empty if nothing is stored
+        """
+
+        path = os.path.join(output_directory, RenderProvider.__manifest_name)
+
+        if not os.path.exists(path):
+            return {}
+
+        with open(path) as f:
+            return json.load(f)
+
+    @staticmethod
+    def render(output_directory='plots', dimensions=None, parameters=None, plots=None, alpha=0.05, workers=None,
+               chunk_size=1, force=False):
+        """
+        Saves every provided plot of every provided slice, skipping those whose data did not change.
+
+        A plot is skipped if its fingerprint matches the stored one and each of its files still exists. The data is
+        loaded once in the parent process, then shared with the forked workers.
+
+        :param str output_directory: Specify the directory where figures are saved
+        :param list dimensions: Specify the desired dimensions, default is 'DataManifestProvider.DIMENSIONS'
+        :param list parameters: Specify the desired parameters, default is 'DataManifestProvider.PARAMETERS'
+        :param list plots: Specify the desired plots (must be within 'PLOTS'), default is every plot
+        :param float alpha: Specify the level of significance
+        :param int workers: Specify the number of processes, None uses every available core, 1 runs serially
+        :param int chunk_size: Specify the number of plots handed to a worker at once
+        :param bool force: Specify whether to redraw every plot, regardless of its fingerprint
+        :return: A list of the paths of the saved figures
+        """
+
+        dimensions = list(DataManifestProvider.DIMENSIONS if dimensions is None else dimensions)
+        parameters = list(DataManifestProvider.PARAMETERS if parameters is None else parameters)
+        plots = list(RenderProvider.PLOTS if plots is None else plots)
+
+        for dimension in dimensions:
+            if dimension not in DataManifestProvider.DIMENSIONS:
+                raise ValueError('Invalid dimension value')
+        for parameter in parameters:
+            if parameter not in DataManifestProvider.PARAMETERS:
+                raise ValueError('Invalid parameter value')
+        for plot in plots:
+            if plot not in RenderProvider.PLOTS:
+                raise ValueError('Invalid plot value')
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError('workers must be a positive integer')
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError('chunk_size must be a positive integer')
+
+        # Loading every slice also warms up the data the forked workers inherit
+        means = {(int(dimension), int(parameter)):
+                 DataAcquisitionProvider.get_algorithms_means(dimension=dimension, parameter=parameter)
+                 for dimension in DataManifestProvider.DIMENSIONS for parameter in DataManifestProvider.PARAMETERS}
+
+        manifest = RenderProvider.__get_manifest(output_directory)
+        fingerprints = {}
+        tasks = []
+
+        for plot, arguments in RenderProvider.__get_tasks([int(dimension) for dimension in dimensions],
+                                                          [int(parameter) for parameter in parameters],
+                                                          plots, alpha=alpha):
+            key = f'{plot}({", ".join(f"{name}={value}" for name, value in arguments.items())})'
+            fingerprints[key] = RenderProvider.__get_fingerprint(plot, arguments, means)
+
+            stored = manifest.get(key)
+            if not force and stored is not None and stored['fingerprint'] == fingerprints[key] and \
+                    all(os.path.exists(os.path.join(output_directory, path)) for path in stored['files']):
+                continue
+
+            tasks.append((key, plot, arguments))
+
+        chunks = [tasks[start:start + chunk_size] for start in range(0, len(tasks), chunk_size)]
+        workers = min(workers, len(chunks))
+
+        print(f'Rendering {len(tasks)} plots, skipping {len(fingerprints) - len(tasks)} unchanged ones...')
+
+        results = []
+        with ProgressHandler.track(len(tasks), description='Rendering plots') as progress:
+            if workers <= 1:
+                backend = plt.get_backend()
+                output = PlotsProvider.get_output_directory()
+
+                RenderProvider.initialize_worker(DataAcquisitionProvider.get_algorithms_raw_directory(),
+                                                 output_directory)
+
+                try:
+                    for chunk in chunks:
+                        results.extend(RenderProvider.render_tasks(chunk))
+                        progress.update(len(chunk))
+                finally:
+                    PlotsProvider.set_output_directory(output)
+                    plt.switch_backend(backend)
+            elif chunks:
+                # Forked workers inherit the loaded data, spawned ones are pointed to the same assets
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+
+                with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                         initializer=RenderProvider.initialize_worker,
+                                         initargs=(DataAcquisitionProvider.get_algorithms_raw_directory(),
+                                                   output_directory)) as executor:
+                    for chunk_results in executor.map(RenderProvider.render_tasks, chunks):
+                        results.extend(chunk_results)
+                        progress.update(len(chunk_results))
+
+        saved_files = []
+
+        for key, files in results:
+            manifest[key] = {'fingerprint': fingerprints[key],
+                             'files': [os.path.relpath(path, output_directory) for path in files]}
+            saved_files.extend(files)
+
+        os.makedirs(output_directory, exist_ok=True)
+        with open(os.path.join(output_directory, RenderProvider.__manifest_name), 'w') as f:
+            json.dump(manifest, f, indent=4, sort_keys=True)
+
+        return saved_files
@@ -0,0 +1,153 @@
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+
+from helpers.instrumentation_handler import InstrumentationHandler
+
+
+class SnapshotProvider:
+    """
+    Static methods which handles the packed binary snapshot of the algorithms comparisons and raw runs.
+
+    The snapshot consists of plain '.npy' arrays, which are memory-mapped when opened, in addition to a small JSON
+    header holding the labels of each axis.
+
+    Attributes
+    ----------
+        __snapshot_directory        Specify the directory where the snapshot is stored
+        __header_file               The name of the JSON header file
+        __comparisons_file          The name of the array storing the mean and the standard deviation of each slice
+        __runs_file                 The name of the array storing every run
+        __version                   The layout version, snapshots with another version are ignored
+
+    Methods
+    -------
+        set_snapshot_directory(directory):
+            Specify the directory where the snapshot is stored.
+        has_snapshot():
+            Checks whether a usable snapshot is stored.
+        __save_array(path, values):
+            Atomically saves an array in the '.npy' format.
+        save_snapshot(comparisons, runs, header):
+            Saves the comparisons and the runs arrays along with their labels.
+        get_header():
+            Retrieves the JSON header of the snapshot.
+        get_comparisons():
+            Memory-maps the comparisons array.
+        get_runs():
+            Memory-maps the runs array.
+    """
+
+    __snapshot_directory = 'assets/cached_instances/snapshot'
+    __header_file = 'header.json'
+    __comparisons_file = 'comparisons.npy'
+    __runs_file = 'runs.npy'
+    __version = 1
+
+    @staticmethod
+    def set_snapshot_directory(directory):
+        """
+        Specify the directory where the snapshot is stored.
+
+        :param str directory: Specify the directory
+        """
+
+        if directory != '':
+            SnapshotProvider.__snapshot_directory = directory
+
+    @staticmethod
+    def has_snapshot():
+        """
+        Checks whether a usable snapshot is stored.
+
+        :return: True if the header and both arrays exist and the layout version matches
+        """
+
+        directory = SnapshotProvider.__snapshot_directory
+
+        for file in [SnapshotProvider.__header_file, SnapshotProvider.__comparisons_file, SnapshotProvider.__runs_file]:
+            if not os.path.exists(f'{directory}/{file}'):
+                return False
+
+        return SnapshotProvider.get_header().get('version') == SnapshotProvider.__version
+
+    @staticmethod
+    def __save_array(path, values):
+        """
+        Atomically saves an array in the '.npy' format.
+
+        :param str path: Specify the destination path
+        :param np.ndarray values: Specify the array to be saved
+        """
+
+        with open(f'{path}.tmp', 'wb') as f:
+            np.save(f, np.ascontiguousarray(values))
+
+        os.replace(f'{path}.tmp', path)
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def save_snapshot(comparisons, runs, header):
+        """
+        Saves the comparisons and the runs arrays along with their labels.
+
+        :param np.ndarray comparisons: An array of shape (dimensions, parameters, problems × 2, algorithms),
+                                       rows alternate between the mean and the standard deviation of each problem
+        :param np.ndarray runs: An array of shape (algorithms, problems, dimensions, parameters, runs)
+        :param dict header: Labels of each axis, must hold 'algorithms', 'problems', 'dimensions' and 'parameters'
+        """
+
+        directory = SnapshotProvider.__snapshot_directory
+
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        SnapshotProvider.__save_array(f'{directory}/{SnapshotProvider.__comparisons_file}', comparisons)
+        SnapshotProvider.__save_array(f'{directory}/{SnapshotProvider.__runs_file}', runs)
+
+        header = dict(header)
+        header['version'] = SnapshotProvider.__version
+        header['timestamp'] = str(datetime.utcnow())
+
+        # The header is written last, hence a snapshot is never picked up before both arrays are complete
+        with open(f'{directory}/{SnapshotProvider.__header_file}.tmp', 'w') as f:
+            json.dump(header, f, indent=4)
+
+        os.replace(f'{directory}/{SnapshotProvider.__header_file}.tmp',
+                   f'{directory}/{SnapshotProvider.__header_file}')
+
+    @staticmethod
+    def get_header():
+        """
+        Retrieves the JSON header of the snapshot.
+
+        :return: A dictionary of the labels of each axis
+        """
+
+        with open(f'{SnapshotProvider.__snapshot_directory}/{SnapshotProvider.__header_file}') as f:
+            return json.load(f)
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def get_comparisons():
+        """
+        Memory-maps the comparisons array.
+
+        :return: A read-only array of shape (dimensions, parameters, problems × 2, algorithms)
+        """
+
+        return np.load(f'{SnapshotProvider.__snapshot_directory}/{SnapshotProvider.__comparisons_file}',
+                       mmap_mode='r')
+
+    @staticmethod
+    @InstrumentationHandler.instrument()
+    def get_runs():
+        """
+        Memory-maps the runs array.
+
+        :return: A read-only array of shape (algorithms, problems, dimensions, parameters, runs)
+        """
+
+        return np.load(f'{SnapshotProvider.__snapshot_directory}/{SnapshotProvider.__runs_file}', mmap_mode='r')
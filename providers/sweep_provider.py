@@ -0,0 +1,186 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from helpers.progress_handler import ProgressHandler
+from models.sweep_results import SweepResults
+from providers.data_acquisition_provider import DataAcquisitionProvider
+from providers.data_manifest_provider import DataManifestProvider
+from providers.non_parametric_tests_provider import NonParametricTestsProvider
+
+
+class SweepProvider:
+    """
+    Static methods which run the whole analysis over every dimension and parameter, spread over a process pool.
+
+    Attributes
+    ----------
+        ANALYSES                    The analyses which can be swept, each one runs a NonParametricTestsProvider method
+
+    Methods
+    -------
+        initialize_worker(directory):
+            Points a spawned worker process to the assets of the parent process.
+        __run_analysis(analysis, dimension, parameter, alpha=0.05):
+            Runs a single analysis on a single slice.
+        run_slices(slices, analyses, alpha=0.05):
+            Runs the provided analyses on each provided slice.
+        __load_data(analyses):
+            Loads every slice (and the raw runs if needed) before the workers are forked, so they inherit them.
+        sweep(dimensions=None, parameters=None, analyses=None, alpha=0.05, workers=None, chunk_size=1):
+            Runs the provided analyses on every provided slice, one task per chunk of slices.
+    """
+
+    ANALYSES = ['best', 'friedman', 'wilcoxon', 'post_hoc', 'wtl_mannwhitneyu']
+
+    @staticmethod
+    def initialize_worker(directory):
+        """
+        Points a spawned worker process to the assets of the parent process.
+
+        Forked workers already inherit the loaded data, whereas spawned ones read it from the cached comparisons
+        (or the memory-mapped snapshot) on their first access.
+
+        :param str directory: Specify the directory from where to read the assets from
+        """
+
+        DataAcquisitionProvider.set_algorithms_raw_directory(directory)
+
+    @staticmethod
+    def __run_analysis(analysis, dimension, parameter, alpha=0.05):
+        """
+        Runs a single analysis on a single slice.
+
+        :param str analysis: Specify the analysis (must be within 'ANALYSES')
+        :param int dimension: Specify the desired dimension (must be within 'DataManifestProvider.DIMENSIONS')
+        :param int parameter: Specify the desired parameter (must be within 'DataManifestProvider.PARAMETERS')
+        :param float alpha: Specify the level of significance
+        :return: The result, as returned from its NonParametricTestsProvider method
+        """
+
+        if analysis == 'best':
+            return NonParametricTestsProvider.get_best_algorithm(dimension=dimension, parameter=parameter)
+        if analysis == 'friedman':
+            return NonParametricTestsProvider.friedman_test(dimension=dimension, parameter=parameter, alpha=alpha)
+        if analysis == 'wilcoxon':
+            return NonParametricTestsProvider.wilcoxon_test(dimension=dimension, parameter=parameter, alpha=alpha)
+        if analysis == 'post_hoc':
+            return NonParametricTestsProvider.get_post_hoc_tests(dimension=dimension, parameter=parameter, alpha=alpha)
+        if analysis == 'wtl_mannwhitneyu':
+            return NonParametricTestsProvider.get_algorithms_comparisons_wtl_mannwhitneyu(dimension=dimension,
+                                                                                          parameter=parameter,
+                                                                                          alpha=alpha)
+
+        raise ValueError('Invalid analysis value')
+
+    @staticmethod
+    def run_slices(slices, analyses, alpha=0.05):
+        """
+        Runs the provided analyses on each provided slice.
+
+        :param list slices: Specify the (dimension, parameter) tuples
+        :param list analyses: Specify the analyses (must be within 'ANALYSES')
+        :param float alpha: Specify the level of significance
+        :return: A list of (dimension, parameter, {analysis: result}) tuples, ordered as the slices
+        """
+
+        results = []
+
+        for dimension, parameter in slices:
+            result = {}
+            for analysis in analyses:
+                result[analysis] = SweepProvider.__run_analysis(analysis, dimension, parameter, alpha=alpha)
+            results.append((dimension, parameter, result))
+
+        return results
+
+    @staticmethod
+    def __load_data(analyses):
+        """
+        Loads every slice (and the raw runs if needed) before the workers are forked, so they inherit them.
+
+        :param list analyses: Specify the analyses to be run
+        """
+
+        comparisons = DataAcquisitionProvider.get_algorithms_comparisons()
+
+        for dimension in comparisons:
+            for parameter in comparisons[dimension]:
+                comparisons.get_slice(dimension, parameter)
+
+        if 'wtl_mannwhitneyu' in analyses:
+            DataAcquisitionProvider.get_algorithms_cube()
+
+    @staticmethod
+    def sweep(dimensions=None, parameters=None, analyses=None, alpha=0.05, workers=None, chunk_size=1):
+        """
+        Runs the provided analyses on every provided slice, one task per chunk of slices.
+
+        The data is loaded once in the parent process, then shared with the forked workers, instead of having each
+        worker re-read the assets.
+
+        :param list dimensions: Specify the desired dimensions, default is 'DataManifestProvider.DIMENSIONS'
+        :param list parameters: Specify the desired parameters, default is 'DataManifestProvider.PARAMETERS'
+        :param list analyses: Specify the desired analyses (must be within 'ANALYSES'), default is every analysis
+        :param float alpha: Specify the level of significance
+        :param int workers: Specify the number of processes, None uses every available core, 1 runs serially
+        :param int chunk_size: Specify the number of slices handed to a worker at once
+        :return: A SweepResults
+        """
+
+        dimensions = list(DataManifestProvider.DIMENSIONS if dimensions is None else dimensions)
+        parameters = list(DataManifestProvider.PARAMETERS if parameters is None else parameters)
+        analyses = list(SweepProvider.ANALYSES if analyses is None else analyses)
+
+        for dimension in dimensions:
+            if dimension not in DataManifestProvider.DIMENSIONS:
+                raise ValueError('Invalid dimension value')
+        for parameter in parameters:
+            if parameter not in DataManifestProvider.PARAMETERS:
+                raise ValueError('Invalid parameter value')
+        for analysis in analyses:
+            if analysis not in SweepProvider.ANALYSES:
+                raise ValueError('Invalid analysis value')
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError('workers must be a positive integer')
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError('chunk_size must be a positive integer')
+
+        slices = [(int(dimension), int(parameter)) for dimension in dimensions for parameter in parameters]
+        chunks = [slices[start:start + chunk_size] for start in range(0, len(slices), chunk_size)]
+
+        run = partial(SweepProvider.run_slices, analyses=analyses, alpha=alpha)
+        workers = min(workers, len(chunks))
+
+        SweepProvider.__load_data(analyses)
+
+        results = {}
+        print('Sweeping through dimensions and parameters...')
+
+        with ProgressHandler.track(len(slices), description='Sweeping slices') as progress:
+            if workers <= 1:
+                for chunk in chunks:
+                    for dimension, parameter, result in run(chunk):
+                        results[(dimension, parameter)] = result
+                    progress.update(len(chunk))
+            else:
+                # Forked workers inherit the loaded data, spawned ones are pointed to the same assets
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+
+                directory = DataAcquisitionProvider.get_algorithms_raw_directory()
+
+                with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                         initializer=SweepProvider.initialize_worker,
+                                         initargs=(directory,)) as executor:
+                    for chunk_results in executor.map(run, chunks):
+                        for dimension, parameter, result in chunk_results:
+                            results[(dimension, parameter)] = result
+                        progress.update(len(chunk_results))
+
+        return SweepResults(results, analyses, dimensions, parameters)
@@ -0,0 +1,129 @@
+import contextlib
+import os
+
+import numpy as np
+import pytest
+
+from benchmarks.synthetic_tree_generator import SyntheticTreeGenerator
+from helpers.progress_handler import ProgressHandler
+from providers.data_acquisition_provider import DataAcquisitionProvider
+from providers.data_manifest_provider import DataManifestProvider
+
+DIMENSIONS = [10]
+PROBLEMS = 30
+RUNS = 5
+
+
+def write_algorithm(directory, algorithm, get_values):
+    """
+    Writes the raw txt files of an algorithm, laid out as the synthetic tree.
+
+    :param str directory: Specify the directory of the algorithm directories
+    :param str algorithm: Specify the name of the algorithm
+    :param get_values: Specify the function returning the (parameters, runs) array of a problem and a dimension
+    """
+
+    os.makedirs(f'{directory}/{algorithm}', exist_ok=True)
+
+    for problem in range(1, PROBLEMS + 1):
+        for dimension in DIMENSIONS:
+            np.savetxt(f'{directory}/{algorithm}/{algorithm}_{problem}_{dimension}.txt',
+                       get_values(problem, dimension), fmt='%g', delimiter='\t')
+
+
+def read_algorithm(directory, algorithm, problem, dimension):
+    """
+    Reads back a raw txt file of an algorithm.
+
+    :return: A (parameters, runs) array
+    """
+
+    return np.loadtxt(f'{directory}/{algorithm}/{algorithm}_{problem}_{dimension}.txt', ndmin=2)
+
+
+@pytest.fixture(scope='session')
+def synthetic_directory(tmp_path_factory):
+    """
+    Writes a small synthetic tree, along with algorithms crafted to hold zero and tied differences.
+
+    SYN-COPY duplicates SYN-001 (every difference is zero), SYN-HALF matches SYN-001 on the odd problems and SYN-002 on
+    the even ones (some differences are zero), and SYN-ONE and SYN-TWO hold constant runs (every difference is tied).
+
+    :return: The directory of the algorithm directories
+    """
+
+    directory = str(tmp_path_factory.mktemp('workspace') / 'assets' / 'algorithms')
+
+    SyntheticTreeGenerator.generate(directory, algorithms=6, problems=PROBLEMS, dimensions=DIMENSIONS, runs=RUNS,
+                                    seed=0)
+
+    shape = (len(DataManifestProvider.PARAMETERS), RUNS)
+
+    write_algorithm(directory, 'SYN-COPY',
+                    lambda problem, dimension: read_algorithm(directory, 'SYN-001', problem, dimension))
+    write_algorithm(directory, 'SYN-HALF',
+                    lambda problem, dimension: read_algorithm(directory, 'SYN-001' if problem % 2 else 'SYN-002',
+                                                              problem, dimension))
+    write_algorithm(directory, 'SYN-ONE', lambda problem, dimension: np.full(shape, 1.))
+    write_algorithm(directory, 'SYN-TWO', lambda problem, dimension: np.full(shape, 2.))
+
+    return directory
+
+
+@contextlib.contextmanager
+def use_tree(directory, workspace):
+    """
+    Points the providers to a tree, from the provided workspace, since cached instances are stored relatively to the
+    working directory. The providers are pointed back to the assets once the block is over.
+
+    :param str directory: Specify the directory of the algorithm directories
+    :param str workspace: Specify the working directory
+    """
+
+    current_directory = os.getcwd()
+    raw_directory = DataAcquisitionProvider.get_algorithms_raw_directory()
+    quiet = ProgressHandler.is_quiet()
+
+    os.chdir(workspace)
+
+    DataAcquisitionProvider.set_algorithms_raw_directory(directory)
+    DataAcquisitionProvider.set_workers(1)
+    DataAcquisitionProvider.reset()
+    ProgressHandler.set_quiet()
+
+    try:
+        yield
+    finally:
+        os.chdir(current_directory)
+
+        ProgressHandler.set_quiet(quiet)
+        DataAcquisitionProvider.set_workers(1)
+        DataAcquisitionProvider.set_algorithms_raw_directory(raw_directory)
+        DataAcquisitionProvider.reset()
+
+
+@pytest.fixture
+def synthetic_tree(synthetic_directory):
+    """
+    Points the providers to the synthetic tree and caches its comparisons, within the tree's workspace.
+
+    :return: The directory of the algorithm directories
+    """
+
+    with use_tree(synthetic_directory, os.path.dirname(os.path.dirname(synthetic_directory))):
+        DataAcquisitionProvider.cache_algorithms_comparisons()
+
+        yield synthetic_directory
+
+
+@pytest.fixture
+def uncached_synthetic_tree(synthetic_directory, tmp_path):
+    """
+    Points the providers to the synthetic tree from an empty workspace, hence nothing is cached and every store is
+    read from the raw txt files.
+
+    :return: The directory of the algorithm directories
+    """
+
+    with use_tree(synthetic_directory, str(tmp_path)):
+        yield synthetic_directory
@@ -0,0 +1,41 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import cli
+from cli import CommandLineInterface
+
+# The budget and the attempts are those of the startup subcommand, by default
+STARTUP_ARGUMENTS = CommandLineInterface.get_parser().parse_args(['startup'])
+
+
+@pytest.fixture(scope='module')
+def startup_timing():
+    """
+    Times the startup of the table subcommands in fresh interpreters, as the startup subcommand does.
+
+    :return: The timings of the best attempt, a dictionary of the 'parser' and 'tables' seconds and the
+             'heavy_modules' imported at startup
+    """
+
+    timings = []
+
+    for _ in range(STARTUP_ARGUMENTS.repeat):
+        output = subprocess.run([sys.executable, '-c', CommandLineInterface._CommandLineInterface__startup_script],
+                                cwd=os.path.dirname(os.path.abspath(cli.__file__)),
+                                capture_output=True, text=True, check=True).stdout
+
+        timings.append(json.loads(output.strip().splitlines()[-1]))
+
+    return min(timings, key=lambda timing: timing['parser'] + timing['tables'])
+
+
+def test_startup_within_budget(startup_timing):
+    assert startup_timing['parser'] + startup_timing['tables'] <= STARTUP_ARGUMENTS.budget
+
+
+def test_startup_imports_no_heavy_module(startup_timing):
+    assert startup_timing['heavy_modules'] == []
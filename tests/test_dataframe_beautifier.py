@@ -0,0 +1,76 @@
+import contextlib
+import csv
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from helpers.dataframe_beautifier import DataframeBeautifier
+
+
+def get_console_cells(dataframe, **kwargs):
+    """
+    Prints a dataframe to the console stream and parses the cells of its grid back.
+
+    :param pd.DataFrame dataframe: Specify the dataframe
+    :return: A list of rows, each one a list of the row label followed by the formatted cells
+    """
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        DataframeBeautifier.print_console_stream(dataframe, **kwargs)
+
+    lines = [line for line in output.getvalue().splitlines() if line.startswith('│')]
+
+    # The first line of cells holds the headers
+    return [[cell.strip() for cell in line.strip('│').split('│')] for line in lines[1:]]
+
+
+def get_csv_cells(dataframe, **kwargs):
+    """
+    Writes a dataframe as CSV and reads its cells back.
+
+    :param pd.DataFrame dataframe: Specify the dataframe
+    :return: A list of rows, each one a list of the row label followed by the formatted cells
+    """
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        DataframeBeautifier.write_csv(dataframe, **kwargs)
+
+    return list(csv.reader(io.StringIO(output.getvalue())))[1:]
+
+
+@pytest.fixture
+def dataframe():
+    return pd.DataFrame({'a': [1.23456, 2.5, 3.1],
+                         'b': ['4.5 (w)', '0.001 (l)', '7 (t)'],
+                         'c': [100000., np.nan, 0.5]},
+                        index=['x', 'y', 'z'])
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 4096])
+@pytest.mark.parametrize('options', [{'apply_scientific_notation_to_all_columns': True},
+                                     {'apply_scientific_notation_to_all_columns': False},
+                                     {'apply_scientific_notation_to_all_columns': False,
+                                      'floating_scientific_notation_columns': ['a']},
+                                     {'apply_scientific_notation_to_all_columns': False,
+                                      'floating_scientific_notation_rows': ['y']},
+                                     {'apply_scientific_notation_to_all_columns': False,
+                                      'floating_scientific_notation_columns': ['b'],
+                                      'floating_scientific_notation_rows': ['y']}])
+@pytest.mark.parametrize('transpose', [False, True])
+def test_write_csv_matches_console(dataframe, options, transpose, chunk_size):
+    expected = get_console_cells(dataframe, transpose=transpose, **options)
+    actual = get_csv_cells(dataframe, transpose=transpose, chunk_size=chunk_size, **options)
+
+    assert actual == expected
+
+
+def test_write_csv_transposed_selects_original_columns(dataframe):
+    cells = get_csv_cells(dataframe, apply_scientific_notation_to_all_columns=False,
+                          floating_scientific_notation_columns=['a'], transpose=True)
+
+    assert cells[0] == ['a', '1.2346e+00', '2.5000e+00', '3.1000e+00']
+    assert cells[1] == ['b', '4.5 (w)', '0.001 (l)', '7 (t)']
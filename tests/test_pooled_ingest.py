@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from providers.data_acquisition_provider import DataAcquisitionProvider
+
+
+def ingest(workers):
+    """
+    Reads the raw txt files from scratch with the provided number of processes.
+
+    :param int workers: Specify the number of processes
+    :return: A tuple of the raw dataframes and the run cube
+    """
+
+    DataAcquisitionProvider.set_workers(workers)
+    DataAcquisitionProvider.reset()
+
+    return DataAcquisitionProvider.get_algorithms_raw(), DataAcquisitionProvider.get_algorithms_cube()
+
+
+def test_pooled_ingest_matches_serial_ingest(uncached_synthetic_tree):
+    serial_raw, serial_cube = ingest(1)
+    pooled_raw, pooled_cube = ingest(2)
+
+    assert pooled_cube.algorithms == serial_cube.algorithms
+    assert pooled_cube.problems == serial_cube.problems
+    assert pooled_cube.dimensions == serial_cube.dimensions
+    assert pooled_cube.parameters == serial_cube.parameters
+    assert pooled_cube.values.dtype == serial_cube.values.dtype
+    np.testing.assert_array_equal(pooled_cube.values, serial_cube.values)
+
+    assert list(pooled_raw) == list(serial_raw)
+
+    for algorithm in serial_raw:
+        assert list(pooled_raw[algorithm]) == list(serial_raw[algorithm])
+
+        for problem in serial_raw[algorithm]:
+            assert list(pooled_raw[algorithm][problem]) == list(serial_raw[algorithm][problem])
+
+            for dimension in serial_raw[algorithm][problem]:
+                pd.testing.assert_frame_equal(pooled_raw[algorithm][problem][dimension],
+                                              serial_raw[algorithm][problem][dimension], check_exact=True)
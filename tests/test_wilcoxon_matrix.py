@@ -0,0 +1,64 @@
+import warnings
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from providers.data_acquisition_provider import DataAcquisitionProvider
+from providers.non_parametric_tests_provider import NonParametricTestsProvider
+
+
+def get_scipy_results(means):
+    """
+    Tests every pair of algorithms one at a time with scipy.
+
+    :param pd.DataFrame means: Specify the mean of each algorithm for each problem
+    :return: A tuple of the (algorithms, algorithms) statistics and p-values, NaN on the diagonal and where scipy
+             rejects the pair (every difference is zero)
+    """
+
+    k = len(means.columns)
+    statistics = np.full((k, k), np.nan)
+    p_values = np.full((k, k), np.nan)
+
+    for i in range(k):
+        for j in range(k):
+            if i == j:
+                continue
+
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore')
+                    result = stats.wilcoxon(means.iloc[:, i], means.iloc[:, j])
+            except ValueError:
+                continue
+
+            statistics[i, j], p_values[i, j] = result.statistic, result.pvalue
+
+    return statistics, p_values
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 4096])
+def test_wilcoxon_matrix_matches_scipy(synthetic_tree, chunk_size):
+    means = DataAcquisitionProvider.get_algorithms_means(dimension=10, parameter=0)
+    matrix = NonParametricTestsProvider.get_wilcoxon_matrix(dimension=10, parameter=0, chunk_size=chunk_size)
+
+    # The pairs do not fill the chunks evenly, hence the last chunk is a partial one
+    assert (len(means.columns) * (len(means.columns) - 1) // 2) % 7 != 0
+    assert matrix.algorithms == means.columns.to_list()
+
+    statistics, p_values = get_scipy_results(means)
+
+    np.testing.assert_allclose(matrix.statistics, statistics, rtol=0, atol=1e-9, equal_nan=True)
+    np.testing.assert_allclose(matrix.p_values, p_values, rtol=1e-9, atol=1e-12, equal_nan=True)
+
+
+def test_wilcoxon_matrix_matches_wilcoxon_test(synthetic_tree):
+    matrix = NonParametricTestsProvider.get_wilcoxon_matrix(dimension=10, parameter=0, chunk_size=7)
+
+    for algorithm in ['SYN-001', 'SYN-ONE']:
+        expected = NonParametricTestsProvider.wilcoxon_test(dimension=10, parameter=0, algorithm_to_compare=algorithm)
+        comparison = matrix.get_comparison(algorithm)
+
+        np.testing.assert_allclose(comparison['P-Value'].astype(float), expected['P-Value'].astype(float),
+                                   equal_nan=True)
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from providers.data_acquisition_provider import DataAcquisitionProvider
+from providers.non_parametric_tests_provider import NonParametricTestsProvider
+
+
+def get_looped_table(directory, dimension, parameter, alpha):
+    """
+    Builds the w/t/l table one cell at a time, testing each algorithm's raw runs against the best algorithm's with
+    scipy, as the table was built before it was batched.
+
+    :param str directory: Specify the directory of the algorithm directories
+    :return: A dataframe of the annotated means along with the w/t/l footer
+    """
+
+    df = DataAcquisitionProvider.get_algorithms_means(dimension=dimension, parameter=parameter).astype('str')
+    df.index.name = 'Algorithm'
+
+    best_algorithm = NonParametricTestsProvider.get_best_algorithm(dimension=dimension, parameter=parameter)
+
+    def get_runs(algorithm, problem):
+        path = f'{directory}/{algorithm}/{algorithm}_{problem}_{dimension}.txt'
+        return np.loadtxt(path, ndmin=2)[parameter]
+
+    table = df.copy()
+    results = {algorithm: [0, 0, 0] for algorithm in df.columns}
+
+    for problem, row in df.iterrows():
+        for algorithm, value in row.items():
+            runs = get_runs(algorithm, problem)
+            best_runs = get_runs(best_algorithm, problem)
+
+            p_value = 1 if np.array_equal(runs, best_runs) else stats.mannwhitneyu(best_runs, runs)[1]
+
+            if p_value < alpha:
+                outcome = 0 if value < row[best_algorithm] else 2
+            else:
+                outcome = 1
+
+            table.at[problem, algorithm] = value + [' (w)', ' (t)', ' (l)'][outcome]
+            results[algorithm][outcome] += 1
+
+    footer = pd.DataFrame({'w/t/l': [f'{win}/{tie}/{lose}' for win, tie, lose in results.values()]},
+                          index=df.columns).T
+
+    return pd.concat([table, footer])
+
+
+@pytest.mark.parametrize('parameter', [0, 13])
+@pytest.mark.parametrize('alpha', [0.05, 0.5])
+def test_wtl_mannwhitneyu_matches_looped_table(synthetic_tree, parameter, alpha):
+    expected = get_looped_table(synthetic_tree, dimension=10, parameter=parameter, alpha=alpha)
+    actual = NonParametricTestsProvider.get_algorithms_comparisons_wtl_mannwhitneyu(dimension=10, parameter=parameter,
+                                                                                    alpha=alpha)
+
+    pd.testing.assert_frame_equal(actual, expected, check_index_type=False)